@@ -5,8 +5,7 @@ Interactive web application for construction schedule delay analysis
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-import tempfile
-import os
+import hashlib
 
 # Import analyzers
 from src.analyzers import (
@@ -15,16 +14,28 @@ from src.analyzers import (
     DelayAnalysisResult
 )
 
-# Import parsers
-from src.parsers.p6_parser import P6Parser, parse_xer_file
-from src.parsers.msp_parser import MSProjectParser, parse_msp_file
-
 # Import utilities
 from src.utils.schedule_utils import Schedule
 
-# Import exporters and visualizers
-from src.exporters.excel_exporter import ExcelExporter
-from src.visualizers.gantt_visualizer import GanttVisualizer
+# Parsers, exporters and visualizers are imported where they are first used
+# so the app can render its first page without loading them
+
+# Midnight, used to turn date inputs into datetimes
+_MIN_TIME = datetime.min.time()
+
+# Hash uploads in 1 MB chunks instead of materializing them in memory
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Hash schedules by their cached fingerprint rather than their full contents
+_SCHEDULE_HASH_FUNCS = {Schedule: lambda schedule: schedule.fingerprint}
+
+# Sidebar banner, inlined so reruns never fetch an image over the network
+_SIDEBAR_LOGO = """
+<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 300 100" width="100%" role="img" aria-label="Delay Analysis">
+  <rect width="300" height="100" fill="#1f77b4"/>
+  <text x="150" y="58" fill="#ffffff" font-family="sans-serif" font-size="26" text-anchor="middle">Delay Analysis</text>
+</svg>
+"""
 
 # Page configuration
 st.set_page_config(
@@ -89,28 +100,99 @@ def init_session_state():
 
 def parse_uploaded_file(uploaded_file, file_type: str) -> Schedule:
     """Parse uploaded schedule file"""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=uploaded_file.name) as tmp_file:
-        tmp_file.write(uploaded_file.getvalue())
-        tmp_path = tmp_file.name
+    digest = hashlib.sha256()
+    uploaded_file.seek(0)
+    for chunk in iter(lambda: uploaded_file.read(UPLOAD_CHUNK_SIZE), b''):
+        digest.update(chunk)
+
+    return _parse_upload(digest.hexdigest(), file_type, uploaded_file)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _parse_upload(file_digest: str, file_type: str, _uploaded_file) -> Schedule:
+    """Parse an uploaded schedule (cached on the content digest across reruns)"""
+    _uploaded_file.seek(0)
+
+    if file_type == 'xer':
+        from src.parsers.p6_parser import P6Parser
+        parser = P6Parser()
+    else:  # xml or mpp
+        from src.parsers.msp_parser import MSProjectParser
+        parser = MSProjectParser()
+
+    # Parsers read the upload stream directly, no temporary file on disk
+    return parser.parse(_uploaded_file)
+
+
+@st.cache_data(show_spinner=False)
+def _get_methods_by_name() -> dict:
+    """Available analysis methods keyed by name (static, computed once)"""
+    return {m['name']: m for m in get_available_methods()}
+
+
+@st.cache_resource
+def _get_visualizer():
+    """Shared Gantt visualizer (stateless, built once per server process)"""
+    from src.visualizers.gantt_visualizer import GanttVisualizer
+    return GanttVisualizer()
+
+
+@st.cache_resource
+def _get_exporter():
+    """Shared Excel exporter (stateless, built once per server process)"""
+    from src.exporters.excel_exporter import ExcelExporter
+    return ExcelExporter()
+
+
+@st.cache_resource
+def _get_analyzer(method_name: str):
+    """Shared analyzer instance for the given method name"""
+    return create_analyzer(method_name)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_SCHEDULE_HASH_FUNCS)
+def _build_gantt(schedule: Schedule, title: str, show_critical: bool, max_activities: int):
+    """Gantt figure for a schedule, cached on the display parameters"""
+    return _get_visualizer().create_gantt(
+        schedule,
+        title=title,
+        show_critical_only=show_critical,
+        max_activities=max_activities
+    )
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_SCHEDULE_HASH_FUNCS)
+def _build_comparison_gantt(baseline: Schedule, current: Schedule):
+    """Baseline vs current comparison figure, cached on the schedule pair"""
+    return _get_visualizer().create_comparison_gantt(baseline, current)
+
+
+@st.cache_data(show_spinner=False)
+def _build_delay_timeline(delays_by_activity: tuple, title: str):
+    """Delay timeline figure, cached on the activity delays"""
+    return _get_visualizer().create_delay_timeline(delays_by_activity, title=title)
+
 
-    try:
-        if file_type == 'xer':
-            parser = P6Parser()
-            schedule = parser.parse(tmp_path)
-        else:  # xml or mpp
-            parser = MSProjectParser()
-            schedule = parser.parse(tmp_path)
+@st.cache_data(show_spinner=False, max_entries=4,
+               hash_funcs={DelayAnalysisResult: lambda result: result.fingerprint})
+def _excel_bytes(result: DelayAnalysisResult, include_charts: bool) -> bytes:
+    """Excel report bytes, cached on the result fingerprint and chart option"""
+    return _get_exporter().export_to_bytes(result, include_charts)
 
-        return schedule
-    finally:
-        os.unlink(tmp_path)
+
+@st.cache_data(show_spinner=False)
+def _cause_frame(cause_items: tuple) -> pd.DataFrame:
+    """Delay days per cause, sorted in descending order for the bar chart"""
+    items = sorted(cause_items, key=lambda x: x[1], reverse=True)
+    causes, days = zip(*items) if items else ((), ())
+    return pd.DataFrame({'Jours': list(days)}, index=pd.Index(list(causes), name='Cause'))
 
 
 def display_schedule_summary(schedule: Schedule, title: str):
     """Display schedule summary"""
     st.markdown(f'<div class="sub-header">{title}</div>', unsafe_allow_html=True)
 
-    stats = schedule.get_summary_stats()
+    stats = schedule.summary_stats
 
     col1, col2, col3, col4 = st.columns(4)
 
@@ -142,8 +224,7 @@ def main():
 
     # Sidebar
     with st.sidebar:
-        st.image("https://via.placeholder.com/300x100/1f77b4/ffffff?text=Delay+Analysis",
-                use_column_width=True)
+        st.markdown(_SIDEBAR_LOGO, unsafe_allow_html=True)
 
         st.markdown("### 📂 Navigation")
         page = st.radio(
@@ -191,7 +272,7 @@ def show_home_page():
     ### Méthodes d'analyse disponibles
     """)
 
-    methods = get_available_methods()
+    methods = _get_methods_by_name().values()
 
     for i, method in enumerate(methods, 1):
         with st.expander(f"{i}. {method['name']}"):
@@ -231,8 +312,7 @@ def show_upload_page():
 
                     # Show sample activities
                     if st.checkbox("Afficher les activités", key='show_baseline_activities'):
-                        df = schedule.to_dataframe()
-                        st.dataframe(df.head(20))
+                        st.dataframe(schedule.head_dataframe(20))
 
                 except Exception as e:
                     st.error(f"Erreur lors du parsing: {str(e)}")
@@ -260,8 +340,7 @@ def show_upload_page():
                     display_schedule_summary(schedule, "Résumé du Planning Actuel")
 
                     if st.checkbox("Afficher les activités", key='show_current_activities'):
-                        df = schedule.to_dataframe()
-                        st.dataframe(df.head(20))
+                        st.dataframe(schedule.head_dataframe(20))
 
                 except Exception as e:
                     st.error(f"Erreur lors du parsing: {str(e)}")
@@ -277,8 +356,8 @@ def show_analysis_page():
         return
 
     # Select analysis method
-    methods = get_available_methods()
-    method_names = [m['name'] for m in methods]
+    methods_by_name = _get_methods_by_name()
+    method_names = list(methods_by_name)
 
     selected_method = st.selectbox(
         "Choisissez une méthode d'analyse:",
@@ -287,11 +366,11 @@ def show_analysis_page():
     )
 
     # Show method description
-    method_info = next(m for m in methods if m['name'] == selected_method)
+    method_info = methods_by_name[selected_method]
     st.info(f"ℹ️ {method_info['description']}")
 
     # Create analyzer
-    analyzer = create_analyzer(selected_method)
+    analyzer = _get_analyzer(selected_method)
 
     # Get analyzer questions
     questions = analyzer.get_questions()
@@ -309,25 +388,31 @@ def show_analysis_page():
             return
         user_inputs['current_schedule'] = st.session_state.current_schedule
 
-    # Ask questions
-    for question in questions:
-        key = question['key']
-        q_text = question['question']
-        q_type = question['type']
-        help_text = question.get('help', '')
+    # Ask questions (inside a form so that only the submit button triggers a rerun)
+    with st.form('analysis_form'):
+        for question in questions:
+            key = question['key']
+            q_text = question['question']
+            q_type = question['type']
+            help_text = question.get('help', '')
+
+            if q_type == 'select':
+                value = st.selectbox(q_text, question['options'], help=help_text)
+                user_inputs[key] = (value == 'Yes') if value in ['Yes', 'No'] else value
 
-        if q_type == 'select':
-            value = st.selectbox(q_text, question['options'], help=help_text)
-            user_inputs[key] = (value == 'Yes') if value in ['Yes', 'No'] else value
+            elif q_type == 'number':
+                value = st.number_input(q_text, value=question.get('default', 30), help=help_text)
+                user_inputs[key] = value
 
-        elif q_type == 'number':
-            value = st.number_input(q_text, value=question.get('default', 30), help=help_text)
-            user_inputs[key] = value
+            elif q_type == 'date':
+                value = st.date_input(q_text, help=help_text)
+                if value:
+                    user_inputs[key] = datetime.combine(value, _MIN_TIME)
 
-        elif q_type == 'date':
-            value = st.date_input(q_text, help=help_text)
-            if value:
-                user_inputs[key] = datetime.combine(value, datetime.min.time())
+        submitted = st.form_submit_button("🚀 Lancer l'analyse", type="primary")
+
+    if not submitted:
+        return
 
     # Get suggestions
     st.markdown("#### 💡 Suggestions")
@@ -340,110 +425,68 @@ def show_analysis_page():
         st.info("Aucune suggestion pour le moment")
 
     # Run analysis
-    if st.button("🚀 Lancer l'analyse", type="primary"):
-        with st.spinner("Analyse en cours..."):
-            try:
-                result = analyzer.analyze(**user_inputs)
-                st.session_state.analysis_result = result
-
-                st.markdown('<div class="success-box">✓ Analyse terminée avec succès!</div>',
-                           unsafe_allow_html=True)
+    with st.spinner("Analyse en cours..."):
+        try:
+            result = analyzer.analyze(**user_inputs)
+            st.session_state.analysis_result = result
 
-                # Show summary
-                st.markdown("### Résultats de l'analyse")
+            st.markdown('<div class="success-box">✓ Analyse terminée avec succès!</div>',
+                       unsafe_allow_html=True)
 
-                col1, col2, col3, col4 = st.columns(4)
+            # Show summary
+            st.markdown("### Résultats de l'analyse")
 
-                with col1:
-                    st.metric("Retard Total", f"{result.total_delay_days:.1f} jours")
-                with col2:
-                    st.metric("Retard Critique", f"{result.critical_delay_days:.1f} jours")
-                with col3:
-                    st.metric("Activités Affectées", len(result.delays_by_activity))
-                with col4:
-                    critical_count = len([d for d in result.delays_by_activity if d['is_critical']])
-                    st.metric("Activités Critiques", critical_count)
+            col1, col2, col3, col4 = st.columns(4)
 
-                # Show summary text
-                with st.expander("📝 Résumé détaillé"):
-                    st.text(result.summary)
+            with col1:
+                st.metric("Retard Total", f"{result.total_delay_days:.1f} jours")
+            with col2:
+                st.metric("Retard Critique", f"{result.critical_delay_days:.1f} jours")
+            with col3:
+                st.metric("Activités Affectées", result.delay_count)
+            with col4:
+                st.metric("Activités Critiques", result.critical_activity_count)
 
-                # Show recommendations
-                if result.recommendations:
-                    st.markdown("### 📋 Recommandations")
-                    for i, rec in enumerate(result.recommendations, 1):
-                        st.markdown(f"{i}. {rec}")
+            # Show summary text
+            with st.expander("📝 Résumé détaillé"):
+                st.text(result.summary)
 
-                # Show delays by cause
-                if result.delays_by_cause:
-                    st.markdown("### 📊 Retards par Cause")
+            # Show recommendations
+            if result.recommendations:
+                st.markdown("### 📋 Recommandations")
+                for i, rec in enumerate(result.recommendations, 1):
+                    st.markdown(f"{i}. {rec}")
 
-                    cause_df = pd.DataFrame([
-                        {'Cause': cause, 'Jours': days}
-                        for cause, days in sorted(result.delays_by_cause.items(),
-                                                 key=lambda x: x[1], reverse=True)
-                    ])
+            # Show delays by cause
+            if result.delays_by_cause:
+                st.markdown("### 📊 Retards par Cause")
 
-                    st.bar_chart(cause_df.set_index('Cause'))
+                st.bar_chart(_cause_frame(tuple(result.delays_by_cause.items())))
 
-            except Exception as e:
-                st.error(f"Erreur lors de l'analyse: {str(e)}")
-                st.exception(e)
+        except Exception as e:
+            st.error(f"Erreur lors de l'analyse: {str(e)}")
+            st.exception(e)
 
 
 def show_visualizations_page():
     """Show visualizations page"""
     st.markdown('<div class="sub-header">Visualisations</div>', unsafe_allow_html=True)
 
-    viz = GanttVisualizer()
-
     tab1, tab2, tab3 = st.tabs(["📊 Gantt Baseline", "📊 Gantt Actuel", "📊 Comparaison"])
 
     with tab1:
-        if st.session_state.baseline_schedule:
-            st.markdown("#### Diagramme de Gantt - Planning Baseline")
-
-            show_critical = st.checkbox("Afficher uniquement le chemin critique",
-                                       key='baseline_critical')
-            max_act = st.slider("Nombre max d'activités", 10, 100, 50,
-                               key='baseline_max')
-
-            fig = viz.create_gantt(
-                st.session_state.baseline_schedule,
-                title="Planning Baseline",
-                show_critical_only=show_critical,
-                max_activities=max_act
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Veuillez d'abord uploader un planning baseline")
+        _schedule_gantt_fragment('baseline_schedule', "Planning Baseline", 'baseline',
+                                 "Veuillez d'abord uploader un planning baseline")
 
     with tab2:
-        if st.session_state.current_schedule:
-            st.markdown("#### Diagramme de Gantt - Planning Actuel")
-
-            show_critical = st.checkbox("Afficher uniquement le chemin critique",
-                                       key='current_critical')
-            max_act = st.slider("Nombre max d'activités", 10, 100, 50,
-                               key='current_max')
-
-            fig = viz.create_gantt(
-                st.session_state.current_schedule,
-                title="Planning Actuel",
-                show_critical_only=show_critical,
-                max_activities=max_act
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Veuillez d'abord uploader un planning actuel")
+        _schedule_gantt_fragment('current_schedule', "Planning Actuel", 'current',
+                                 "Veuillez d'abord uploader un planning actuel")
 
     with tab3:
         if st.session_state.baseline_schedule and st.session_state.current_schedule:
             st.markdown("#### Comparaison Baseline vs Actuel")
 
-            fig = viz.create_comparison_gantt(
+            fig = _build_comparison_gantt(
                 st.session_state.baseline_schedule,
                 st.session_state.current_schedule
             )
@@ -456,14 +499,34 @@ def show_visualizations_page():
     if st.session_state.analysis_result:
         st.markdown("### ⏱️ Timeline des Retards")
 
-        fig = viz.create_delay_timeline(
+        fig = _build_delay_timeline(
             st.session_state.analysis_result.delays_by_activity,
-            title="Timeline des Retards"
+            "Timeline des Retards"
         )
 
         st.plotly_chart(fig, use_container_width=True)
 
 
+@st.fragment
+def _schedule_gantt_fragment(state_key: str, title: str, key_prefix: str, missing_message: str):
+    """Gantt tab body; its widgets only rerun this fragment, not the whole page"""
+    schedule = st.session_state[state_key]
+    if not schedule:
+        st.info(missing_message)
+        return
+
+    st.markdown(f"#### Diagramme de Gantt - {title}")
+
+    show_critical = st.checkbox("Afficher uniquement le chemin critique",
+                               key=f'{key_prefix}_critical')
+    max_act = st.slider("Nombre max d'activités", 10, 100, 50,
+                       key=f'{key_prefix}_max')
+
+    fig = _build_gantt(schedule, title, show_critical, max_act)
+
+    st.plotly_chart(fig, use_container_width=True)
+
+
 def show_export_page():
     """Show export page"""
     st.markdown('<div class="sub-header">Export des Résultats</div>', unsafe_allow_html=True)
@@ -482,8 +545,7 @@ def show_export_page():
     if st.button("📥 Télécharger le rapport Excel", type="primary"):
         with st.spinner("Génération du rapport..."):
             try:
-                exporter = ExcelExporter()
-                excel_bytes = exporter.export_to_bytes(result, include_charts)
+                excel_bytes = _excel_bytes(result, include_charts)
 
                 st.download_button(
                     label="💾 Télécharger",
@@ -500,11 +562,7 @@ def show_export_page():
     # Preview
     if st.checkbox("Prévisualiser les données"):
         st.markdown("### Aperçu des retards")
-        if not result.detailed_report.empty:
-            st.dataframe(result.detailed_report)
-        else:
-            df = pd.DataFrame(result.delays_by_activity)
-            st.dataframe(df)
+        st.dataframe(result.delays_arrow)
 
 
 if __name__ == "__main__":
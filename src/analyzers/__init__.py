@@ -11,12 +11,20 @@ from .base_analyzer import (
     DelayAnalyzerFactory
 )
 
-from .as_planned_vs_as_built import AsPlannedVsAsBuiltAnalyzer
-from .impacted_as_planned import ImpactedAsPlannedAnalyzer
-from .collapsed_as_built import CollapsedAsBuiltAnalyzer
-from .time_impact_analysis import TimeImpactAnalyzer
-from .windows_analysis import WindowsAnalyzer
-from .contemporaneous_analysis import ContemporaneousAnalyzer
+import importlib
+
+# Analysis method name -> (module, class). Modules are imported on first use
+# so that importing this package does not load every analyzer up front.
+_REGISTRY = {
+    'As-Planned vs As-Built': ('.as_planned_vs_as_built', 'AsPlannedVsAsBuiltAnalyzer'),
+    'Impacted As-Planned': ('.impacted_as_planned', 'ImpactedAsPlannedAnalyzer'),
+    'Collapsed As-Built (But-For)': ('.collapsed_as_built', 'CollapsedAsBuiltAnalyzer'),
+    'Time Impact Analysis (TIA)': ('.time_impact_analysis', 'TimeImpactAnalyzer'),
+    'Windows Analysis': ('.windows_analysis', 'WindowsAnalyzer'),
+    'Contemporaneous Period Analysis': ('.contemporaneous_analysis', 'ContemporaneousAnalyzer'),
+}
+
+_CLASS_MODULES = {class_name: module for module, class_name in _REGISTRY.values()}
 
 __all__ = [
     'BaseDelayAnalyzer',
@@ -31,6 +39,26 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str):
+    """Import analyzer classes lazily on attribute access"""
+    if name in _CLASS_MODULES:
+        module = importlib.import_module(_CLASS_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _load_analyzer(method_name: str):
+    """
+    Import the module defining an analysis method, registering it with the factory
+
+    Args:
+        method_name: Name of the analysis method
+    """
+    entry = _REGISTRY.get(method_name)
+    if entry:
+        importlib.import_module(entry[0], __name__)
+
+
 def get_available_methods():
     """
     Get list of all available delay analysis methods
@@ -38,7 +66,11 @@ def get_available_methods():
     Returns:
         List of dictionaries with method name and description
     """
-    return DelayAnalyzerFactory.get_available_methods()
+    for method_name in _REGISTRY:
+        _load_analyzer(method_name)
+    order = {method_name: i for i, method_name in enumerate(_REGISTRY)}
+    methods = DelayAnalyzerFactory.get_available_methods()
+    return sorted(methods, key=lambda m: order.get(m['name'], len(order)))
 
 
 def create_analyzer(method_name: str) -> BaseDelayAnalyzer:
@@ -54,9 +86,10 @@ def create_analyzer(method_name: str) -> BaseDelayAnalyzer:
     Raises:
         ValueError: If method name is not recognized
     """
+    _load_analyzer(method_name)
     analyzer = DelayAnalyzerFactory.create(method_name)
     if not analyzer:
-        available = [m['name'] for m in get_available_methods()]
+        available = list(_REGISTRY)
         raise ValueError(
             f"Unknown analysis method: {method_name}. "
             f"Available methods: {', '.join(available)}"
@@ -2,14 +2,117 @@
 As-Planned vs As-Built Analysis Method
 Compares the original baseline schedule with the actual progress
 """
-from typing import Dict, Any
-import pandas as pd
+from typing import Dict, Any, List, Tuple
+import numpy as np
 from datetime import datetime
+from functools import partial
+from enum import IntEnum
+import heapq
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from .base_analyzer import BaseDelayAnalyzer, DelayAnalysisResult, DelayAnalyzerFactory
 from ..utils.schedule_utils import Schedule
 
 
+class CauseCode(IntEnum):
+    """Delay cause codes, in the priority order of _classify_delays_numpy"""
+    PRODUCTIVITY_LOSS = 0
+    LATE_START = 1
+    SLOW_PROGRESS = 2
+    GENERAL = 3
+
+
+# Cause labels indexed by CauseCode
+DELAY_CAUSES = ("Productivity Loss", "Late Start", "Slow Progress", "General Delay")
+
+
+def cause_name(code: int) -> str:
+    """
+    Display label for a cause code
+
+    Args:
+        code: CauseCode value
+
+    Returns:
+        Cause label as used in delays_by_cause and reports
+    """
+    return DELAY_CAUSES[code]
+
+
+# Dates are passed to the kernels as int64 microseconds; NaT is the minimum int64
+_NAT = np.iinfo(np.int64).min
+_US_PER_DAY = 86_400_000_000
+
+
+def _classify_delays_numpy(planned_finish, current_finish, baseline_start, actual_start,
+                           baseline_duration, current_duration, percent_complete):
+    """
+    Compute delay days and cause codes with array operations
+
+    The cause is the first rule that matches: duration grew by more than
+    10% (productivity loss), the actual start is after the baseline start
+    (late start), less than 50% complete (slow progress), else a general
+    delay.
+
+    Args:
+        planned_finish: Baseline finish dates (int64 microseconds, NaT allowed)
+        current_finish: Current (or actual) finish dates
+        baseline_start: Baseline start dates
+        actual_start: Current actual start dates
+        baseline_duration: Baseline durations (float64)
+        current_duration: Current durations (float64)
+        percent_complete: Current percent complete (float64)
+
+    Returns:
+        Tuple of (delay_days int64 array, CauseCode values as an int8 array)
+    """
+    delays = np.zeros(len(planned_finish), dtype=np.int64)
+    valid = (planned_finish != _NAT) & (current_finish != _NAT)
+    delays[valid] = (current_finish[valid] - planned_finish[valid]) // _US_PER_DAY
+
+    late_start = (baseline_start != _NAT) & (actual_start != _NAT) & (actual_start > baseline_start)
+    codes = np.select(
+        [current_duration > baseline_duration * 1.1, late_start, percent_complete < 50],
+        [CauseCode.PRODUCTIVITY_LOSS, CauseCode.LATE_START, CauseCode.SLOW_PROGRESS],
+        default=CauseCode.GENERAL
+    ).astype(np.int8)
+
+    return delays, codes
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _classify_delays(planned_finish, current_finish, baseline_start, actual_start,
+                         baseline_duration, current_duration, percent_complete):
+        """Compiled single-pass equivalent of _classify_delays_numpy"""
+        n = len(planned_finish)
+        delays = np.zeros(n, dtype=np.int64)
+        codes = np.empty(n, dtype=np.int8)
+
+        for i in range(n):
+            if planned_finish[i] != _NAT and current_finish[i] != _NAT:
+                delays[i] = (current_finish[i] - planned_finish[i]) // _US_PER_DAY
+
+            if current_duration[i] > baseline_duration[i] * 1.1:
+                codes[i] = CauseCode.PRODUCTIVITY_LOSS
+            elif (baseline_start[i] != _NAT and actual_start[i] != _NAT
+                  and actual_start[i] > baseline_start[i]):
+                codes[i] = CauseCode.LATE_START
+            elif percent_complete[i] < 50:
+                codes[i] = CauseCode.SLOW_PROGRESS
+            else:
+                codes[i] = CauseCode.GENERAL
+
+        return delays, codes
+else:
+    _classify_delays = _classify_delays_numpy
+
+
 @DelayAnalyzerFactory.register
 class AsPlannedVsAsBuiltAnalyzer(BaseDelayAnalyzer):
     """
@@ -17,11 +120,11 @@ class AsPlannedVsAsBuiltAnalyzer(BaseDelayAnalyzer):
     with actual performance to identify delays
     """
 
+    name = "As-Planned vs As-Built"
+    description = "Compares the baseline (as-planned) schedule with actual progress (as-built) to identify delays and their magnitude"
+
     def __init__(self):
-        super().__init__(
-            name="As-Planned vs As-Built",
-            description="Compares the baseline (as-planned) schedule with actual progress (as-built) to identify delays and their magnitude"
-        )
+        super().__init__()
         self.required_inputs = ['baseline_schedule', 'current_schedule']
         self.optional_inputs = ['analysis_date', 'include_non_critical']
 
@@ -74,73 +177,92 @@ class AsPlannedVsAsBuiltAnalyzer(BaseDelayAnalyzer):
         result.metadata['baseline_project'] = baseline.project_name
         result.metadata['current_project'] = current.project_name
 
-        # Compare schedules
-        comparison_df = self._compare_schedules(baseline, current)
-
         # Analyze delays
-        total_delay = 0
-        critical_delay = 0
-
-        for _, row in comparison_df.iterrows():
-            activity_id = row['activity_id']
-
-            # Get baseline and current activities
-            baseline_act = baseline.activities.get(activity_id)
-            current_act = current.activities.get(activity_id)
+        critical_ids = baseline.critical_ids
+
+        # Only activities present in both schedules can be compared; when
+        # non-critical activities are skipped, start from the critical set
+        if include_non_critical:
+            common_ids = self._common_activity_ids(baseline, current)
+        else:
+            common_ids = sorted(critical_ids & current.activities.keys())
+
+        delayed = self._compute_delays_vectorized(baseline, current, common_ids)
+        activity_ids = [activity_id for activity_id, _, _ in delayed]
+        delay_days = [days for _, days, _ in delayed]
+        baseline_acts = [baseline.activities[activity_id] for activity_id in activity_ids]
+        current_acts = [current.activities[activity_id] for activity_id in activity_ids]
+        is_critical = [activity_id in critical_ids for activity_id in activity_ids]
+
+        result.add_activity_delays(
+            activity_id=activity_ids,
+            activity_name=[act.name for act in current_acts],
+            delay_days=delay_days,
+            cause=[cause for _, _, cause in delayed],
+            is_critical=is_critical,
+            baseline_finish=[act.finish_date for act in baseline_acts],
+            actual_finish=[act.actual_finish or act.finish_date for act in current_acts],
+            baseline_duration=[act.duration for act in baseline_acts],
+            actual_duration=[act.duration for act in current_acts]
+        )
 
-            if not baseline_act or not current_act:
-                continue
+        result.total_delay_days = sum(delay_days)
+        result.critical_delay_days = sum(
+            days for days, critical in zip(delay_days, is_critical) if critical
+        )
 
-            # Skip non-critical if requested
-            if not include_non_critical and not baseline_act.is_critical:
-                continue
+        # Largest delays first, so consumers can take the head directly
+        result.sort_delays()
 
-            # Calculate finish date delay
-            delay_days = 0
-            if baseline_act.finish_date and current_act.finish_date:
-                delay_days = self._calculate_delay(
-                    baseline_act.finish_date,
-                    current_act.finish_date
-                )
-            elif baseline_act.finish_date and current_act.actual_finish:
-                delay_days = self._calculate_delay(
-                    baseline_act.finish_date,
-                    current_act.actual_finish
-                )
+        # Generate recommendations
+        result.recommendations = self._generate_recommendations(result, baseline, current)
 
-            if delay_days > 0:
-                # Determine cause (simplified - could be enhanced)
-                cause = self._determine_delay_cause(baseline_act, current_act)
-
-                result.add_activity_delay(
-                    activity_id=activity_id,
-                    activity_name=current_act.name,
-                    delay_days=delay_days,
-                    cause=cause,
-                    is_critical=baseline_act.is_critical,
-                    baseline_finish=baseline_act.finish_date,
-                    actual_finish=current_act.actual_finish or current_act.finish_date,
-                    baseline_duration=baseline_act.duration,
-                    actual_duration=current_act.duration
-                )
+        # Create summary
+        result.summary = partial(self._create_summary, result)
 
-                total_delay += delay_days
-                if baseline_act.is_critical:
-                    critical_delay += delay_days
+        return result
 
-        result.total_delay_days = total_delay
-        result.critical_delay_days = critical_delay
+    def _compute_delays_vectorized(self, baseline: Schedule, current: Schedule,
+                                   activity_ids: List[str]) -> List[Tuple[str, int, str]]:
+        """
+        Compute finish date delays and their causes for many activities at once
 
-        # Generate recommendations
-        result.recommendations = self._generate_recommendations(result, baseline, current)
+        Activity fields are packed into parallel arrays and classified in one
+        pass (compiled with numba when it is installed). The current finish
+        date is used when present, else the actual finish. Delays are whole
+        days, floored like ``timedelta.days``; causes follow the rules
+        documented on _classify_delays_numpy.
 
-        # Create summary
-        result.summary = self._create_summary(result)
+        Args:
+            baseline: Baseline schedule
+            current: Current schedule
+            activity_ids: Activities present in both schedules
 
-        # Create detailed report DataFrame
-        result.detailed_report = pd.DataFrame(result.delays_by_activity)
+        Returns:
+            List of (activity_id, delay_days, cause) for delayed activities, in input order
+        """
+        baseline_acts = [baseline.activities[aid] for aid in activity_ids]
+        current_acts = [current.activities[aid] for aid in activity_ids]
+
+        def dates(values):
+            return np.array(values, dtype='datetime64[us]').view(np.int64)
+
+        delays, codes = _classify_delays(
+            dates([a.finish_date for a in baseline_acts]),
+            dates([a.finish_date or a.actual_finish for a in current_acts]),
+            dates([a.start_date for a in baseline_acts]),
+            dates([a.actual_start for a in current_acts]),
+            np.array([a.duration for a in baseline_acts], dtype=np.float64),
+            np.array([a.duration for a in current_acts], dtype=np.float64),
+            np.array([a.percent_complete for a in current_acts], dtype=np.float64)
+        )
 
-        return result
+        delayed = np.flatnonzero(delays > 0)
+        return list(zip(
+            [activity_ids[i] for i in delayed],
+            delays[delayed].tolist(),
+            [cause_name(code) for code in codes[delayed].tolist()]
+        ))
 
     def get_suggestions(self, **kwargs) -> list:
         """Get suggestions based on inputs"""
@@ -150,8 +272,8 @@ class AsPlannedVsAsBuiltAnalyzer(BaseDelayAnalyzer):
             baseline = kwargs['baseline_schedule']
             current = kwargs['current_schedule']
 
-            baseline_critical = len([a for a in baseline.activities.values() if a.is_critical])
-            current_critical = len([a for a in current.activities.values() if a.is_critical])
+            baseline_critical = len(baseline.critical_ids)
+            current_critical = len(current.critical_ids)
 
             if current_critical > baseline_critical * 1.2:
                 suggestions.append(
@@ -168,32 +290,16 @@ class AsPlannedVsAsBuiltAnalyzer(BaseDelayAnalyzer):
                     "Consider focusing on critical path acceleration."
                 )
 
-            delayed = current.get_delayed_activities()
-            if len(delayed) > len(current.activities) * 0.3:
+            n_activities = len(current.activities)
+            n_delayed = len(current.get_delayed_activities())
+            if n_delayed > n_activities * 0.3:
                 suggestions.append(
-                    f"🔴 {len(delayed)} activities ({len(delayed)/len(current.activities)*100:.1f}%) are delayed. "
+                    f"🔴 {n_delayed} activities ({n_delayed/n_activities*100:.1f}%) are delayed. "
                     "Consider reviewing resource allocation and potential bottlenecks."
                 )
 
         return suggestions
 
-    def _determine_delay_cause(self, baseline_act, current_act) -> str:
-        """Determine likely cause of delay (simplified)"""
-        # Check if duration increased
-        if current_act.duration > baseline_act.duration * 1.1:
-            return "Productivity Loss"
-
-        # Check if start was delayed
-        if baseline_act.start_date and current_act.actual_start:
-            if current_act.actual_start > baseline_act.start_date:
-                return "Late Start"
-
-        # Check if percent complete is low
-        if current_act.percent_complete < 50:
-            return "Slow Progress"
-
-        return "General Delay"
-
     def _generate_recommendations(self, result: DelayAnalysisResult,
                                  baseline: Schedule, current: Schedule) -> list:
         """Generate recommendations based on analysis"""
@@ -214,8 +320,7 @@ class AsPlannedVsAsBuiltAnalyzer(BaseDelayAnalyzer):
 
         # Most delayed activities
         if result.delays_by_activity:
-            sorted_delays = sorted(result.delays_by_activity,
-                                 key=lambda x: x['delay_days'], reverse=True)[:3]
+            sorted_delays = result.delays_by_activity[:3]
             recommendations.append(
                 "Prioritize recovery for most delayed activities: " +
                 ", ".join([f"{d['activity_name']} ({d['delay_days']:.1f}d)"
@@ -231,12 +336,11 @@ As-Planned vs As-Built Analysis Summary:
 
 Total Delay: {result.total_delay_days:.1f} days
 Critical Path Delay: {result.critical_delay_days:.1f} days
-Affected Activities: {len(result.delays_by_activity)}
+Affected Activities: {result.delay_count}
 
 Top Delay Causes:
 """
-        for cause, days in sorted(result.delays_by_cause.items(),
-                                 key=lambda x: x[1], reverse=True)[:5]:
+        for cause, days in heapq.nlargest(5, result.delays_by_cause.items(), key=lambda x: x[1]):
             summary += f"  - {cause}: {days:.1f} days\n"
 
         return summary
@@ -2,13 +2,38 @@
 Base class for delay analysis methods
 """
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from collections import defaultdict
+from typing import Dict, List, Optional, Any, ClassVar, Callable, Tuple, Union
 from datetime import datetime
+import hashlib
+import heapq
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 from ..utils.schedule_utils import Schedule, ScheduleActivity
 
 
+# Column types for the detailed delay table, for the columns that are present.
+# Repeated cause labels are stored once as categories; schedule dates become
+# datetime64 columns instead of Python objects.
+_DELAY_DTYPES = {
+    'activity_id': 'string',
+    'cause': 'category',
+    'is_critical': 'bool',
+    'baseline_finish': 'datetime64[ns]',
+    'actual_finish': 'datetime64[ns]',
+    'original_finish': 'datetime64[ns]',
+    'collapsed_finish': 'datetime64[ns]',
+    'window_start': 'datetime64[ns]',
+    'window_end': 'datetime64[ns]',
+}
+
+
 class DelayAnalysisResult:
     """Container for delay analysis results"""
 
@@ -17,13 +42,23 @@ class DelayAnalysisResult:
         self.analysis_date = datetime.now()
         self.total_delay_days = 0
         self.critical_delay_days = 0
-        self.delays_by_activity: List[Dict] = []
-        self.delays_by_cause: Dict[str, float] = {}
+        # Activity delays are stored column by column; the list of dicts
+        # exposed as delays_by_activity is built only when it is read
+        self._delay_columns: Dict[str, List] = {}
+        self._delay_count = 0
+        self._delays_by_activity: Optional[Tuple[Dict, ...]] = None
+        self.critical_activity_count = 0
+        # int default so that whole-day totals stay integers
+        self.delays_by_cause: Dict[str, float] = defaultdict(int)
         self.critical_path_changes: List[Dict] = []
         self.recommendations: List[str] = []
-        self.summary: str = ""
-        self.detailed_report: pd.DataFrame = pd.DataFrame()
+        # Summary text, or a builder run on first access
+        self._summary: Union[str, Callable[[], str]] = ""
+        self._detailed_report: Optional[pd.DataFrame] = None
         self.metadata: Dict[str, Any] = {}
+        self._delays_arrow = None
+        # Set when detailed_report is assigned rather than built from the delays
+        self._report_replaced = False
 
     def add_activity_delay(self, activity_id: str, activity_name: str,
                           delay_days: float, cause: str = "Unknown",
@@ -37,13 +72,215 @@ class DelayAnalysisResult:
             'is_critical': is_critical,
             **kwargs
         }
-        self.delays_by_activity.append(delay_info)
+        columns = self._delay_columns
+        for key, value in delay_info.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * self._delay_count
+            column.append(value)
+        self._delay_count += 1
+        if len(columns) > len(delay_info):
+            for column in columns.values():
+                if len(column) < self._delay_count:
+                    column.append(None)
+
+        if is_critical:
+            self.critical_activity_count += 1
+        self._reset_delay_caches()
 
         # Update cause totals
-        if cause not in self.delays_by_cause:
-            self.delays_by_cause[cause] = 0
         self.delays_by_cause[cause] += delay_days
 
+    def add_activity_delays(self, activity_id: List[str], activity_name: List[str],
+                            delay_days: List[float], cause: List[str],
+                            is_critical: List[bool], **kwargs):
+        """
+        Add delays for many activities at once, given column by column
+
+        Equivalent to calling add_activity_delay for each position, in order.
+
+        Args:
+            activity_id: Activity IDs
+            activity_name: Activity names
+            delay_days: Delay per activity
+            cause: Cause per activity
+            is_critical: Critical flag per activity
+            **kwargs: Further columns, one value per activity
+
+        Raises:
+            ValueError: If the columns differ in length
+        """
+        batch = {
+            'activity_id': list(activity_id),
+            'activity_name': list(activity_name),
+            'delay_days': list(delay_days),
+            'cause': list(cause),
+            'is_critical': list(is_critical),
+            **{key: list(values) for key, values in kwargs.items()}
+        }
+        count = len(batch['activity_id'])
+        if any(len(values) != count for values in batch.values()):
+            raise ValueError("All delay columns must have the same length")
+        if not count:
+            return
+
+        columns = self._delay_columns
+        for key, values in batch.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * self._delay_count
+            column.extend(values)
+        self._delay_count += count
+        if len(columns) > len(batch):
+            for column in columns.values():
+                column.extend([None] * (self._delay_count - len(column)))
+
+        self.critical_activity_count += sum(1 for flag in batch['is_critical'] if flag)
+        self._reset_delay_caches()
+
+        # Update cause totals
+        for cause_name, days in zip(batch['cause'], batch['delay_days']):
+            self.delays_by_cause[cause_name] += days
+
+    @property
+    def delay_count(self) -> int:
+        """Number of activity delays recorded"""
+        return self._delay_count
+
+    @property
+    def delays_by_activity(self) -> Tuple[Dict, ...]:
+        """
+        Activity delays as one dict per activity, built on first access
+
+        The rows are a read-only view of the stored columns: add delays with
+        add_activity_delay(s) or assign a new list to replace them all.
+
+        Returns:
+            Tuple of delay dicts, in insertion (or sorted) order
+        """
+        if self._delays_by_activity is None:
+            keys = list(self._delay_columns)
+            self._delays_by_activity = tuple(
+                dict(zip(keys, row)) for row in zip(*self._delay_columns.values())
+            )
+        return self._delays_by_activity
+
+    @delays_by_activity.setter
+    def delays_by_activity(self, delays: List[Dict]):
+        self._delay_columns = {}
+        self._delay_count = 0
+        self._reset_delay_caches()
+        self.critical_activity_count = 0
+        self.delays_by_cause = defaultdict(int)
+        for delay in delays:
+            self.add_activity_delay(**delay)
+
+    @property
+    def summary(self) -> str:
+        """
+        Summary text, formatted on first access when set as a builder
+
+        Returns:
+            Summary text
+        """
+        if callable(self._summary):
+            self._summary = self._summary()
+        return self._summary
+
+    @summary.setter
+    def summary(self, summary: Union[str, Callable[[], str]]):
+        self._summary = summary
+
+    @property
+    def detailed_report(self) -> pd.DataFrame:
+        """
+        Detailed delay table, built from the activity delays on first access
+
+        Returns:
+            DataFrame with one row per delayed activity (unless replaced)
+        """
+        if self._detailed_report is None:
+            self._detailed_report = self.delays_frame()
+        return self._detailed_report
+
+    @detailed_report.setter
+    def detailed_report(self, report: pd.DataFrame):
+        self._detailed_report = report
+        self._report_replaced = True
+        self._delays_arrow = None
+
+    def delays_frame(self) -> pd.DataFrame:
+        """
+        Build a DataFrame of activity delays directly from the stored columns
+
+        Returns:
+            DataFrame with one row per delayed activity
+        """
+        # Typed columns are converted straight from their lists, without an
+        # intermediate object column
+        return pd.DataFrame({
+            col: pd.Series(values, dtype=_DELAY_DTYPES.get(col))
+            for col, values in self._delay_columns.items()
+        }, index=pd.RangeIndex(self._delay_count), copy=False)
+
+    def sort_delays(self):
+        """Sort activity delays by delay_days, largest first (stable for ties)"""
+        delay_days = self._delay_columns.get('delay_days', [])
+        order = sorted(range(self._delay_count), key=delay_days.__getitem__, reverse=True)
+        self._delay_columns = {
+            key: [column[i] for i in order] for key, column in self._delay_columns.items()
+        }
+        self._reset_delay_caches()
+
+    def _reset_delay_caches(self):
+        """Drop everything derived from the activity delays, after they change"""
+        self._delays_by_activity = None
+        self._detailed_report = None
+        self._delays_arrow = None
+        self._report_replaced = False
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Short content hash of everything a report shows, taken on each access
+
+        Totals, recommendations and metadata are plain attributes that may
+        change after an export, so the hash is not cached.
+
+        Returns:
+            16-character hex digest
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(f"{self.method_name}|{self.analysis_date.isoformat()}|"
+                      f"{self.total_delay_days}|{self.critical_delay_days}|"
+                      f"{self.critical_activity_count}|{self._delay_count}|"
+                      f"{sorted(self.delays_by_cause.items())}|"
+                      f"{self.recommendations}|{self.metadata}\n".encode())
+        for key, column in self._delay_columns.items():
+            digest.update(f"{key}={column}\n".encode())
+        if self._report_replaced:
+            digest.update(self._detailed_report.to_csv().encode())
+        digest.update(self.summary.encode())
+        return digest.hexdigest()
+
+    @property
+    def delays_arrow(self):
+        """
+        Activity delays as an Arrow table, built once for display
+
+        Returns:
+            pyarrow Table (or the pandas DataFrame if pyarrow is not installed)
+        """
+        if self._delays_arrow is None:
+            df = self.detailed_report
+            if df.empty:
+                df = self.delays_frame()
+            if PYARROW_AVAILABLE:
+                self._delays_arrow = pa.Table.from_pandas(df, preserve_index=False)
+            else:
+                self._delays_arrow = df
+        return self._delays_arrow
+
     def add_recommendation(self, recommendation: str):
         """Add a recommendation"""
         self.recommendations.append(recommendation)
@@ -56,7 +293,7 @@ class DelayAnalysisResult:
             'total_delay_days': self.total_delay_days,
             'critical_delay_days': self.critical_delay_days,
             'delays_by_activity': self.delays_by_activity,
-            'delays_by_cause': self.delays_by_cause,
+            'delays_by_cause': dict(self.delays_by_cause),
             'critical_path_changes': self.critical_path_changes,
             'recommendations': self.recommendations,
             'summary': self.summary,
@@ -69,19 +306,24 @@ class DelayAnalysisResult:
             'method': self.method_name,
             'total_delay': f"{self.total_delay_days:.1f} days",
             'critical_delay': f"{self.critical_delay_days:.1f} days",
-            'affected_activities': len(self.delays_by_activity),
-            'critical_activities': len([d for d in self.delays_by_activity if d['is_critical']]),
-            'main_causes': dict(sorted(self.delays_by_cause.items(),
-                                     key=lambda x: x[1], reverse=True)[:5])
+            'affected_activities': self._delay_count,
+            'critical_activities': self.critical_activity_count,
+            'main_causes': dict(heapq.nlargest(5, self.delays_by_cause.items(), key=lambda x: x[1]))
         }
 
 
 class BaseDelayAnalyzer(ABC):
     """Base class for delay analysis methods"""
 
-    def __init__(self, name: str, description: str):
-        self.name = name
-        self.description = description
+    # Set on each subclass so the factory can read them without an instance
+    name: ClassVar[str] = ""
+    description: ClassVar[str] = ""
+
+    def __init__(self, name: Optional[str] = None, description: Optional[str] = None):
+        if name is not None:
+            self.name = name
+        if description is not None:
+            self.description = description
         self.required_inputs: List[str] = []
         self.optional_inputs: List[str] = []
         self.questions: List[Dict[str, Any]] = []
@@ -173,10 +415,28 @@ class BaseDelayAnalyzer(ABC):
         """
         return schedule.get_delayed_activities()
 
+    def _common_activity_ids(self, baseline: Schedule, current: Schedule) -> List[str]:
+        """
+        IDs of activities present in both schedules, without building frames
+
+        Sorted, i.e. in the key order of the _compare_schedules merge.
+
+        Args:
+            baseline: Baseline schedule
+            current: Current schedule
+
+        Returns:
+            Sorted list of activity IDs
+        """
+        return sorted(baseline.activities.keys() & current.activities.keys())
+
     def _compare_schedules(self, baseline: Schedule, current: Schedule) -> pd.DataFrame:
         """
         Compare two schedules
 
+        Builds the full side-by-side comparison; when only the matching
+        activity IDs are needed, use _common_activity_ids instead.
+
         Args:
             baseline: Baseline schedule
             current: Current schedule
@@ -205,9 +465,8 @@ class DelayAnalyzerFactory:
 
     @classmethod
     def register(cls, analyzer_class):
-        """Register an analyzer class"""
-        instance = analyzer_class()
-        cls._analyzers[instance.name] = analyzer_class
+        """Register an analyzer class under its class-level name"""
+        cls._analyzers[analyzer_class.name] = analyzer_class
         return analyzer_class
 
     @classmethod
@@ -223,9 +482,8 @@ class DelayAnalyzerFactory:
         """Get list of available analysis methods"""
         methods = []
         for name, analyzer_class in cls._analyzers.items():
-            instance = analyzer_class()
             methods.append({
                 'name': name,
-                'description': instance.description
+                'description': analyzer_class.description
             })
         return methods
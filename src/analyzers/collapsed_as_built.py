@@ -3,9 +3,9 @@ Collapsed As-Built (But-For) Analysis Method
 Removes delay events from actual schedule to show "but-for" completion date
 """
 from typing import Dict, Any, List
-import pandas as pd
 from datetime import datetime, timedelta
-import copy
+from functools import partial
+from collections import defaultdict
 
 from .base_analyzer import BaseDelayAnalyzer, DelayAnalysisResult, DelayAnalyzerFactory
 from ..utils.schedule_utils import Schedule
@@ -19,11 +19,11 @@ class CollapsedAsBuiltAnalyzer(BaseDelayAnalyzer):
     completed "but for" those delays
     """
 
+    name = "Collapsed As-Built (But-For)"
+    description = "Removes specific delays from the actual schedule to show when the project would have completed without those delays"
+
     def __init__(self):
-        super().__init__(
-            name="Collapsed As-Built (But-For)",
-            description="Removes specific delays from the actual schedule to show when the project would have completed without those delays"
-        )
+        super().__init__()
         self.required_inputs = ['as_built_schedule', 'delay_events']
         self.optional_inputs = ['baseline_schedule']
 
@@ -84,18 +84,19 @@ class CollapsedAsBuiltAnalyzer(BaseDelayAnalyzer):
             activity = as_built.activities.get(activity_id)
             if not activity:
                 continue
+            is_critical = activity_id in as_built.critical_ids
 
             result.add_activity_delay(
                 activity_id=activity_id,
                 activity_name=activity.name,
                 delay_days=delay_days,
                 cause=cause,
-                is_critical=activity.is_critical,
+                is_critical=is_critical,
                 original_finish=activity.finish_date,
                 collapsed_finish=activity.finish_date - timedelta(days=delay_days) if activity.finish_date else None
             )
 
-            if activity.is_critical:
+            if is_critical:
                 result.critical_delay_days += delay_days
 
         # Generate recommendations
@@ -104,9 +105,7 @@ class CollapsedAsBuiltAnalyzer(BaseDelayAnalyzer):
         )
 
         # Create summary
-        result.summary = self._create_summary(result, as_built_finish, collapsed_finish, baseline)
-
-        result.detailed_report = pd.DataFrame(result.delays_by_activity)
+        result.summary = partial(self._create_summary, result, as_built_finish, collapsed_finish, baseline)
 
         return result
 
@@ -134,8 +133,7 @@ class CollapsedAsBuiltAnalyzer(BaseDelayAnalyzer):
 
             # Check critical path
             critical_delays = [e for e in events
-                             if as_built.activities.get(e['activity_id'], None)
-                             and as_built.activities[e['activity_id']].is_critical]
+                             if e['activity_id'] in as_built.critical_ids]
 
             if critical_delays:
                 suggestions.append(
@@ -162,27 +160,51 @@ class CollapsedAsBuiltAnalyzer(BaseDelayAnalyzer):
         Returns:
             Collapsed schedule
         """
-        collapsed = copy.deepcopy(as_built)
+        # Shallow copy: activities are copied only when they are modified
+        collapsed = as_built.clone(copy_activities=False)
 
-        # Remove each delay event
+        # Delays to remove per activity, so repeated events on the same
+        # activity are applied in one visit
+        removed_by_id = defaultdict(list)
         for event in delay_events:
-            activity_id = event['activity_id']
-            delay_days = event['delay_days']
-
-            if activity_id not in collapsed.activities:
+            if event['activity_id'] in collapsed.activities:
+                removed_by_id[event['activity_id']].append(event['delay_days'])
+
+        # Single pass in topological order: each activity is pulled in by the
+        # largest removal reaching it through its predecessors, then loses its
+        # own removed delay, and passes the total on to its successors
+        pull_in = {}
+        for activity_id in collapsed.topological_order():
+            shift_days = pull_in.get(activity_id, 0)
+            removed = removed_by_id.get(activity_id, ())
+            removed_days = sum(removed)
+            if not shift_days and not removed_days:
                 continue
 
-            activity = collapsed.activities[activity_id]
+            activity = self._own_activity(collapsed, as_built, activity_id)
+
+            # Pull in dates
+            if shift_days:
+                shift = timedelta(days=shift_days)
+                if activity.start_date:
+                    activity.start_date = activity.start_date - shift
+                if activity.finish_date:
+                    activity.finish_date = activity.finish_date - shift
 
             # Remove delay by reducing duration/dates
-            if activity.finish_date:
-                activity.finish_date = activity.finish_date - timedelta(days=delay_days)
+            if removed_days:
+                if activity.finish_date:
+                    activity.finish_date = activity.finish_date - timedelta(days=removed_days)
 
-            if activity.duration >= delay_days:
-                activity.duration -= delay_days
+                # Each event shortens the duration only if it fits
+                for delay_days in removed:
+                    if activity.duration >= delay_days:
+                        activity.duration -= delay_days
 
-            # Pull in successors
-            self._pull_in_successors(collapsed, activity_id, delay_days)
+            total_days = shift_days + removed_days
+            for successor_id in activity.successors:
+                if successor_id in collapsed.activities and total_days > pull_in.get(successor_id, 0):
+                    pull_in[successor_id] = total_days
 
         # Update project finish
         if collapsed.activities:
@@ -195,31 +217,23 @@ class CollapsedAsBuiltAnalyzer(BaseDelayAnalyzer):
 
         return collapsed
 
-    def _pull_in_successors(self, schedule: Schedule, activity_id: str, days: float):
+    def _own_activity(self, collapsed: Schedule, as_built: Schedule, activity_id: str):
         """
-        Pull in successor activities after removing delay
+        Get an activity of the collapsed schedule that is safe to modify
 
         Args:
-            schedule: Schedule to update
-            activity_id: ID of activity with removed delay
-            days: Days of delay removed
-        """
-        activity = schedule.activities[activity_id]
-
-        for successor_id in activity.successors:
-            if successor_id not in schedule.activities:
-                continue
-
-            successor = schedule.activities[successor_id]
+            collapsed: Collapsed schedule sharing activities with as_built
+            as_built: Original schedule, which must stay unchanged
+            activity_id: ID of the activity to modify
 
-            # Pull in dates
-            if successor.start_date:
-                successor.start_date = successor.start_date - timedelta(days=days)
-            if successor.finish_date:
-                successor.finish_date = successor.finish_date - timedelta(days=days)
-
-            # Recursively pull in
-            self._pull_in_successors(schedule, successor_id, days)
+        Returns:
+            The collapsed schedule's own copy of the activity
+        """
+        activity = collapsed.activities[activity_id]
+        if activity is as_built.activities.get(activity_id):
+            activity = activity.clone()
+            collapsed.activities[activity_id] = activity
+        return activity
 
     def _generate_recommendations(self, result: DelayAnalysisResult,
                                   as_built: Schedule,
@@ -260,7 +274,7 @@ class CollapsedAsBuiltAnalyzer(BaseDelayAnalyzer):
         summary = f"""
 Collapsed As-Built (But-For) Analysis Summary:
 
-Delay Events Removed: {len(result.delays_by_activity)}
+Delay Events Removed: {result.delay_count}
 Total Delay Removed: {result.total_delay_days:.1f} days
 
 As-Built Completion: {as_built_finish.strftime('%Y-%m-%d') if as_built_finish else 'Unknown'}
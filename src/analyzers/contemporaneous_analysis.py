@@ -2,14 +2,92 @@
 Contemporaneous Period Analysis
 Analyzes delays using contemporary project records and conditions
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Iterable
 import pandas as pd
 from datetime import datetime, timedelta
+from functools import partial
+from bisect import bisect_right
+from itertools import accumulate
+import re
+import numpy as np
 
 from .base_analyzer import BaseDelayAnalyzer, DelayAnalysisResult, DelayAnalyzerFactory
 from ..utils.schedule_utils import Schedule
 
 
+_US_PER_DAY = 86_400_000_000
+
+# Keywords looked for in daily log notes, in order of precedence
+_LOG_CAUSE_KEYWORDS = [
+    ("Weather Delay", ('weather', 'rain', 'storm', 'wind')),
+    ("Design Issue", ('rfi', 'clarification', 'design')),
+    ("Material Delay", ('material', 'delivery', 'supplier')),
+    ("Labor Issue", ('labor', 'crew', 'manpower')),
+    ("Change Order", ('change', 'variation', 'extra')),
+]
+
+# One group per cause inside a lookahead, so overlapping keywords are all seen
+_LOG_CAUSE_PATTERN = re.compile('(?=(?:' + '|'.join(
+    '(' + '|'.join(keywords) + ')' for _, keywords in _LOG_CAUSE_KEYWORDS
+) + '))')
+
+
+def _log_cause(log_text: str) -> Optional[str]:
+    """
+    Classify a lowercased log note by the highest-precedence keyword it contains
+
+    Args:
+        log_text: Lowercased log notes
+
+    Returns:
+        Cause label, or None when no keyword is present
+    """
+    group = min((match.lastindex for match in _LOG_CAUSE_PATTERN.finditer(log_text)), default=None)
+    return _LOG_CAUSE_KEYWORDS[group - 1][0] if group else None
+
+
+
+def _index_log_mentions(keys: Iterable[str], log_texts: List[str]) -> Dict[str, List[int]]:
+    """
+    Map each key to the positions of the log texts that contain it
+
+    The logs are joined into one string so that each key costs a few
+    str.find calls over the whole text instead of one test per log.
+
+    Args:
+        keys: Lowercased activity IDs and names
+        log_texts: Lowercased log notes
+
+    Returns:
+        Dictionary of key to sorted log positions
+    """
+    joined = '\0'.join(log_texts)
+    offsets = [0, *accumulate(len(text) + 1 for text in log_texts)]
+    mentions = {}
+
+    for key in keys:
+        if key in mentions:
+            continue
+        if not key:
+            mentions[key] = list(range(len(log_texts)))
+            continue
+
+        hits = []
+        pos = joined.find(key)
+        while pos != -1:
+            i = bisect_right(offsets, pos) - 1
+            if pos + len(key) < offsets[i + 1]:
+                # Found within log i: resume at the next log
+                hits.append(i)
+                pos = joined.find(key, offsets[i + 1])
+            else:
+                # Match spans a separator: look further
+                pos = joined.find(key, pos + 1)
+        mentions[key] = hits
+
+    return mentions
+
+
 @DelayAnalyzerFactory.register
 class ContemporaneousAnalyzer(BaseDelayAnalyzer):
     """
@@ -17,11 +95,11 @@ class ContemporaneousAnalyzer(BaseDelayAnalyzer):
     daily logs, and progress reports to analyze delays as they occurred
     """
 
+    name = "Contemporaneous Period Analysis"
+    description = "Analyzes delays using contemporary project documentation, daily logs, and real-time records to understand delays as they occurred"
+
     def __init__(self):
-        super().__init__(
-            name="Contemporaneous Period Analysis",
-            description="Analyzes delays using contemporary project documentation, daily logs, and real-time records to understand delays as they occurred"
-        )
+        super().__init__()
         self.required_inputs = ['schedule_updates', 'period_start', 'period_end']
         self.optional_inputs = ['daily_logs', 'progress_reports', 'weather_data']
 
@@ -86,88 +164,156 @@ class ContemporaneousAnalyzer(BaseDelayAnalyzer):
         result.metadata['has_daily_logs'] = len(daily_logs) > 0
         result.metadata['has_weather_data'] = len(weather_data) > 0
 
-        # Get schedules for period
-        period_schedules = {
-            date: sched for date, sched in schedule_updates.items()
-            if period_start <= date <= period_end
-        }
-
-        if len(period_schedules) < 2:
+        # Get first and last schedule update dates within the period
+        period_count = 0
+        first_date = last_date = None
+        for date in schedule_updates:
+            if period_start <= date <= period_end:
+                period_count += 1
+                if first_date is None or date < first_date:
+                    first_date = date
+                if last_date is None or date > last_date:
+                    last_date = date
+
+        if period_count < 2:
             raise ValueError(
                 "Need at least 2 schedule updates within the analysis period"
             )
 
         # Analyze based on contemporary records
         delays_by_date = {}
-        total_delay = 0
-        critical_delay = 0
-
-        # Get first and last schedules in period
-        sorted_dates = sorted(period_schedules.keys())
-        start_schedule = period_schedules[sorted_dates[0]]
-        end_schedule = period_schedules[sorted_dates[-1]]
 
-        # Compare schedules and correlate with contemporary records
-        for activity_id in end_schedule.activities:
-            if activity_id not in start_schedule.activities:
-                continue
+        start_schedule = schedule_updates[first_date]
+        end_schedule = schedule_updates[last_date]
 
-            start_act = start_schedule.activities[activity_id]
-            end_act = end_schedule.activities[activity_id]
-
-            # Calculate delay during period
-            delay_days = 0
+        # Compare finish dates of the common activities in one array operation
+        common_ids = [aid for aid in end_schedule.activities if aid in start_schedule.activities]
+        start_finish = np.array(
+            [start_schedule.activities[aid].finish_date for aid in common_ids], dtype='datetime64[us]'
+        )
+        end_finish = np.array(
+            [end_schedule.activities[aid].finish_date for aid in common_ids], dtype='datetime64[us]'
+        )
+        critical_ids = end_schedule.critical_ids
+        is_critical = np.array([aid in critical_ids for aid in common_ids], dtype=bool)
+
+        # Delay during period, floored to whole days like timedelta.days
+        delays = np.zeros(len(common_ids), dtype=np.int64)
+        valid = ~(np.isnat(start_finish) | np.isnat(end_finish))
+        delays[valid] = (end_finish[valid] - start_finish[valid]).view(np.int64) // _US_PER_DAY
+        is_delayed = delays > 0
+
+        total_delay = int(delays[is_delayed].sum())
+        critical_delay = int(delays[is_delayed & is_critical].sum())
+
+        delayed = [
+            (common_ids[i], start_schedule.activities[common_ids[i]],
+             end_schedule.activities[common_ids[i]], int(delays[i]))
+            for i in np.flatnonzero(is_delayed)
+        ]
 
-            if start_act.finish_date and end_act.finish_date:
-                delay_days = (end_act.finish_date - start_act.finish_date).days
+        # Key log fields as a frame, shared with the documentation assessment
+        logs_df = pd.DataFrame(daily_logs, columns=['date', 'notes'])
+        log_dates = pd.to_datetime(logs_df['date'])
+        in_period = ((log_dates >= period_start) & (log_dates <= period_end)).to_numpy()
+
+        # Lowercase and classify each log once, then find which logs mention
+        # each delayed activity by ID or name
+        log_texts = [str(log.get('notes', '')).lower() for log in daily_logs]
+        log_causes = [
+            _log_cause(log_text) if log_in_period else None
+            for log_text, log_in_period in zip(log_texts, in_period)
+        ]
+        # Lowercased (ID, name) of each delayed activity, computed once
+        lowered_names = {name: name.lower() for name in {end_act.name for _, _, end_act, _ in delayed}}
+        delayed_keys = [
+            (activity_id.lower(), lowered_names[end_act.name])
+            for activity_id, _, end_act, _ in delayed
+        ]
+        mentions = _index_log_mentions(
+            (key for keys in delayed_keys for key in keys), log_texts
+        )
+        documented_keys = {key for key, hits in mentions.items() if hits}
+        first_cause_log = {
+            key: next((i for i in hits if log_causes[i]), None)
+            for key, hits in mentions.items() if hits
+        }
 
-            if delay_days > 0:
-                # Determine cause from contemporary records
-                cause = self._determine_cause_from_records(
-                    activity_id, end_act, period_start, period_end,
-                    daily_logs, progress_reports, weather_data
-                )
+        # Weather and progress report issues within the period, gathered once
+        bad_weather_days = self._count_adverse_weather_days(
+            weather_data, period_start, period_end
+        )
+        # Adverse weather takes precedence over reported issues, so when it
+        # applies to the period the reports are never consulted
+        period_issues = [] if bad_weather_days > 3 else [
+            issue
+            for report in progress_reports
+            if report.get('date') and period_start <= report['date'] <= period_end
+            for issue in report.get('issues', [])
+        ]
+        issue_mentions = _index_log_mentions(
+            (key for activity_id, _, end_act, _ in delayed
+             for key in (activity_id, end_act.name)),
+            [str(issue) for issue in period_issues]
+        )
 
-                # Determine responsibility
-                responsibility = self._determine_responsibility(
-                    cause, end_act, weather_data
-                )
+        # Correlate delays with contemporary records
+        for (activity_id, start_act, end_act, delay_days), (id_key, name_key) in zip(delayed, delayed_keys):
+            documented = id_key in documented_keys or name_key in documented_keys
+            cause_logs = [
+                i for i in (first_cause_log.get(id_key), first_cause_log.get(name_key))
+                if i is not None
+            ] if documented else []
+
+            issue_hits = issue_mentions[activity_id] + issue_mentions[end_act.name]
+
+            # Determine cause from contemporary records
+            cause = self._determine_cause_from_records(
+                activity_id, end_act, period_start, period_end,
+                log_causes[min(cause_logs)] if cause_logs else None, bad_weather_days,
+                period_issues[min(issue_hits)] if issue_hits else None
+            )
 
-                result.add_activity_delay(
-                    activity_id=activity_id,
-                    activity_name=end_act.name,
-                    delay_days=delay_days,
-                    cause=cause,
-                    is_critical=end_act.is_critical,
-                    responsibility=responsibility,
-                    documented_in_logs=self._is_documented_in_logs(
-                        activity_id, end_act.name, daily_logs
-                    ),
-                    start_status=f"{start_act.percent_complete}%",
-                    end_status=f"{end_act.percent_complete}%"
-                )
+            # Determine responsibility
+            responsibility = self._determine_responsibility(
+                cause, end_act, weather_data
+            )
 
-                total_delay += delay_days
-                if end_act.is_critical:
-                    critical_delay += delay_days
+            result.add_activity_delay(
+                activity_id=activity_id,
+                activity_name=end_act.name,
+                delay_days=delay_days,
+                cause=cause,
+                is_critical=activity_id in critical_ids,
+                responsibility=responsibility,
+                documented_in_logs=documented,
+                start_status=f"{start_act.percent_complete}%",
+                end_status=f"{end_act.percent_complete}%"
+            )
 
         result.total_delay_days = total_delay
         result.critical_delay_days = critical_delay
 
         # Analyze contemporary documentation quality
         result.metadata['documentation_score'] = self._assess_documentation_quality(
-            daily_logs, progress_reports, period_start, period_end
+            logs_df, progress_reports, period_start, period_end
         )
 
+        # Delay days by responsibility and by cause, from the delay table;
+        # shared by recommendations and summary
+        resp_totals = self._delay_totals(result, 'responsibility')
+        cause_totals = self._delay_totals(result, 'cause')
+
         # Generate recommendations
         result.recommendations = self._generate_recommendations(
-            result, period_schedules, daily_logs, progress_reports
+            result, daily_logs, progress_reports, resp_totals
         )
 
         # Create summary
-        result.summary = self._create_summary(result, period_start, period_end)
-
-        result.detailed_report = pd.DataFrame(result.delays_by_activity)
+        result.summary = partial(
+            self._create_summary,
+            result, period_start, period_end, resp_totals, cause_totals
+        )
 
         return result
 
@@ -220,9 +366,9 @@ class ContemporaneousAnalyzer(BaseDelayAnalyzer):
 
     def _determine_cause_from_records(self, activity_id: str, activity,
                                       period_start: datetime, period_end: datetime,
-                                      daily_logs: List[Dict],
-                                      progress_reports: List[Dict],
-                                      weather_data: Dict) -> str:
+                                      log_cause: Optional[str],
+                                      bad_weather_days: int,
+                                      reported_issue: Optional[Any]) -> str:
         """
         Determine delay cause from contemporary records
 
@@ -231,60 +377,51 @@ class ContemporaneousAnalyzer(BaseDelayAnalyzer):
             activity: Activity object
             period_start: Period start
             period_end: Period end
-            daily_logs: Daily logs
-            progress_reports: Progress reports
-            weather_data: Weather data
+            log_cause: Keyword cause of the first daily log within the period
+                that mentions the activity and names a cause, if any
+            bad_weather_days: Number of adverse weather days within the period
+            reported_issue: First progress report issue within the period
+                mentioning the activity, if any
 
         Returns:
             Identified cause
         """
-        # Check daily logs for mentions
-        activity_name_lower = activity.name.lower()
-
-        for log in daily_logs:
-            log_date = log.get('date')
-            if not log_date or not (period_start <= log_date <= period_end):
-                continue
-
-            log_text = str(log.get('notes', '')).lower()
-
-            # Check for specific causes mentioned
-            if activity_id.lower() in log_text or activity_name_lower in log_text:
-                if any(word in log_text for word in ['weather', 'rain', 'storm', 'wind']):
-                    return "Weather Delay"
-                elif any(word in log_text for word in ['rfi', 'clarification', 'design']):
-                    return "Design Issue"
-                elif any(word in log_text for word in ['material', 'delivery', 'supplier']):
-                    return "Material Delay"
-                elif any(word in log_text for word in ['labor', 'crew', 'manpower']):
-                    return "Labor Issue"
-                elif any(word in log_text for word in ['change', 'variation', 'extra']):
-                    return "Change Order"
+        # Check daily logs for specific causes mentioned
+        if log_cause:
+            return log_cause
 
         # Check weather data
-        if weather_data:
-            bad_weather_days = sum(
-                1 for date, conditions in weather_data.items()
-                if period_start <= date <= period_end
-                and conditions.get('adverse', False)
-            )
-            if bad_weather_days > 3:
-                return "Adverse Weather"
+        if bad_weather_days > 3:
+            return "Adverse Weather"
 
         # Check progress reports
-        for report in progress_reports:
-            report_date = report.get('date')
-            if not report_date or not (period_start <= report_date <= period_end):
-                continue
-
-            issues = report.get('issues', [])
-            for issue in issues:
-                if activity_id in str(issue) or activity.name in str(issue):
-                    return issue.get('type', 'Progress Issue')
+        if reported_issue is not None:
+            return reported_issue.get('type', 'Progress Issue')
 
         # Default
         return "Progress Delay"
 
+    def _count_adverse_weather_days(self, weather_data: Dict[datetime, Dict],
+                                    period_start: datetime, period_end: datetime) -> int:
+        """
+        Count the adverse weather days within the period
+
+        Args:
+            weather_data: Weather conditions by date
+            period_start: Period start
+            period_end: Period end
+
+        Returns:
+            Number of dates flagged as adverse
+        """
+        weather = pd.DataFrame.from_dict(weather_data, orient='index')
+        if 'adverse' not in weather:
+            return 0
+
+        adverse = weather['adverse']
+        in_period = (weather.index >= period_start) & (weather.index <= period_end)
+        return int((in_period & adverse.notna().to_numpy() & adverse.astype(bool).to_numpy()).sum())
+
     def _determine_responsibility(self, cause: str, activity, weather_data: Dict) -> str:
         """
         Determine responsibility for delay based on cause
@@ -319,19 +456,7 @@ class ContemporaneousAnalyzer(BaseDelayAnalyzer):
         else:
             return "To Be Determined"
 
-    def _is_documented_in_logs(self, activity_id: str, activity_name: str,
-                               daily_logs: List[Dict]) -> bool:
-        """Check if delay is documented in daily logs"""
-        activity_name_lower = activity_name.lower()
-
-        for log in daily_logs:
-            log_text = str(log.get('notes', '')).lower()
-            if activity_id.lower() in log_text or activity_name_lower in log_text:
-                return True
-
-        return False
-
-    def _assess_documentation_quality(self, daily_logs: List[Dict],
+    def _assess_documentation_quality(self, logs_df: pd.DataFrame,
                                       progress_reports: List[Dict],
                                       period_start: datetime,
                                       period_end: datetime) -> float:
@@ -339,7 +464,7 @@ class ContemporaneousAnalyzer(BaseDelayAnalyzer):
         Assess quality of contemporary documentation
 
         Args:
-            daily_logs: Daily logs
+            logs_df: Date and notes of each daily log
             progress_reports: Progress reports
             period_start: Period start
             period_end: Period end
@@ -352,7 +477,7 @@ class ContemporaneousAnalyzer(BaseDelayAnalyzer):
 
         # Daily logs coverage
         if period_days > 0:
-            log_coverage = min(100, (len(daily_logs) / period_days) * 100)
+            log_coverage = min(100, (len(logs_df) / period_days) * 100)
             score += log_coverage * 0.5
 
         # Progress reports
@@ -361,20 +486,44 @@ class ContemporaneousAnalyzer(BaseDelayAnalyzer):
         score += report_score * 0.3
 
         # Completeness (simplified - check if logs have key fields)
-        if daily_logs:
-            complete_logs = sum(
-                1 for log in daily_logs
-                if log.get('date') and log.get('notes')
-            )
-            completeness = (complete_logs / len(daily_logs)) * 100
+        if not logs_df.empty:
+            key_fields = logs_df.astype(object)
+            complete_logs = int((key_fields.notna() & key_fields.astype(bool)).all(axis=1).sum())
+            completeness = (complete_logs / len(logs_df)) * 100
             score += completeness * 0.2
 
         return min(100, score)
 
+    def _delay_totals(self, result: DelayAnalysisResult, column: str) -> pd.Series:
+        """
+        Total delay days per value of a delay column
+
+        Args:
+            result: Analysis result holding the activity delays
+            column: Column to group by (missing values count as 'Unknown')
+
+        Returns:
+            Series of delay days by value, largest first (ties keep first-seen
+            order)
+        """
+        report = result.detailed_report
+        if report.empty:
+            return pd.Series(dtype=float)
+
+        if column in report:
+            keys = report[column].astype(object).fillna('Unknown')
+        else:
+            keys = pd.Series('Unknown', index=report.index)
+        return (
+            report['delay_days']
+            .groupby(keys, sort=False).sum()
+            .sort_values(ascending=False, kind='stable')
+        )
+
     def _generate_recommendations(self, result: DelayAnalysisResult,
-                                  period_schedules: Dict[datetime, Schedule],
                                   daily_logs: List[Dict],
-                                  progress_reports: List[Dict]) -> List[str]:
+                                  progress_reports: List[Dict],
+                                  resp_totals: pd.Series) -> List[str]:
         """Generate recommendations"""
         recommendations = []
 
@@ -392,17 +541,10 @@ class ContemporaneousAnalyzer(BaseDelayAnalyzer):
             )
 
         # Responsibility analysis
-        if result.delays_by_activity:
-            responsibilities = {}
-            for delay in result.delays_by_activity:
-                resp = delay.get('responsibility', 'Unknown')
-                responsibilities[resp] = responsibilities.get(resp, 0) + delay['delay_days']
-
-            if responsibilities:
-                main_resp = max(responsibilities.items(), key=lambda x: x[1])
-                recommendations.append(
-                    f"Primary responsibility: {main_resp[0]} ({main_resp[1]:.1f} days)"
-                )
+        if not resp_totals.empty:
+            recommendations.append(
+                f"Primary responsibility: {resp_totals.index[0]} ({resp_totals.iloc[0]:.1f} days)"
+            )
 
         # Documentation gaps
         undocumented = [
@@ -418,7 +560,8 @@ class ContemporaneousAnalyzer(BaseDelayAnalyzer):
         return recommendations
 
     def _create_summary(self, result: DelayAnalysisResult,
-                       period_start: datetime, period_end: datetime) -> str:
+                       period_start: datetime, period_end: datetime,
+                       resp_totals: pd.Series, cause_totals: pd.Series) -> str:
         """Create summary text"""
         summary = f"""
 Contemporaneous Period Analysis Summary:
@@ -430,18 +573,11 @@ Documentation Quality: {result.metadata.get('documentation_score', 0):.0f}/100
 
 Delays by Responsibility:
 """
-        # Group by responsibility
-        resp_totals = {}
-        for delay in result.delays_by_activity:
-            resp = delay.get('responsibility', 'Unknown')
-            resp_totals[resp] = resp_totals.get(resp, 0) + delay['delay_days']
-
-        for resp, days in sorted(resp_totals.items(), key=lambda x: x[1], reverse=True):
+        for resp, days in resp_totals.items():
             summary += f"  - {resp}: {days:.1f} days\n"
 
         summary += "\nTop Delay Causes:\n"
-        for cause, days in sorted(result.delays_by_cause.items(),
-                                 key=lambda x: x[1], reverse=True)[:5]:
+        for cause, days in cause_totals.head(5).items():
             summary += f"  - {cause}: {days:.1f} days\n"
 
         return summary
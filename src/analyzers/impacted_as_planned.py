@@ -3,12 +3,99 @@ Impacted As-Planned Analysis Method
 Shows the effect of delay events on the original schedule
 """
 from typing import Dict, Any, List
-import pandas as pd
 from datetime import datetime, timedelta
-import copy
+from functools import partial
+from collections import deque
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from .base_analyzer import BaseDelayAnalyzer, DelayAnalysisResult, DelayAnalyzerFactory
-from ..utils.schedule_utils import Schedule, ScheduleActivity
+from ..utils.schedule_utils import Schedule
+
+
+# Dates are snapshotted as int64 microseconds since the epoch; NaT is the minimum int64
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_NAT = np.iinfo(np.int64).min
+
+
+def _topological_positions(succ_indptr: np.ndarray, succ_indices: np.ndarray) -> np.ndarray:
+    """
+    Order activity positions so that each comes after its predecessors
+
+    Kahn's algorithm over the CSR successor graph; positions caught in a
+    cycle are appended at the end in their original order.
+
+    Args:
+        succ_indptr: CSR row pointers of the successor graph
+        succ_indices: CSR successor positions
+
+    Returns:
+        int64 array of positions
+    """
+    n = len(succ_indptr) - 1
+    in_degree = np.bincount(succ_indices, minlength=n)
+    queue = deque(np.flatnonzero(in_degree == 0).tolist())
+    in_degree = in_degree.tolist()
+    order = []
+    while queue:
+        i = queue.popleft()
+        order.append(i)
+        for j in succ_indices[succ_indptr[i]:succ_indptr[i + 1]].tolist():
+            in_degree[j] -= 1
+            if in_degree[j] == 0:
+                queue.append(j)
+
+    if len(order) < n:
+        placed = set(order)
+        order.extend(i for i in range(n) if i not in placed)
+
+    return np.array(order, dtype=np.int64)
+
+
+def _propagate_delays_python(order, succ_indptr, succ_indices, start, finish, push, extend):
+    """
+    Forward sweep computing how far each activity is pushed by inserted delays
+
+    An activity's successor is pushed when it starts no later than the
+    activity's impacted finish, by the activity's own shift plus its pushed
+    delay. A successor reached along several paths takes the largest push,
+    instead of being moved once per path.
+
+    Args:
+        order: Positions in topological order
+        succ_indptr: CSR row pointers of the successor graph
+        succ_indices: CSR successor positions
+        start: Start dates (int64 microseconds, NaT allowed)
+        finish: Finish dates (int64 microseconds, NaT allowed)
+        push: Delay each activity passes on to its successors
+        extend: Delay added to each activity's own finish
+
+    Returns:
+        int64 array of shifts applied to start and finish dates
+    """
+    shift = np.zeros(len(start), dtype=np.int64)
+    for i in order:
+        out = shift[i] + push[i]
+        if out == 0 or finish[i] == _NAT:
+            continue
+        impacted_finish = finish[i] + shift[i] + extend[i]
+        for j in succ_indices[succ_indptr[i]:succ_indptr[i + 1]]:
+            if start[j] != _NAT and start[j] + shift[j] <= impacted_finish and out > shift[j]:
+                shift[j] = out
+    return shift
+
+
+if NUMBA_AVAILABLE:
+    # Same loop compiled to native code; cache=True keeps the build across runs
+    _propagate_delays = njit(cache=True)(_propagate_delays_python)
+else:
+    _propagate_delays = _propagate_delays_python
 
 
 @DelayAnalyzerFactory.register
@@ -18,11 +105,11 @@ class ImpactedAsPlannedAnalyzer(BaseDelayAnalyzer):
     to show their impact on the project completion
     """
 
+    name = "Impacted As-Planned"
+    description = "Inserts specific delay events into the baseline schedule to demonstrate their impact on project completion"
+
     def __init__(self):
-        super().__init__(
-            name="Impacted As-Planned",
-            description="Inserts specific delay events into the baseline schedule to demonstrate their impact on project completion"
-        )
+        super().__init__()
         self.required_inputs = ['baseline_schedule', 'delay_events']
         self.optional_inputs = ['recompute_logic']
 
@@ -80,45 +167,42 @@ class ImpactedAsPlannedAnalyzer(BaseDelayAnalyzer):
             total_impact = (impacted_finish - baseline_finish).days
             result.total_delay_days = max(0, total_impact)
 
-        # Analyze each delay event
-        for event in delay_events:
-            activity_id = event['activity_id']
-            delay_days = event['delay_days']
-            cause = event.get('cause', 'Delay Event')
-
-            activity = baseline.activities.get(activity_id)
-            if not activity:
-                continue
-
-            # Calculate impact on critical path
-            is_on_critical = activity.is_critical
-            impact_multiplier = self._calculate_impact_multiplier(
-                activity, baseline, delay_days
-            )
+        # Analyze each delay event on a known activity
+        events = [event for event in delay_events if baseline.activities.get(event['activity_id'])]
+        activities = [baseline.activities[event['activity_id']] for event in events]
+        delay_days = [event['delay_days'] for event in events]
+        critical_ids = baseline.critical_ids
+        is_on_critical = [event['activity_id'] in critical_ids for event in events]
+
+        # Calculate impact on critical path
+        impact_multipliers = self._calculate_impact_multipliers(
+            np.array([activity.total_float for activity in activities], dtype=np.float64),
+            np.array(delay_days, dtype=np.float64),
+            np.array(is_on_critical, dtype=bool)
+        )
 
-            result.add_activity_delay(
-                activity_id=activity_id,
-                activity_name=activity.name,
-                delay_days=delay_days,
-                cause=cause,
-                is_critical=is_on_critical,
-                event_date=event.get('event_date'),
-                impact_multiplier=impact_multiplier,
-                projected_impact=delay_days * impact_multiplier
-            )
+        result.add_activity_delays(
+            activity_id=[event['activity_id'] for event in events],
+            activity_name=[activity.name for activity in activities],
+            delay_days=delay_days,
+            cause=[event.get('cause', 'Delay Event') for event in events],
+            is_critical=is_on_critical,
+            event_date=[event.get('event_date') for event in events],
+            impact_multiplier=impact_multipliers.tolist(),
+            projected_impact=(np.array(delay_days, dtype=np.float64) * impact_multipliers).tolist()
+        )
 
-            if is_on_critical:
-                result.critical_delay_days += delay_days
+        result.critical_delay_days += sum(
+            days for days, critical in zip(delay_days, is_on_critical) if critical
+        )
 
         # Generate recommendations
         result.recommendations = self._generate_recommendations(result, baseline, impacted_schedule)
 
         # Create summary
-        result.summary = self._create_summary(result, baseline_finish, impacted_finish)
+        result.summary = partial(self._create_summary, result, baseline_finish, impacted_finish)
 
         # Create detailed report
-        result.detailed_report = pd.DataFrame(result.delays_by_activity)
-
         return result
 
     def get_suggestions(self, **kwargs) -> List[str]:
@@ -127,10 +211,8 @@ class ImpactedAsPlannedAnalyzer(BaseDelayAnalyzer):
 
         if 'baseline_schedule' in kwargs:
             baseline = kwargs['baseline_schedule']
-            critical_activities = [a for a in baseline.activities.values() if a.is_critical]
-
             suggestions.append(
-                f"💡 Critical path has {len(critical_activities)} activities. "
+                f"💡 Critical path has {len(baseline.critical_ids)} activities. "
                 "Delays to these will directly impact project completion."
             )
 
@@ -165,6 +247,10 @@ class ImpactedAsPlannedAnalyzer(BaseDelayAnalyzer):
         """
         Create impacted schedule by inserting delay events
 
+        The delays are applied to array snapshots of the baseline dates;
+        only activities whose dates or duration change are copied into the
+        impacted schedule, the rest are shared with the baseline.
+
         Args:
             baseline: Baseline schedule
             delay_events: List of delay events
@@ -172,26 +258,52 @@ class ImpactedAsPlannedAnalyzer(BaseDelayAnalyzer):
         Returns:
             Impacted schedule
         """
-        # Deep copy baseline
-        impacted = copy.deepcopy(baseline)
+        ids, index, start, finish, succ_indptr, succ_indices = baseline.to_soa()
+        original_start = start.copy()
+        original_finish = finish.copy()
+
+        # Delay pushed by each delayed activity, and the part of it that
+        # extends the activity itself (only when it has both dates)
+        push = np.zeros(len(ids), dtype=np.int64)
+        extend = np.zeros(len(ids), dtype=np.int64)
+        added_duration = {}
 
-        # Apply each delay event
         for event in delay_events:
             activity_id = event['activity_id']
             delay_days = event['delay_days']
 
-            if activity_id not in impacted.activities:
+            i = index.get(activity_id)
+            if i is None:
                 continue
-
-            activity = impacted.activities[activity_id]
-
-            # Extend duration or delay start/finish
-            if activity.start_date and activity.finish_date:
-                activity.finish_date = activity.finish_date + timedelta(days=delay_days)
-                activity.duration += delay_days
-
-            # Update successors (simplified - full CPM would be more complex)
-            self._propagate_delay(impacted, activity_id, delay_days)
+            delay_us = timedelta(days=delay_days) // _ONE_MICROSECOND
+
+            push[i] += delay_us
+            if start[i] != _NAT and finish[i] != _NAT:
+                extend[i] += delay_us
+                added_duration[activity_id] = added_duration.get(activity_id, 0) + delay_days
+
+        # Update successors (simplified - full CPM would be more complex)
+        order = _topological_positions(succ_indptr, succ_indices)
+        shift = _propagate_delays(order, succ_indptr, succ_indices, start, finish, push, extend)
+
+        has_start = start != _NAT
+        has_finish = finish != _NAT
+        start[has_start] += shift[has_start]
+        finish[has_finish] += shift[has_finish] + extend[has_finish]
+
+        # Shallow copy: only changed activities get their own copy
+        impacted = baseline.clone(copy_activities=False)
+
+        changed = np.flatnonzero((start != original_start) | (finish != original_finish))
+        for i in sorted(set(changed.tolist()) | {index[a] for a in added_duration}):
+            activity = baseline.activities[ids[i]].clone()
+            if start[i] != original_start[i]:
+                activity.start_date = _EPOCH + timedelta(microseconds=int(start[i]))
+            if finish[i] != original_finish[i]:
+                activity.finish_date = _EPOCH + timedelta(microseconds=int(finish[i]))
+            if ids[i] in added_duration:
+                activity.duration += added_duration[ids[i]]
+            impacted.activities[ids[i]] = activity
 
         # Update project finish
         if impacted.activities:
@@ -204,56 +316,29 @@ class ImpactedAsPlannedAnalyzer(BaseDelayAnalyzer):
 
         return impacted
 
-    def _propagate_delay(self, schedule: Schedule, activity_id: str, delay_days: float):
-        """
-        Propagate delay to successor activities (simplified)
-
-        Args:
-            schedule: Schedule to update
-            activity_id: ID of delayed activity
-            delay_days: Days of delay
-        """
-        activity = schedule.activities[activity_id]
-
-        for successor_id in activity.successors:
-            if successor_id not in schedule.activities:
-                continue
-
-            successor = schedule.activities[successor_id]
-
-            # Only propagate if successor starts after this activity finishes (FS relationship)
-            if successor.start_date and activity.finish_date:
-                if successor.start_date <= activity.finish_date:
-                    successor.start_date = successor.start_date + timedelta(days=delay_days)
-                    if successor.finish_date:
-                        successor.finish_date = successor.finish_date + timedelta(days=delay_days)
-
-                    # Recursively propagate (be careful of cycles)
-                    self._propagate_delay(schedule, successor_id, delay_days)
-
-    def _calculate_impact_multiplier(self, activity: ScheduleActivity,
-                                     schedule: Schedule, delay_days: float) -> float:
+    def _calculate_impact_multipliers(self, total_float: np.ndarray, delay_days: np.ndarray,
+                                      is_critical: np.ndarray) -> np.ndarray:
         """
-        Calculate impact multiplier (how delay affects project)
+        Calculate impact multipliers (how each delay affects project)
 
         Args:
-            activity: Delayed activity
-            schedule: Schedule
-            delay_days: Days of delay
+            total_float: Total float of each delayed activity
+            delay_days: Days of delay per event
+            is_critical: Whether each delayed activity is critical
 
         Returns:
-            Impact multiplier (1.0 = full impact on project)
+            Impact multipliers (1.0 = full impact on project)
         """
-        if activity.is_critical:
-            return 1.0  # Critical activities have 1:1 impact
+        # Non-critical: partial impact once the delay exceeds the float
+        # (errstate: those entries are overridden below)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            impact = np.clip((delay_days - total_float) / delay_days, 0, 1)
 
-        # Non-critical: impact depends on float
-        if activity.total_float > delay_days:
-            return 0.0  # No impact if delay absorbed by float
+        # No impact if delay absorbed by float
+        impact = np.where(total_float > delay_days, 0.0, impact)
 
-        # Partial impact
-        impact = (delay_days - activity.total_float) / delay_days
-        return max(0, min(1, impact))
+        # Critical activities have 1:1 impact
+        return np.where(is_critical, 1.0, impact)
 
     def _generate_recommendations(self, result: DelayAnalysisResult,
                                   baseline: Schedule,
@@ -288,7 +373,7 @@ class ImpactedAsPlannedAnalyzer(BaseDelayAnalyzer):
         summary = f"""
 Impacted As-Planned Analysis Summary:
 
-Delay Events Analyzed: {len(result.delays_by_activity)}
+Delay Events Analyzed: {result.delay_count}
 Total Project Impact: {result.total_delay_days:.1f} days
 Critical Delays: {result.critical_delay_days:.1f} days
 
@@ -2,15 +2,197 @@
 Time Impact Analysis (TIA) Method
 Inserts delays at specific points in time and measures forward impact
 """
-from typing import Dict, Any, List
-import pandas as pd
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-import copy
+from functools import partial
+from bisect import bisect_right
+import heapq
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from .base_analyzer import BaseDelayAnalyzer, DelayAnalysisResult, DelayAnalyzerFactory
 from ..utils.schedule_utils import Schedule
 
 
+# Schedule.to_soa dates are int64 microseconds since the epoch; NaT is the minimum int64
+_EPOCH = datetime(1970, 1, 1)
+_NAT = np.iinfo(np.int64).min
+_US_PER_DAY = 86_400_000_000
+
+
+def _predecessor_csr(succ_indptr: np.ndarray, succ_indices: np.ndarray) -> tuple:
+    """
+    Transpose a CSR successor graph into a CSR predecessor graph
+
+    Args:
+        succ_indptr: CSR row pointers of the successor graph
+        succ_indices: CSR successor positions
+
+    Returns:
+        Tuple of (pred_indptr, pred_indices); each position's predecessors
+        are listed in ascending position order
+    """
+    n = len(succ_indptr) - 1
+    sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(succ_indptr))
+    order = np.argsort(succ_indices, kind='stable')
+    pred_indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(succ_indices, minlength=n), out=pred_indptr[1:])
+    return pred_indptr, sources[order]
+
+
+def _forward_pass_python(pred_indptr, pred_indices, start, finish):
+    """
+    Pull dates forward from the first activity, in position order
+
+    Positions must be in topological order with the delayed activity first.
+    Each activity reached from the first one starts no earlier than the
+    latest finish among its reached predecessors; when that moves it by at
+    least a whole day, its start is set to that finish and its finish moves
+    by the same whole number of days. Every activity is visited once, after
+    all of its predecessors.
+
+    Args:
+        pred_indptr: CSR row pointers of the predecessor graph
+        pred_indices: CSR predecessor positions
+        start: Start dates (int64 microseconds, NaT allowed), updated in place
+        finish: Finish dates (int64 microseconds, NaT allowed), updated in place
+    """
+    reached = np.zeros(len(start), dtype=np.bool_)
+    if len(start):
+        reached[0] = True
+    for j in range(1, len(start)):
+        latest = _NAT
+        for k in range(pred_indptr[j], pred_indptr[j + 1]):
+            i = pred_indices[k]
+            if reached[i]:
+                reached[j] = True
+                if finish[i] > latest:
+                    latest = finish[i]
+        if latest != _NAT and start[j] != _NAT and start[j] < latest:
+            delay = (latest - start[j]) // _US_PER_DAY
+            if delay > 0:
+                start[j] = latest
+                if finish[j] != _NAT:
+                    finish[j] += delay * _US_PER_DAY
+
+
+if NUMBA_AVAILABLE:
+    _forward_pass_kernel = njit(cache=True)(_forward_pass_python)
+else:
+    _forward_pass_kernel = _forward_pass_python
+
+
+class _FinishHeap:
+    """
+    Latest activity finish of a schedule, maintained incrementally
+
+    A max-heap of finish dates with lazy deletion: changed finishes are
+    pushed as new entries and outdated ones are discarded when they reach
+    the top, so each query costs O(log N) instead of a scan of the schedule.
+    """
+
+    def __init__(self, schedule: Schedule):
+        self.schedule = schedule
+        self._heap = []
+        self._pushed = 0
+        for activity_id, activity in schedule.activities.items():
+            if activity.finish_date is not None:
+                self._heap.append(self._entry(activity_id, activity.finish_date))
+        heapq.heapify(self._heap)
+
+    def _entry(self, activity_id: str, finish_date: datetime) -> tuple:
+        self._pushed += 1
+        return (-self._key(finish_date), self._pushed, activity_id)
+
+    @staticmethod
+    def _key(finish_date: datetime) -> int:
+        return (finish_date - _EPOCH) // timedelta(microseconds=1)
+
+    def update(self, activity_id: str):
+        """
+        Record a change to an activity's finish date
+
+        Args:
+            activity_id: Activity whose finish date changed
+        """
+        finish_date = self.schedule.activities[activity_id].finish_date
+        if finish_date is not None:
+            heapq.heappush(self._heap, self._entry(activity_id, finish_date))
+
+    def max(self, default: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Get the latest finish date of the schedule
+
+        Args:
+            default: Value returned when no activity has a finish date
+
+        Returns:
+            Latest activity finish date, or default
+        """
+        activities = self.schedule.activities
+        while self._heap:
+            key, _, activity_id = self._heap[0]
+            activity = activities.get(activity_id)
+            if (activity is not None and activity.finish_date is not None
+                    and self._key(activity.finish_date) == -key):
+                return activity.finish_date
+            heapq.heappop(self._heap)
+        return default
+
+
+class _WorkingSchedule:
+    """
+    Copy-on-write view of a schedule that TIA edits in place
+
+    The activities dict starts out sharing the source schedule's activity
+    objects; an activity is cloned the first time one of its fields is
+    set, so only edited activities are ever copied. Rewinding to the
+    source just puts the source's objects back, and the finish dates are
+    tracked in a _FinishHeap.
+    """
+
+    def __init__(self, source: Schedule):
+        self.source = source
+        self.schedule = source.clone(copy_activities=False)
+        self.finish_heap = _FinishHeap(self.schedule)
+        self._project_finish = self.schedule.project_finish
+        self._copied = set()
+
+    def set(self, activity_id: str, field: str, value):
+        """
+        Overwrite an activity field, copying the activity on first write
+
+        Args:
+            activity_id: Activity to edit
+            field: Attribute name (start_date, finish_date or duration)
+            value: New value
+        """
+        if activity_id not in self._copied:
+            # Dates and durations only, so the link lists stay shared
+            self.schedule.activities[activity_id] = self.source.activities[activity_id].clone(
+                copy_links=False
+            )
+            self._copied.add(activity_id)
+        setattr(self.schedule.activities[activity_id], field, value)
+        if field == 'finish_date':
+            self.finish_heap.update(activity_id)
+
+    def rollback(self):
+        """Undo every edit, restoring the source schedule's activities"""
+        activities = self.schedule.activities
+        for activity_id in self._copied:
+            activities[activity_id] = self.source.activities[activity_id]
+            self.finish_heap.update(activity_id)
+        self._copied.clear()
+        self.schedule.project_finish = self._project_finish
+        self.schedule.mark_dirty(links=False)
+
+
 @DelayAnalyzerFactory.register
 class TimeImpactAnalyzer(BaseDelayAnalyzer):
     """
@@ -18,11 +200,11 @@ class TimeImpactAnalyzer(BaseDelayAnalyzer):
     at the time they occurred and measures their forward impact
     """
 
+    name = "Time Impact Analysis (TIA)"
+    description = "Measures the time impact of specific delay events by inserting them into the contemporary schedule and calculating forward impacts"
+
     def __init__(self):
-        super().__init__(
-            name="Time Impact Analysis (TIA)",
-            description="Measures the time impact of specific delay events by inserting them into the contemporary schedule and calculating forward impacts"
-        )
+        super().__init__()
         self.required_inputs = ['baseline_schedule', 'delay_events']
         self.optional_inputs = ['updated_schedules']
 
@@ -66,7 +248,6 @@ class TimeImpactAnalyzer(BaseDelayAnalyzer):
         baseline: Schedule = kwargs['baseline_schedule']
         delay_events: List[Dict] = kwargs['delay_events']
         updated_schedules: Dict[datetime, Schedule] = kwargs.get('updated_schedules', {})
-        add_fragnets = kwargs.get('add_fragnets', True)
 
         result = DelayAnalysisResult(self.name)
         result.metadata['baseline_project'] = baseline.project_name
@@ -74,8 +255,15 @@ class TimeImpactAnalyzer(BaseDelayAnalyzer):
         # Sort events by date
         sorted_events = sorted(delay_events, key=lambda x: x.get('event_date', datetime.now()))
 
-        # Analyze each delay event sequentially
-        current_schedule = copy.deepcopy(baseline)
+        # Contemporary schedules in date order, for binary search by event date
+        schedule_dates = sorted(updated_schedules)
+        contemporary_schedules = [updated_schedules[date] for date in schedule_dates]
+
+        # Analyze each delay event sequentially on one copy-on-write view,
+        # which is rewound rather than rebuilt when an event restarts from
+        # the schedule it views
+        working = _WorkingSchedule(baseline)
+        current_schedule = working.schedule
         cumulative_impact = 0
 
         for i, event in enumerate(sorted_events):
@@ -86,22 +274,21 @@ class TimeImpactAnalyzer(BaseDelayAnalyzer):
 
             # Use contemporary schedule if available
             if event_date and updated_schedules:
-                contemporary = self._get_contemporary_schedule(event_date, updated_schedules)
-                if contemporary:
-                    current_schedule = copy.deepcopy(contemporary)
+                contemporary = self._get_contemporary_schedule(
+                    event_date, schedule_dates, contemporary_schedules
+                )
+                if contemporary is working.source:
+                    working.rollback()
+                elif contemporary:
+                    working = _WorkingSchedule(contemporary)
+            current_schedule = working.schedule
 
             # Measure impact before inserting delay
             before_finish = current_schedule.project_finish
 
-            # Insert delay (with fragnet if requested)
-            if add_fragnets:
-                current_schedule = self._insert_delay_with_fragnet(
-                    current_schedule, activity_id, delay_days, event_date
-                )
-            else:
-                current_schedule = self._insert_delay_simple(
-                    current_schedule, activity_id, delay_days
-                )
+            # Insert delay
+            self._insert_delay(working, activity_id, delay_days)
+            current_schedule.mark_dirty(links=False)
 
             # Measure impact after inserting delay
             after_finish = current_schedule.project_finish
@@ -138,9 +325,7 @@ class TimeImpactAnalyzer(BaseDelayAnalyzer):
         result.recommendations = self._generate_recommendations(result, baseline, current_schedule)
 
         # Create summary
-        result.summary = self._create_summary(result, baseline, current_schedule)
-
-        result.detailed_report = pd.DataFrame(result.delays_by_activity)
+        result.summary = partial(self._create_summary, result, baseline, current_schedule)
 
         return result
 
@@ -184,137 +369,82 @@ class TimeImpactAnalyzer(BaseDelayAnalyzer):
         return suggestions
 
     def _get_contemporary_schedule(self, event_date: datetime,
-                                   schedules: Dict[datetime, Schedule]) -> Schedule:
+                                   schedule_dates: List[datetime],
+                                   schedules: List[Schedule]) -> Optional[Schedule]:
         """
         Find the contemporary schedule closest to event date
 
         Args:
             event_date: Date of delay event
-            schedules: Dictionary of dated schedules
+            schedule_dates: Sorted dates of the contemporary schedules
+            schedules: Schedules matching schedule_dates
 
         Returns:
             Contemporary schedule or None
         """
-        if not schedules:
-            return None
-
         # Find closest schedule before or at event date
-        valid_dates = [d for d in schedules.keys() if d <= event_date]
-        if not valid_dates:
-            return None
-
-        closest_date = max(valid_dates)
-        return schedules[closest_date]
+        i = bisect_right(schedule_dates, event_date) - 1
+        return schedules[i] if i >= 0 else None
 
-    def _insert_delay_with_fragnet(self, schedule: Schedule, activity_id: str,
-                                   delay_days: float, event_date: datetime = None) -> Schedule:
+    def _insert_delay(self, working: _WorkingSchedule, activity_id: str,
+                      delay_days: float):
         """
-        Insert delay using fragnet approach
-
-        Args:
-            schedule: Schedule to modify
-            activity_id: Activity to delay
-            delay_days: Days of delay
-            event_date: When delay occurred
-
-        Returns:
-            Modified schedule
-        """
-        if activity_id not in schedule.activities:
-            return schedule
-
-        activity = schedule.activities[activity_id]
+        Insert delay by extending the activity and propagating it forward
 
-        # Create fragnet activity (simplified)
-        fragnet_id = f"DELAY_{activity_id}_{event_date.strftime('%Y%m%d') if event_date else 'TIA'}"
-
-        # Insert delay by extending activity
-        if activity.finish_date:
-            activity.finish_date = activity.finish_date + timedelta(days=delay_days)
-        activity.duration += delay_days
-
-        # Propagate forward
-        self._forward_pass(schedule, activity_id)
-
-        return schedule
-
-    def _insert_delay_simple(self, schedule: Schedule, activity_id: str,
-                            delay_days: float) -> Schedule:
-        """
-        Simple delay insertion without fragnet
+        The fragnet option only changes how the delay is presented; the
+        activity is extended in place either way.
 
         Args:
-            schedule: Schedule to modify
+            working: Working schedule to modify
             activity_id: Activity to delay
             delay_days: Days of delay
-
-        Returns:
-            Modified schedule
         """
+        schedule = working.schedule
         if activity_id not in schedule.activities:
-            return schedule
+            return
 
         activity = schedule.activities[activity_id]
 
         # Extend activity duration and finish
         if activity.finish_date:
-            activity.finish_date = activity.finish_date + timedelta(days=delay_days)
-        activity.duration += delay_days
-
-        # Update project finish
-        self._forward_pass(schedule, activity_id)
+            working.set(activity_id, 'finish_date', activity.finish_date + timedelta(days=delay_days))
+        working.set(activity_id, 'duration', activity.duration + delay_days)
 
-        return schedule
+        # Propagate forward
+        self._forward_pass(working, activity_id)
 
-    def _forward_pass(self, schedule: Schedule, start_activity_id: str):
+    def _forward_pass(self, working: _WorkingSchedule, start_activity_id: str):
         """
         Perform forward pass from starting activity
 
         Args:
-            schedule: Schedule to update
+            working: Working schedule to update
             start_activity_id: Activity to start from
         """
-        # Simplified forward pass
-        visited = set()
-        queue = [start_activity_id]
-
-        while queue:
-            current_id = queue.pop(0)
-            if current_id in visited:
-                continue
-            visited.add(current_id)
-
-            if current_id not in schedule.activities:
-                continue
-
-            current = schedule.activities[current_id]
-
-            # Update successors
-            for succ_id in current.successors:
-                if succ_id not in schedule.activities:
-                    continue
-
-                successor = schedule.activities[succ_id]
-
-                # Update early dates based on predecessor
-                if current.finish_date:
-                    if not successor.start_date or successor.start_date < current.finish_date:
-                        delay = (current.finish_date - successor.start_date).days if successor.start_date else 0
-                        if delay > 0:
-                            successor.start_date = current.finish_date
-                            if successor.finish_date:
-                                successor.finish_date = successor.finish_date + timedelta(days=delay)
-
-                queue.append(succ_id)
+        schedule = working.schedule
+        # Simplified forward pass over the activities downstream of the
+        # start, in topological order so each is visited after all of its
+        # predecessors
+        if start_activity_id in schedule.activities:
+            order = schedule.topological_order()
+            downstream = order[order.index(start_activity_id):]
+            ids, _, start, finish, succ_indptr, succ_indices = schedule.to_soa(downstream)
+            pred_indptr, pred_indices = _predecessor_csr(succ_indptr, succ_indices)
+            original_start = start.copy()
+            original_finish = finish.copy()
+
+            _forward_pass_kernel(pred_indptr, pred_indices, start, finish)
+
+            # Write back only the dates that moved
+            for i in np.flatnonzero((start != original_start) | (finish != original_finish)).tolist():
+                if start[i] != original_start[i]:
+                    working.set(ids[i], 'start_date', _EPOCH + timedelta(microseconds=int(start[i])))
+                if finish[i] != original_finish[i]:
+                    working.set(ids[i], 'finish_date', _EPOCH + timedelta(microseconds=int(finish[i])))
 
         # Update project finish
         if schedule.activities:
-            max_finish = max(
-                (a.finish_date for a in schedule.activities.values()
-                 if a.finish_date is not None),
-                default=schedule.project_finish
-            )
-            schedule.project_finish = max_finish
+            schedule.project_finish = working.finish_heap.max(default=schedule.project_finish)
 
     def _generate_recommendations(self, result: DelayAnalysisResult,
                                   baseline: Schedule,
@@ -336,7 +466,7 @@ class TimeImpactAnalyzer(BaseDelayAnalyzer):
             )
 
         # Sequential analysis
-        if len(result.delays_by_activity) > 1:
+        if result.delay_count > 1:
             recommendations.append(
                 "Time impact varies by sequence. Earlier delays may have greater impact."
             )
@@ -353,7 +483,7 @@ class TimeImpactAnalyzer(BaseDelayAnalyzer):
         summary = f"""
 Time Impact Analysis Summary:
 
-Delay Events Analyzed: {len(result.delays_by_activity)}
+Delay Events Analyzed: {result.delay_count}
 Cumulative Time Impact: {result.total_delay_days:.1f} days
 Critical Path Impact: {result.critical_delay_days:.1f} days
 
@@ -362,9 +492,8 @@ Final Completion: {final_finish.strftime('%Y-%m-%d') if final_finish else 'Unkno
 
 Events by Impact:
 """
-        sorted_delays = sorted(result.delays_by_activity,
-                             key=lambda x: x.get('time_impact_days', 0),
-                             reverse=True)[:5]
+        sorted_delays = heapq.nlargest(5, result.delays_by_activity,
+                                       key=lambda x: x.get('time_impact_days', 0))
 
         for delay in sorted_delays:
             summary += f"  - {delay['activity_name']}: {delay.get('time_impact_days', 0):.1f} day impact\n"
@@ -5,12 +5,180 @@ Divides project into time windows and analyzes delays in each window
 from typing import Dict, Any, List, Tuple
 import pandas as pd
 from datetime import datetime, timedelta
-import copy
+from functools import partial, lru_cache
+from bisect import bisect_right
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
 
 from .base_analyzer import BaseDelayAnalyzer, DelayAnalysisResult, DelayAnalyzerFactory
 from ..utils.schedule_utils import Schedule
 
 
+# Finish dates reach the kernel as int64 microseconds; NaT is the minimum int64
+_NAT = np.iinfo(np.int64).min
+_US_PER_DAY = 86_400_000_000
+
+# Window delay causes by kernel cause code
+_WINDOW_CAUSES = ('Slow Progress', 'Duration Extension', 'Schedule Slip')
+
+# Window count from which windows are compared in parallel
+_PARALLEL_MIN_WINDOWS = 4
+
+# Activity fields tabulated per update by WindowsAnalyzer._build_update_frames
+_UPDATE_FIELDS = ('finish', 'position', 'percent_complete', 'duration', 'is_critical', 'is_finished')
+
+
+def _day(value) -> str:
+    """Format a date or datetime as YYYY-MM-DD without going through strftime"""
+    return (value.date() if isinstance(value, datetime) else value).isoformat()
+
+
+def _window_kernel_python(pct_start, pct_end, dur_start, dur_end, finish_start,
+                          finish_end, is_critical, is_finished, include_completed):
+    """
+    Compute the finish date slip of every activity between two updates
+
+    An activity is delayed when it has a finish date in both updates and
+    its finish moved later by at least one whole day. Its cause is slow
+    progress when less than 10 points of progress were made, a duration
+    extension when its duration grew, and a schedule slip otherwise.
+
+    Args:
+        pct_start: Percent complete in the start update
+        pct_end: Percent complete in the end update
+        dur_start: Duration in the start update
+        dur_end: Duration in the end update
+        finish_start: Finish dates in the start update (int64 microseconds, NaT allowed)
+        finish_end: Finish dates in the end update (int64 microseconds, NaT allowed)
+        is_critical: Criticality in the end update
+        is_finished: Completion in the end update
+        include_completed: Whether activities finished in the end update count
+
+    Returns:
+        Tuple of (delay days, cause codes into _WINDOW_CAUSES, total delay,
+        critical delay); delay days are 0 for activities that were not delayed
+    """
+    n = len(finish_end)
+    delay_days = np.zeros(n, dtype=np.int64)
+    cause_codes = np.zeros(n, dtype=np.int8)
+    total_delay = 0
+    critical_delay = 0
+    for i in range(n):
+        if finish_start[i] == _NAT or finish_end[i] == _NAT:
+            continue
+        if not include_completed and is_finished[i]:
+            continue
+        delay = (finish_end[i] - finish_start[i]) // _US_PER_DAY
+        if delay <= 0:
+            continue
+
+        delay_days[i] = delay
+        if pct_end[i] < pct_start[i] + 10:
+            cause_codes[i] = 0
+        elif dur_end[i] > dur_start[i]:
+            cause_codes[i] = 1
+        else:
+            cause_codes[i] = 2
+
+        total_delay += delay
+        if is_critical[i]:
+            critical_delay += delay
+    return delay_days, cause_codes, total_delay, critical_delay
+
+
+def _window_kernel_numpy(pct_start, pct_end, dur_start, dur_end, finish_start,
+                         finish_end, is_critical, is_finished, include_completed):
+    """
+    Branchless NumPy equivalent of _window_kernel_python
+
+    Used when numba is not installed: the per-activity branches become
+    boolean masks and the totals become array reductions.
+
+    Args:
+        Same as _window_kernel_python
+
+    Returns:
+        Same as _window_kernel_python
+    """
+    valid = (finish_start != _NAT) & (finish_end != _NAT)
+    delay = np.zeros(len(finish_end), dtype=np.int64)
+    delay[valid] = (finish_end[valid] - finish_start[valid]) // _US_PER_DAY
+
+    delayed = (delay > 0) & (include_completed | ~is_finished)
+    delay_days = np.where(delayed, delay, 0)
+    cause_codes = np.where(
+        delayed,
+        np.select([pct_end < pct_start + 10, dur_end > dur_start], [0, 1], default=2),
+        0
+    ).astype(np.int8)
+
+    total_delay = int(delay_days.sum())
+    critical_delay = int(delay_days[is_critical].sum())
+    return delay_days, cause_codes, total_delay, critical_delay
+
+
+if NUMBA_AVAILABLE:
+    _window_kernel = njit(cache=True)(_window_kernel_python)
+else:
+    _window_kernel = _window_kernel_numpy
+
+
+def _windows_kernel_python(pct, dur, finish, is_critical, is_finished,
+                           start_rows, end_rows, include_completed):
+    """
+    Run _window_kernel for every window
+
+    Windows are independent, so with numba the loop runs in parallel.
+
+    Args:
+        pct: Percent complete, one row per update
+        dur: Durations, one row per update
+        finish: Finish dates (int64 microseconds, NaT allowed), one row per update
+        is_critical: Criticality, one row per update
+        is_finished: Completion, one row per update
+        start_rows: Update row of each window's start schedule (-1 for none)
+        end_rows: Update row of each window's end schedule (-1 for none)
+        include_completed: Whether activities finished in the end update count
+
+    Returns:
+        Tuple of (delay days, cause codes) with one row per window, and
+        (total delay, critical delay) with one value per window
+    """
+    n_windows = len(start_rows)
+    n = finish.shape[1]
+    delay_days = np.zeros((n_windows, n), dtype=np.int64)
+    cause_codes = np.zeros((n_windows, n), dtype=np.int8)
+    total_delay = np.zeros(n_windows, dtype=np.int64)
+    critical_delay = np.zeros(n_windows, dtype=np.int64)
+    for w in prange(n_windows):
+        s = start_rows[w]
+        e = end_rows[w]
+        if s < 0 or e < 0:
+            continue
+        days, causes, total, critical = _window_kernel(
+            pct[s], pct[e], dur[s], dur[e], finish[s], finish[e],
+            is_critical[e], is_finished[e], include_completed
+        )
+        delay_days[w] = days
+        cause_codes[w] = causes
+        total_delay[w] = total
+        critical_delay[w] = critical
+    return delay_days, cause_codes, total_delay, critical_delay
+
+
+if NUMBA_AVAILABLE:
+    _windows_kernel_serial = njit(cache=True)(_windows_kernel_python)
+    _windows_kernel_parallel = njit(cache=True, parallel=True)(_windows_kernel_python)
+else:
+    _windows_kernel_serial = _windows_kernel_parallel = _windows_kernel_python
+
+
 @DelayAnalyzerFactory.register
 class WindowsAnalyzer(BaseDelayAnalyzer):
     """
@@ -18,11 +186,11 @@ class WindowsAnalyzer(BaseDelayAnalyzer):
     and analyzes delays that occurred within each window
     """
 
+    name = "Windows Analysis"
+    description = "Divides the project into time windows and analyzes delays and their causes within each window period"
+
     def __init__(self):
-        super().__init__(
-            name="Windows Analysis",
-            description="Divides the project into time windows and analyzes delays and their causes within each window period"
-        )
+        super().__init__()
         self.required_inputs = ['schedule_updates']
         self.optional_inputs = ['window_size_days', 'custom_windows']
 
@@ -77,46 +245,68 @@ class WindowsAnalyzer(BaseDelayAnalyzer):
         include_completed = kwargs.get('include_completed', True)
 
         result = DelayAnalysisResult(self.name)
+        update_dates = sorted(schedule_updates.keys())
 
         # Create windows
         if custom_windows:
             windows = custom_windows
-        elif window_method == 'Schedule Updates':
-            windows = self._create_windows_from_updates(schedule_updates)
-        elif window_method == 'Monthly':
-            windows = self._create_monthly_windows(schedule_updates)
-        else:  # Fixed Duration
-            windows = self._create_fixed_windows(schedule_updates, window_size_days)
+        else:
+            windows = list(self._windows_for(tuple(update_dates), window_method, window_size_days))
 
         result.metadata['window_count'] = len(windows)
         result.metadata['window_method'] = window_method
 
-        # Analyze each window
+        # Updates in date order, with every update's finish dates and
+        # activity order tabulated once for all windows
+        updates = [schedule_updates[date] for date in update_dates]
+        frames = self._build_update_frames(updates)
+
+        # Compare the boundary schedules of all windows in one kernel call;
+        # each window starts from the last update at or before its start
+        # and ends at the last update at or before its end
+        start_rows = np.array([bisect_right(update_dates, start) - 1 for start, _ in windows],
+                              dtype=np.int64)
+        end_rows = np.array([bisect_right(update_dates, end) - 1 for _, end in windows],
+                            dtype=np.int64)
+        arrays = self._update_arrays(frames)
+        kernel = (_windows_kernel_parallel if len(windows) >= _PARALLEL_MIN_WINDOWS
+                  else _windows_kernel_serial)
+        delay_days, cause_codes, window_totals, window_critical = kernel(
+            arrays['percent_complete'], arrays['duration'], arrays['finish'],
+            arrays['is_critical'], arrays['is_finished'], start_rows, end_rows,
+            include_completed
+        )
+
+        # Analyze each window, gathering the delays of all windows column by
+        # column so they are added to the result in one batch
         window_results = []
         total_delay = 0
         total_critical_delay = 0
+        delay_columns = {key: [] for key in (
+            'activity_id', 'activity_name', 'delay_days', 'cause', 'is_critical',
+            'window_number', 'window_start', 'window_end'
+        )}
 
         for i, (window_start, window_end) in enumerate(windows):
             window_result = self._analyze_window(
-                schedule_updates, window_start, window_end, i + 1, include_completed
+                updates, frames, arrays, window_start, window_end, i + 1,
+                start_rows[i], end_rows[i], delay_days[i], cause_codes[i],
+                window_totals[i], window_critical[i]
             )
 
             window_results.append(window_result)
             total_delay += window_result['total_delay']
             total_critical_delay += window_result['critical_delay']
 
-            # Add to overall result
-            for delay in window_result['delays']:
-                result.add_activity_delay(
-                    activity_id=delay['activity_id'],
-                    activity_name=delay['activity_name'],
-                    delay_days=delay['delay_days'],
-                    cause=delay['cause'],
-                    is_critical=delay['is_critical'],
-                    window_number=i + 1,
-                    window_start=window_start,
-                    window_end=window_end
-                )
+            delays = window_result['delays']
+            for key in ('activity_id', 'activity_name', 'delay_days', 'cause', 'is_critical'):
+                delay_columns[key].extend(delay[key] for delay in delays)
+            delay_columns['window_number'].extend([i + 1] * len(delays))
+            delay_columns['window_start'].extend([window_start] * len(delays))
+            delay_columns['window_end'].extend([window_end] * len(delays))
+
+        # Add to overall result
+        result.add_activity_delays(**delay_columns)
 
         result.total_delay_days = total_delay
         result.critical_delay_days = total_critical_delay
@@ -126,9 +316,7 @@ class WindowsAnalyzer(BaseDelayAnalyzer):
         result.recommendations = self._generate_recommendations(result, window_results)
 
         # Create summary
-        result.summary = self._create_summary(result, windows, window_results)
-
-        result.detailed_report = pd.DataFrame(result.delays_by_activity)
+        result.summary = partial(self._create_summary, result, windows, window_results)
 
         return result
 
@@ -169,12 +357,35 @@ class WindowsAnalyzer(BaseDelayAnalyzer):
 
         return suggestions
 
-    def _create_monthly_windows(self, schedule_updates: Dict[datetime, Schedule]) -> List[Tuple[datetime, datetime]]:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _windows_for(dates: Tuple[datetime, ...], window_method: str,
+                     window_size_days: int) -> Tuple[Tuple[datetime, datetime], ...]:
+        """
+        Create the analysis windows, memoized on the update dates
+
+        Args:
+            dates: Sorted schedule update dates
+            window_method: 'Schedule Updates', 'Monthly' or 'Fixed Duration'
+            window_size_days: Window size for fixed-duration windows
+
+        Returns:
+            Tuple of (window start, window end) pairs
+        """
+        if window_method == 'Schedule Updates':
+            windows = WindowsAnalyzer._create_windows_from_updates(dates)
+        elif window_method == 'Monthly':
+            windows = WindowsAnalyzer._create_monthly_windows(dates)
+        else:  # Fixed Duration
+            windows = WindowsAnalyzer._create_fixed_windows(dates, window_size_days)
+        return tuple(windows)
+
+    @staticmethod
+    def _create_monthly_windows(dates: Tuple[datetime, ...]) -> List[Tuple[datetime, datetime]]:
         """Create monthly windows"""
-        if not schedule_updates:
+        if not dates:
             return []
 
-        dates = sorted(schedule_updates.keys())
         start_date = dates[0]
         end_date = dates[-1]
 
@@ -195,13 +406,12 @@ class WindowsAnalyzer(BaseDelayAnalyzer):
 
         return windows
 
-    def _create_fixed_windows(self, schedule_updates: Dict[datetime, Schedule],
-                             days: int) -> List[Tuple[datetime, datetime]]:
+    @staticmethod
+    def _create_fixed_windows(dates: Tuple[datetime, ...], days: int) -> List[Tuple[datetime, datetime]]:
         """Create fixed-duration windows"""
-        if not schedule_updates:
+        if not dates:
             return []
 
-        dates = sorted(schedule_updates.keys())
         start_date = dates[0]
         end_date = dates[-1]
 
@@ -215,10 +425,9 @@ class WindowsAnalyzer(BaseDelayAnalyzer):
 
         return windows
 
-    def _create_windows_from_updates(self, schedule_updates: Dict[datetime, Schedule]) -> List[Tuple[datetime, datetime]]:
+    @staticmethod
+    def _create_windows_from_updates(dates: Tuple[datetime, ...]) -> List[Tuple[datetime, datetime]]:
         """Create windows based on update dates"""
-        dates = sorted(schedule_updates.keys())
-
         if len(dates) < 2:
             return []
 
@@ -228,69 +437,116 @@ class WindowsAnalyzer(BaseDelayAnalyzer):
 
         return windows
 
-    def _analyze_window(self, schedule_updates: Dict[datetime, Schedule],
-                       window_start: datetime, window_end: datetime,
-                       window_number: int, include_completed: bool) -> Dict:
-        """Analyze delays within a specific window"""
+    def _build_update_frames(self, updates: List[Schedule]) -> Dict[str, pd.DataFrame]:
+        """
+        Tabulate the activity fields compared between updates
 
-        # Get schedules at window boundaries
-        dates = sorted(schedule_updates.keys())
-        start_schedule = None
-        end_schedule = None
+        Args:
+            updates: Schedule updates in date order
 
-        # Find closest schedules
-        for date in dates:
-            if date <= window_start:
-                start_schedule = schedule_updates[date]
-            if date <= window_end:
-                end_schedule = schedule_updates[date]
+        Returns:
+            Dictionary of DataFrames by field ('finish', 'position',
+            'percent_complete', 'duration', 'is_critical', 'is_finished'),
+            each indexed by activity ID with one column per update position;
+            activities missing from an update are NaT/NaN in its column
+        """
+        activity_ids = list(dict.fromkeys(
+            activity_id for schedule in updates for activity_id in schedule.activities
+        ))
+
+        columns = {field: {} for field in _UPDATE_FIELDS}
+        built = {}  # The same schedule object may be listed at several dates
+        for i, schedule in enumerate(updates):
+            if id(schedule) not in built:
+                ids = list(schedule.activities)
+                activities = schedule.activities.values()
+                critical_ids = schedule.critical_ids
+                values = {
+                    # Microsecond dates, like Schedule.to_soa, so the kernel
+                    # arrays are a view of the frame without unit conversion
+                    'finish': pd.Series(np.array([a.finish_date for a in activities],
+                                                 dtype='datetime64[us]'), index=ids),
+                    'position': pd.Series(range(len(ids)), index=ids, dtype='float64'),
+                    'percent_complete': pd.Series([a.percent_complete for a in activities],
+                                                  index=ids, dtype='float64'),
+                    'duration': pd.Series([a.duration for a in activities], index=ids,
+                                          dtype='float64'),
+                    'is_critical': pd.Series([aid in critical_ids for aid in ids],
+                                             index=ids, dtype='float64'),
+                    'is_finished': pd.Series([a.is_finished for a in activities], index=ids,
+                                             dtype='float64'),
+                }
+                built[id(schedule)] = {
+                    field: series.reindex(activity_ids) for field, series in values.items()
+                }
+            for field, series in built[id(schedule)].items():
+                columns[field][i] = series
+
+        index = pd.Index(activity_ids, dtype=object)
+        return {field: pd.DataFrame(columns[field], index=index) for field in _UPDATE_FIELDS}
+
+    def _update_arrays(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, np.ndarray]:
+        """
+        Lay out the per-update frames as arrays with one row per update
+
+        Args:
+            frames: Frames from _build_update_frames
+
+        Returns:
+            Dictionary of contiguous 2-D arrays by field; finish dates are
+            int64 microseconds with NaT as the minimum int64
+        """
+        def rows(frame, **kwargs):
+            return np.ascontiguousarray(frame.to_numpy(**kwargs).T)
 
-        if not start_schedule or not end_schedule:
+        return {
+            'finish': rows(frames['finish'], dtype='datetime64[us]').view(np.int64),
+            'position': rows(frames['position']),
+            'percent_complete': rows(frames['percent_complete']),
+            'duration': rows(frames['duration']),
+            'is_critical': rows(frames['is_critical'], dtype=np.bool_, na_value=False),
+            'is_finished': rows(frames['is_finished'], dtype=np.bool_, na_value=False),
+        }
+
+    def _analyze_window(self, updates: List[Schedule], frames: Dict[str, pd.DataFrame],
+                       arrays: Dict[str, np.ndarray], window_start: datetime,
+                       window_end: datetime, window_number: int, start_index: int,
+                       end_index: int, delay_days: np.ndarray, cause_codes: np.ndarray,
+                       total_delay: int, critical_delay: int) -> Dict:
+        """Collect the delays of a specific window from the kernel output"""
+
+        if start_index < 0 or end_index < 0:
             return {
                 'window_number': window_number,
                 'window_start': window_start,
                 'window_end': window_end,
                 'total_delay': 0,
                 'critical_delay': 0,
-                'delays': []
+                'delays': [],
+                'activities_delayed': 0
             }
 
-        # Compare schedules
-        delays = []
-        total_delay = 0
-        critical_delay = 0
-
-        for activity_id in end_schedule.activities:
-            if activity_id not in start_schedule.activities:
-                continue
-
-            start_act = start_schedule.activities[activity_id]
-            end_act = end_schedule.activities[activity_id]
-
-            # Check if activity was active in window
-            if not include_completed and end_act.is_finished:
-                continue
+        end_schedule = updates[end_index]
+        activity_ids = frames['finish'].index
+        is_critical = arrays['is_critical'][end_index]
 
-            # Calculate delay in this window
-            delay_days = 0
+        # Report in the end schedule's activity order
+        delayed = np.flatnonzero(delay_days)
+        positions = arrays['position'][end_index][delayed]
+        delayed = delayed[positions.argsort(kind='stable')]
 
-            if start_act.finish_date and end_act.finish_date:
-                delay_days = (end_act.finish_date - start_act.finish_date).days
-
-            if delay_days > 0:
-                cause = self._determine_window_cause(start_act, end_act, window_start, window_end)
-
-                delays.append({
-                    'activity_id': activity_id,
-                    'activity_name': end_act.name,
-                    'delay_days': delay_days,
-                    'cause': cause,
-                    'is_critical': end_act.is_critical
-                })
-
-                total_delay += delay_days
-                if end_act.is_critical:
-                    critical_delay += delay_days
+        delays = []
+        for i in delayed.tolist():
+            activity_id = activity_ids[i]
+            delays.append({
+                'activity_id': activity_id,
+                'activity_name': end_schedule.activities[activity_id].name,
+                'delay_days': int(delay_days[i]),
+                'cause': _WINDOW_CAUSES[cause_codes[i]],
+                'is_critical': bool(is_critical[i])
+            })
+        total_delay = int(total_delay)
+        critical_delay = int(critical_delay)
 
         return {
             'window_number': window_number,
@@ -302,31 +558,18 @@ class WindowsAnalyzer(BaseDelayAnalyzer):
             'activities_delayed': len(delays)
         }
 
-    def _determine_window_cause(self, start_act, end_act,
-                               window_start: datetime, window_end: datetime) -> str:
-        """Determine cause of delay within window"""
-        # Simplified cause determination
-        if end_act.percent_complete < start_act.percent_complete + 10:
-            return "Slow Progress"
-
-        if end_act.duration > start_act.duration:
-            return "Duration Extension"
-
-        return "Schedule Slip"
-
     def _generate_recommendations(self, result: DelayAnalysisResult,
                                   window_results: List[Dict]) -> List[str]:
         """Generate recommendations"""
         recommendations = []
 
-        # Find worst windows
-        sorted_windows = sorted(window_results, key=lambda x: x['total_delay'], reverse=True)
+        # Find worst window
+        worst = max(window_results, key=lambda x: x['total_delay'], default=None)
 
-        if sorted_windows and sorted_windows[0]['total_delay'] > 0:
-            worst = sorted_windows[0]
+        if worst and worst['total_delay'] > 0:
             recommendations.append(
-                f"Window {worst['window_number']} ({worst['window_start'].strftime('%Y-%m-%d')} to "
-                f"{worst['window_end'].strftime('%Y-%m-%d')}) had highest delay: {worst['total_delay']:.1f} days"
+                f"Window {worst['window_number']} ({_day(worst['window_start'])} to "
+                f"{_day(worst['window_end'])}) had highest delay: {worst['total_delay']:.1f} days"
             )
 
         # Identify trends
@@ -351,10 +594,15 @@ class WindowsAnalyzer(BaseDelayAnalyzer):
                        windows: List[Tuple[datetime, datetime]],
                        window_results: List[Dict]) -> str:
         """Create summary text"""
+        if windows:
+            period = f"{_day(windows[0][0])} to {_day(windows[-1][1])}"
+        else:
+            period = "N/A"
+
         summary = f"""
 Windows Analysis Summary:
 
-Analysis Period: {windows[0][0].strftime('%Y-%m-%d')} to {windows[-1][1].strftime('%Y-%m-%d')}
+Analysis Period: {period}
 Number of Windows: {len(windows)}
 Total Delay Identified: {result.total_delay_days:.1f} days
 Critical Path Delay: {result.critical_delay_days:.1f} days
@@ -363,7 +611,7 @@ Window Breakdown:
 """
         for window_result in window_results:
             summary += f"\nWindow {window_result['window_number']}: "
-            summary += f"{window_result['window_start'].strftime('%Y-%m-%d')} to {window_result['window_end'].strftime('%Y-%m-%d')}\n"
+            summary += f"{_day(window_result['window_start'])} to {_day(window_result['window_end'])}\n"
             summary += f"  Delay: {window_result['total_delay']:.1f} days "
             summary += f"({window_result['activities_delayed']} activities)\n"
 
@@ -2,23 +2,40 @@
 Excel Exporter for Delay Analysis Results
 """
 import pandas as pd
+import numpy as np
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
+import heapq
 import io
 
 try:
     from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils.dataframe import dataframe_to_rows
-    from openpyxl.chart import BarChart, PieChart, Reference
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment
+    from openpyxl.utils import get_column_letter
+    from openpyxl.chart import PieChart, Reference
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
 from ..analyzers.base_analyzer import DelayAnalysisResult
 from ..utils.schedule_utils import Schedule
 
+# Impact level of a cause by its share of the total delay (upper bounds, %)
+_IMPACT_BOUNDS = np.array([10.0, 20.0])
+_IMPACT_LEVELS = np.array(['Low', 'Medium', 'High'], dtype=object)
+
+# Detailed reports with at least this many rows are written with xlsxwriter
+# when the backend is chosen automatically
+_XLSXWRITER_MIN_ROWS = 50_000
+
 
 class ExcelExporter:
     """Export delay analysis results to Excel format"""
@@ -40,8 +57,27 @@ class ExcelExporter:
             'light_gray': 'FFD9D9D9',
         }
 
+        # Style objects, built once and shared by every cell that uses them
+        self.title_font = Font(size=16, bold=True, color='FFFFFFFF')
+        self.sheet_title_font = Font(size=14, bold=True, color='FFFFFFFF')
+        self.chart_title_font = Font(size=14, bold=True)
+        self.section_font = Font(size=12, bold=True, color='FFFFFFFF')
+        self.header_font = Font(bold=True, color='FFFFFFFF')
+        self.bold_font = Font(bold=True)
+        self.header_fill = self._fill(self.colors['header'])
+        self.subheader_fill = self._fill(self.colors['subheader'])
+        self.light_gray_fill = self._fill(self.colors['light_gray'])
+        self.crit_row_fill = self._fill('FFFFE0E0')
+        self.impact_fills = {
+            'High': self._fill('FFFF6B6B'),
+            'Medium': self._fill('FFFFD93D'),
+            'Low': self._fill('FF95E1D3'),
+        }
+        self.center_align = Alignment(horizontal='center')
+        self.wrap_align = Alignment(wrap_text=True)
+
     def export(self, result: DelayAnalysisResult, output_path: str,
-               include_charts: bool = True) -> str:
+               include_charts: bool = True, backend: str = 'auto') -> str:
         """
         Export delay analysis result to Excel
 
@@ -49,15 +85,18 @@ class ExcelExporter:
             result: DelayAnalysisResult object
             output_path: Path to save Excel file
             include_charts: Whether to include charts
+            backend: 'openpyxl', 'xlsxwriter', or 'auto' to use xlsxwriter
+                for large detailed reports when it is installed
 
         Returns:
             Path to saved file
         """
-        wb = Workbook()
+        if self._use_xlsxwriter(result, backend):
+            self._export_xlsxwriter(result, output_path, include_charts)
+            return output_path
 
-        # Remove default sheet
-        if 'Sheet' in wb.sheetnames:
-            wb.remove(wb['Sheet'])
+        # Rows are streamed to disk sheet by sheet instead of being kept in memory
+        wb = Workbook(write_only=True)
 
         # Create sheets
         self._create_summary_sheet(wb, result)
@@ -72,21 +111,25 @@ class ExcelExporter:
         return output_path
 
     def export_to_bytes(self, result: DelayAnalysisResult,
-                       include_charts: bool = True) -> bytes:
+                       include_charts: bool = True, backend: str = 'auto') -> bytes:
         """
         Export to Excel format in memory (for downloads)
 
         Args:
             result: DelayAnalysisResult object
             include_charts: Whether to include charts
+            backend: 'openpyxl', 'xlsxwriter', or 'auto' to use xlsxwriter
+                for large detailed reports when it is installed
 
         Returns:
             Excel file as bytes
         """
-        wb = Workbook()
+        if self._use_xlsxwriter(result, backend):
+            virtual_workbook = io.BytesIO()
+            self._export_xlsxwriter(result, virtual_workbook, include_charts)
+            return virtual_workbook.getvalue()
 
-        if 'Sheet' in wb.sheetnames:
-            wb.remove(wb['Sheet'])
+        wb = Workbook(write_only=True)
 
         self._create_summary_sheet(wb, result)
         self._create_detailed_sheet(wb, result)
@@ -101,255 +144,299 @@ class ExcelExporter:
         virtual_workbook.seek(0)
         return virtual_workbook.getvalue()
 
+    def _use_xlsxwriter(self, result: DelayAnalysisResult, backend: str) -> bool:
+        """
+        Resolve the backend to use for an export
+
+        Args:
+            result: DelayAnalysisResult object
+            backend: 'openpyxl', 'xlsxwriter' or 'auto'
+
+        Returns:
+            True if the workbook should be written with xlsxwriter
+        """
+        if backend == 'openpyxl':
+            return False
+        if backend == 'xlsxwriter':
+            if not XLSXWRITER_AVAILABLE:
+                raise ImportError(
+                    "xlsxwriter is required for the xlsxwriter backend. "
+                    "Install it with: pip install xlsxwriter"
+                )
+            return True
+        if backend != 'auto':
+            raise ValueError(f"Unknown Excel backend: {backend}")
+
+        if not XLSXWRITER_AVAILABLE:
+            return False
+        if result.detailed_report is not None and not result.detailed_report.empty:
+            row_count = len(result.detailed_report)
+        else:
+            row_count = result.delay_count
+        return row_count >= _XLSXWRITER_MIN_ROWS
+
+    def _detailed_frame(self, result: DelayAnalysisResult) -> pd.DataFrame:
+        """Rows of the detailed sheet: the analyzer's report or the raw delays"""
+        if result.detailed_report is not None and not result.detailed_report.empty:
+            return result.detailed_report
+        return result.delays_frame()
+
+    def _detailed_column_widths(self, df: pd.DataFrame, headers: list, title: str) -> list:
+        """
+        Fit each detailed sheet column to its longest text
+
+        Args:
+            df: Detailed sheet rows
+            headers: Column headers
+            title: Sheet title, written in the first column
+
+        Returns:
+            Column widths, clamped to 12-50 characters
+        """
+        widths = []
+        for col_num, (column, header) in enumerate(zip(df.columns, headers), 1):
+            max_length = len(header)
+            if col_num == 1:
+                max_length = max(max_length, len(title))
+            values = df[column]
+            if not (pd.api.types.is_numeric_dtype(values.dtype)
+                    or pd.api.types.is_datetime64_any_dtype(values.dtype)):
+                try:
+                    value_length = values.str.len().max()
+                except AttributeError:  # Column without any strings
+                    value_length = None
+                if pd.notna(value_length):
+                    max_length = max(max_length, int(value_length))
+            widths.append(min(50, max(12, max_length + 2)))
+        return widths
+
+    def _by_cause_frame(self, result: DelayAnalysisResult) -> pd.DataFrame:
+        """Causes by delay, largest first, with their share and impact"""
+        days = pd.Series(result.delays_by_cause).sort_values(
+            ascending=False, kind='stable'
+        )
+        if result.total_delay_days > 0:
+            pct = days / result.total_delay_days * 100
+        else:
+            pct = pd.Series(0.0, index=days.index)
+        # Up to 10% is Low, up to 20% Medium, above that High
+        impact = _IMPACT_LEVELS[np.searchsorted(_IMPACT_BOUNDS, pct.to_numpy())]
+        return pd.DataFrame({
+            'Cause': days.index,
+            'Delay (Days)': days.to_numpy(),
+            'Percentage': pct.map('{:.1f}%'.format).to_numpy(),
+            'Impact': impact,
+        })
+
+    def _fill(self, color: str) -> 'PatternFill':
+        """Solid fill of the given ARGB color"""
+        return PatternFill(start_color=color, end_color=color, fill_type='solid')
+
+    def _cell(self, ws, value, font: Optional['Font'] = None, fill: Optional['PatternFill'] = None,
+              alignment: Optional['Alignment'] = None, number_format: Optional[str] = None):
+        """
+        Create a styled cell for a write-only worksheet
+
+        Args:
+            ws: Write-only worksheet the cell will be appended to
+            value: Cell value
+            font: Optional font
+            fill: Optional fill
+            alignment: Optional alignment
+            number_format: Optional number format
+
+        Returns:
+            WriteOnlyCell
+        """
+        cell = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if alignment is not None:
+            cell.alignment = alignment
+        if number_format is not None:
+            cell.number_format = number_format
+        return cell
+
     def _create_summary_sheet(self, wb: Workbook, result: DelayAnalysisResult):
         """Create summary sheet"""
-        ws = wb.create_sheet("Summary", 0)
+        ws = wb.create_sheet("Summary")
+
+        # Column widths and merged ranges are sheet properties, so they can
+        # be set while rows are streamed
+        ws.column_dimensions['A'].width = 30
+        ws.column_dimensions['B'].width = 20
+        ws.column_dimensions['C'].width = 15
+        ws.column_dimensions['D'].width = 15
+
+        bold = self.bold_font
+        section_font = self.section_font
+        section_fill = self.subheader_fill
 
         # Title
-        ws['A1'] = "Delay Analysis Report"
-        ws['A1'].font = Font(size=16, bold=True, color='FFFFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.colors['header'],
-                                    end_color=self.colors['header'],
-                                    fill_type='solid')
-        ws.merge_cells('A1:D1')
+        ws.append([self._cell(ws, "Delay Analysis Report",
+                              font=self.title_font, fill=self.header_fill)])
+        ws.merged_cells.add('A1:D1')
+        ws.append([])
 
         # Method and date
-        row = 3
-        ws[f'A{row}'] = "Analysis Method:"
-        ws[f'B{row}'] = result.method_name
-        ws[f'A{row}'].font = Font(bold=True)
-
-        row += 1
-        ws[f'A{row}'] = "Analysis Date:"
-        ws[f'B{row}'] = result.analysis_date.strftime('%Y-%m-%d %H:%M:%S')
-        ws[f'A{row}'].font = Font(bold=True)
+        ws.append([self._cell(ws, "Analysis Method:", font=bold), result.method_name])
+        ws.append([self._cell(ws, "Analysis Date:", font=bold),
+                   result.analysis_date.strftime('%Y-%m-%d %H:%M:%S')])
+        row = 4
 
         # Key metrics
+        ws.append([])
+        ws.append([self._cell(ws, "KEY METRICS", font=section_font, fill=section_fill)])
         row += 2
-        ws[f'A{row}'] = "KEY METRICS"
-        ws[f'A{row}'].font = Font(size=12, bold=True, color='FFFFFFFF')
-        ws[f'A{row}'].fill = PatternFill(start_color=self.colors['subheader'],
-                                        end_color=self.colors['subheader'],
-                                        fill_type='solid')
-        ws.merge_cells(f'A{row}:D{row}')
+        ws.merged_cells.add(f'A{row}:D{row}')
 
         metrics = [
             ("Total Delay", f"{result.total_delay_days:.1f} days"),
             ("Critical Path Delay", f"{result.critical_delay_days:.1f} days"),
-            ("Affected Activities", len(result.delays_by_activity)),
-            ("Critical Activities Delayed", len([d for d in result.delays_by_activity if d['is_critical']])),
+            ("Affected Activities", result.delay_count),
+            ("Critical Activities Delayed", result.critical_activity_count),
         ]
 
         for metric, value in metrics:
+            ws.append([self._cell(ws, metric, font=bold), value])
             row += 1
-            ws[f'A{row}'] = metric
-            ws[f'B{row}'] = value
-            ws[f'A{row}'].font = Font(bold=True)
 
         # Top delay causes
         if result.delays_by_cause:
+            ws.append([])
+            ws.append([self._cell(ws, "TOP DELAY CAUSES", font=section_font, fill=section_fill)])
             row += 2
-            ws[f'A{row}'] = "TOP DELAY CAUSES"
-            ws[f'A{row}'].font = Font(size=12, bold=True, color='FFFFFFFF')
-            ws[f'A{row}'].fill = PatternFill(start_color=self.colors['subheader'],
-                                            end_color=self.colors['subheader'],
-                                            fill_type='solid')
-            ws.merge_cells(f'A{row}:D{row}')
+            ws.merged_cells.add(f'A{row}:D{row}')
 
+            ws.append([self._cell(ws, header, font=bold, fill=self.light_gray_fill)
+                       for header in ("Cause", "Days", "% of Total")])
             row += 1
-            ws[f'A{row}'] = "Cause"
-            ws[f'B{row}'] = "Days"
-            ws[f'C{row}'] = "% of Total"
-            for col in ['A', 'B', 'C']:
-                ws[f'{col}{row}'].font = Font(bold=True)
-                ws[f'{col}{row}'].fill = PatternFill(start_color=self.colors['light_gray'],
-                                                     end_color=self.colors['light_gray'],
-                                                     fill_type='solid')
-
-            sorted_causes = sorted(result.delays_by_cause.items(),
-                                 key=lambda x: x[1], reverse=True)[:5]
+
+            sorted_causes = heapq.nlargest(5, result.delays_by_cause.items(), key=lambda x: x[1])
 
             for cause, days in sorted_causes:
-                row += 1
-                ws[f'A{row}'] = cause
-                ws[f'B{row}'] = f"{days:.1f}"
                 pct = (days / result.total_delay_days * 100) if result.total_delay_days > 0 else 0
-                ws[f'C{row}'] = f"{pct:.1f}%"
+                ws.append([cause, f"{days:.1f}", f"{pct:.1f}%"])
+                row += 1
 
         # Recommendations
         if result.recommendations:
+            ws.append([])
+            ws.append([self._cell(ws, "RECOMMENDATIONS", font=section_font, fill=section_fill)])
             row += 2
-            ws[f'A{row}'] = "RECOMMENDATIONS"
-            ws[f'A{row}'].font = Font(size=12, bold=True, color='FFFFFFFF')
-            ws[f'A{row}'].fill = PatternFill(start_color=self.colors['subheader'],
-                                            end_color=self.colors['subheader'],
-                                            fill_type='solid')
-            ws.merge_cells(f'A{row}:D{row}')
+            ws.merged_cells.add(f'A{row}:D{row}')
 
             for rec in result.recommendations:
+                ws.append([self._cell(ws, f"• {rec}", alignment=self.wrap_align)])
                 row += 1
-                ws[f'A{row}'] = f"• {rec}"
-                ws.merge_cells(f'A{row}:D{row}')
-                ws[f'A{row}'].alignment = Alignment(wrap_text=True)
-
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 20
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 15
+                ws.merged_cells.add(f'A{row}:D{row}')
 
     def _create_detailed_sheet(self, wb: Workbook, result: DelayAnalysisResult):
         """Create detailed activities sheet"""
         ws = wb.create_sheet("Detailed Analysis")
 
-        # Title
-        ws['A1'] = "Detailed Delay Analysis"
-        ws['A1'].font = Font(size=14, bold=True, color='FFFFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.colors['header'],
-                                    end_color=self.colors['header'],
-                                    fill_type='solid')
+        # Freeze header row
+        ws.freeze_panes = 'A4'
 
         # Create DataFrame
-        if result.detailed_report is not None and not result.detailed_report.empty:
-            df = result.detailed_report
-        else:
-            df = pd.DataFrame(result.delays_by_activity)
+        df = self._detailed_frame(result)
 
-        # Write data starting from row 3
-        row_num = 3
+        title = "Detailed Delay Analysis"
+        headers = [column.replace('_', ' ').title() for column in df.columns]
 
-        # Headers
+        # Column widths must be known before any row is streamed: fit the
+        # longest text in each column (title, header or string value)
         if not df.empty:
-            for col_num, column in enumerate(df.columns, 1):
-                cell = ws.cell(row=row_num, column=col_num)
-                cell.value = column.replace('_', ' ').title()
-                cell.font = Font(bold=True, color='FFFFFFFF')
-                cell.fill = PatternFill(start_color=self.colors['subheader'],
-                                       end_color=self.colors['subheader'],
-                                       fill_type='solid')
-                cell.alignment = Alignment(horizontal='center')
-
-            # Data
-            for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=False), row_num + 1):
-                for c_idx, value in enumerate(row, 1):
-                    cell = ws.cell(row=r_idx, column=c_idx)
-                    cell.value = value
-
-                    # Format dates
-                    if isinstance(value, datetime):
-                        cell.number_format = 'YYYY-MM-DD'
-
-                    # Highlight critical activities
-                    if df.columns[c_idx-1] == 'is_critical' and value:
-                        for col in range(1, len(df.columns) + 1):
-                            ws.cell(row=r_idx, column=col).fill = PatternFill(
-                                start_color='FFFFE0E0',
-                                end_color='FFFFE0E0',
-                                fill_type='solid'
-                            )
-
-            # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(cell.value)
-                    except:
-                        pass
-                adjusted_width = min(50, max(12, max_length + 2))
-                ws.column_dimensions[column_letter].width = adjusted_width
+            for col_num, width in enumerate(self._detailed_column_widths(df, headers, title), 1):
+                ws.column_dimensions[get_column_letter(col_num)].width = width
 
-        # Freeze header row
-        ws.freeze_panes = 'A4'
+        # Title
+        ws.append([self._cell(ws, title, font=self.sheet_title_font, fill=self.header_fill)])
+        ws.append([])
+
+        if not df.empty:
+            # Headers
+            ws.append([self._cell(ws, header, font=self.header_font, fill=self.subheader_fill,
+                                  alignment=self.center_align)
+                       for header in headers])
+
+            # Data; only rows with a date or a critical activity need styled
+            # cells, and all of them share one fill object
+            critical_fill = self.crit_row_fill
+            if 'is_critical' in df.columns:
+                critical_rows = df['is_critical'].to_numpy(dtype=bool, na_value=False)
+            else:
+                critical_rows = np.zeros(len(df), dtype=bool)
+            # Datetime columns hold dates in every row; object columns may
+            # hold some and are checked row by row
+            date_cols = [i for i, dtype in enumerate(df.dtypes)
+                         if pd.api.types.is_datetime64_any_dtype(dtype)]
+            object_cols = [i for i, dtype in enumerate(df.dtypes) if dtype == object]
+
+            for critical, row in zip(critical_rows.tolist(), df.itertuples(index=False, name=None)):
+                dated = date_cols + [i for i in object_cols if isinstance(row[i], datetime)]
+                if not critical and not dated:
+                    ws.append(row)
+                    continue
+
+                cells = list(row)
+                if critical:
+                    cells = [self._cell(ws, value, fill=critical_fill) for value in cells]
+                    for i in dated:
+                        cells[i].number_format = 'YYYY-MM-DD'
+                else:
+                    for i in dated:
+                        cells[i] = self._cell(ws, cells[i], number_format='YYYY-MM-DD')
+                ws.append(cells)
 
     def _create_by_cause_sheet(self, wb: Workbook, result: DelayAnalysisResult):
         """Create delays by cause sheet"""
         ws = wb.create_sheet("By Cause")
 
+        # Adjust column widths
+        ws.column_dimensions['A'].width = 30
+        ws.column_dimensions['B'].width = 15
+        ws.column_dimensions['C'].width = 15
+        ws.column_dimensions['D'].width = 12
+
         # Title
-        ws['A1'] = "Delays by Cause"
-        ws['A1'].font = Font(size=14, bold=True, color='FFFFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.colors['header'],
-                                    end_color=self.colors['header'],
-                                    fill_type='solid')
+        ws.append([self._cell(ws, "Delays by Cause", font=self.sheet_title_font,
+                              fill=self.header_fill)])
 
-        # Create summary DataFrame
         if result.delays_by_cause:
-            data = []
-            for cause, days in sorted(result.delays_by_cause.items(),
-                                     key=lambda x: x[1], reverse=True):
-                pct = (days / result.total_delay_days * 100) if result.total_delay_days > 0 else 0
-                data.append({
-                    'Cause': cause,
-                    'Delay (Days)': days,
-                    'Percentage': f"{pct:.1f}%",
-                    'Impact': 'High' if pct > 20 else 'Medium' if pct > 10 else 'Low'
-                })
-
-            df = pd.DataFrame(data)
-
-            # Write to sheet
-            row_num = 3
+            ws.append([])
 
             # Headers
-            for col_num, column in enumerate(df.columns, 1):
-                cell = ws.cell(row=row_num, column=col_num)
-                cell.value = column
-                cell.font = Font(bold=True, color='FFFFFFFF')
-                cell.fill = PatternFill(start_color=self.colors['subheader'],
-                                       end_color=self.colors['subheader'],
-                                       fill_type='solid')
-
-            # Data
-            for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=False), row_num + 1):
-                for c_idx, value in enumerate(row, 1):
-                    cell = ws.cell(row=r_idx, column=c_idx)
-                    cell.value = value
-
-                    # Color code impact
-                    if c_idx == 4:  # Impact column
-                        if value == 'High':
-                            cell.fill = PatternFill(start_color='FFFF6B6B',
-                                                   end_color='FFFF6B6B',
-                                                   fill_type='solid')
-                        elif value == 'Medium':
-                            cell.fill = PatternFill(start_color='FFFFD93D',
-                                                   end_color='FFFFD93D',
-                                                   fill_type='solid')
-                        else:
-                            cell.fill = PatternFill(start_color='FF95E1D3',
-                                                   end_color='FF95E1D3',
-                                                   fill_type='solid')
+            ws.append([self._cell(ws, header, font=self.header_font, fill=self.subheader_fill)
+                       for header in ('Cause', 'Delay (Days)', 'Percentage', 'Impact')])
 
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 12
+            df = self._by_cause_frame(result)
+
+            # Data, with the impact color coded
+            for cause, delay, percentage, level in df.itertuples(index=False, name=None):
+                ws.append([cause, delay, percentage,
+                           self._cell(ws, level, fill=self.impact_fills[level])])
 
     def _create_charts_sheet(self, wb: Workbook, result: DelayAnalysisResult):
         """Create charts sheet"""
         ws = wb.create_sheet("Charts")
 
-        ws['A1'] = "Delay Analysis Charts"
-        ws['A1'].font = Font(size=14, bold=True)
+        ws.append([self._cell(ws, "Delay Analysis Charts", font=self.chart_title_font)])
 
         # Pie chart for delays by cause
         if result.delays_by_cause and len(result.delays_by_cause) > 0:
             # Create data for chart
+            ws.append([])
+            ws.append(["Cause", "Days"])
             row = 3
-            ws[f'A{row}'] = "Cause"
-            ws[f'B{row}'] = "Days"
 
-            sorted_causes = sorted(result.delays_by_cause.items(),
-                                 key=lambda x: x[1], reverse=True)[:8]
+            sorted_causes = heapq.nlargest(8, result.delays_by_cause.items(), key=lambda x: x[1])
 
             for cause, days in sorted_causes:
+                ws.append([cause, days])
                 row += 1
-                ws[f'A{row}'] = cause
-                ws[f'B{row}'] = days
 
             # Create pie chart
             pie = PieChart()
@@ -363,9 +450,251 @@ class ExcelExporter:
 
             ws.add_chart(pie, "D3")
 
+    def _export_xlsxwriter(self, result: DelayAnalysisResult, target, include_charts: bool):
+        """
+        Write the report with xlsxwriter in constant memory mode
+
+        Each row is flushed to a temporary file as soon as the next one is
+        started, so large detailed reports are written with flat memory.
+        Sheets and styles mirror the openpyxl export.
+
+        Args:
+            result: DelayAnalysisResult object
+            target: Output path or binary file object
+            include_charts: Whether to include charts
+        """
+        wb = xlsxwriter.Workbook(target, {
+            'constant_memory': True,
+            'strings_to_urls': False,
+            'remove_timezone': True,
+        })
+        formats = self._xlsxwriter_formats(wb)
+
+        self._write_summary_sheet(wb, formats, result)
+        self._write_detailed_sheet(wb, formats, result)
+        self._write_by_cause_sheet(wb, formats, result)
+
+        if include_charts:
+            self._write_charts_sheet(wb, formats, result)
+
+        wb.close()
+
+    def _xlsxwriter_formats(self, wb) -> dict:
+        """
+        Create the xlsxwriter counterparts of the openpyxl styles
+
+        Args:
+            wb: xlsxwriter Workbook the formats belong to
+
+        Returns:
+            Dictionary of formats by name
+        """
+        def color(argb):
+            return '#' + argb[2:]
+
+        header_bg = {'pattern': 1, 'bg_color': color(self.colors['header'])}
+        subheader_bg = {'pattern': 1, 'bg_color': color(self.colors['subheader'])}
+        white = {'font_color': '#FFFFFF'}
+        date = {'num_format': 'YYYY-MM-DD'}
+        critical = {'pattern': 1, 'bg_color': '#FFE0E0'}
+
+        formats = {
+            'title': wb.add_format({'bold': True, 'font_size': 16, **white, **header_bg}),
+            'sheet_title': wb.add_format({'bold': True, 'font_size': 14, **white, **header_bg}),
+            'chart_title': wb.add_format({'bold': True, 'font_size': 14}),
+            'section': wb.add_format({'bold': True, 'font_size': 12, **white, **subheader_bg}),
+            'header': wb.add_format({'bold': True, **white, **subheader_bg}),
+            'header_center': wb.add_format({'bold': True, 'align': 'center', **white, **subheader_bg}),
+            'bold': wb.add_format({'bold': True}),
+            'bold_gray': wb.add_format({'bold': True, 'pattern': 1,
+                                        'bg_color': color(self.colors['light_gray'])}),
+            'wrap': wb.add_format({'text_wrap': True}),
+            'date': wb.add_format(date),
+            'critical': wb.add_format(critical),
+            'critical_date': wb.add_format({**critical, **date}),
+        }
+        for level, argb in (('High', 'FFFF6B6B'), ('Medium', 'FFFFD93D'), ('Low', 'FF95E1D3')):
+            formats[level] = wb.add_format({'pattern': 1, 'bg_color': color(argb)})
+        return formats
+
+    def _write_cells(self, ws, row_num: int, values, cell_format=None):
+        """
+        Write a row of values with xlsxwriter, leaving missing ones blank
+
+        Args:
+            ws: xlsxwriter Worksheet
+            row_num: Zero-based row
+            values: Row values, from the first column
+            cell_format: Optional format for every cell
+        """
+        for col, value in enumerate(values):
+            if value is None or value != value:  # None, NaN or NaT
+                if cell_format is not None:
+                    ws.write_blank(row_num, col, None, cell_format)
+            else:
+                ws.write(row_num, col, value, cell_format)
+
+    def _write_summary_sheet(self, wb, formats: dict, result: DelayAnalysisResult):
+        """Write the summary sheet with xlsxwriter"""
+        ws = wb.add_worksheet("Summary")
+
+        ws.set_column(0, 0, 30)
+        ws.set_column(1, 1, 20)
+        ws.set_column(2, 3, 15)
+
+        # Title
+        ws.merge_range(0, 0, 0, 3, "Delay Analysis Report", formats['title'])
+
+        # Method and date
+        ws.write(2, 0, "Analysis Method:", formats['bold'])
+        ws.write(2, 1, result.method_name)
+        ws.write(3, 0, "Analysis Date:", formats['bold'])
+        ws.write(3, 1, result.analysis_date.strftime('%Y-%m-%d %H:%M:%S'))
+        row = 5
+
+        # Key metrics
+        ws.merge_range(row, 0, row, 3, "KEY METRICS", formats['section'])
+        row += 1
+
+        metrics = [
+            ("Total Delay", f"{result.total_delay_days:.1f} days"),
+            ("Critical Path Delay", f"{result.critical_delay_days:.1f} days"),
+            ("Affected Activities", result.delay_count),
+            ("Critical Activities Delayed", result.critical_activity_count),
+        ]
+
+        for metric, value in metrics:
+            ws.write(row, 0, metric, formats['bold'])
+            ws.write(row, 1, value)
+            row += 1
+
+        # Top delay causes
+        if result.delays_by_cause:
+            row += 1
+            ws.merge_range(row, 0, row, 3, "TOP DELAY CAUSES", formats['section'])
+            row += 1
+
+            ws.write_row(row, 0, ("Cause", "Days", "% of Total"), formats['bold_gray'])
+            row += 1
+
+            sorted_causes = heapq.nlargest(5, result.delays_by_cause.items(), key=lambda x: x[1])
+
+            for cause, days in sorted_causes:
+                pct = (days / result.total_delay_days * 100) if result.total_delay_days > 0 else 0
+                ws.write_row(row, 0, (cause, f"{days:.1f}", f"{pct:.1f}%"))
+                row += 1
+
+        # Recommendations
+        if result.recommendations:
+            row += 1
+            ws.merge_range(row, 0, row, 3, "RECOMMENDATIONS", formats['section'])
+            row += 1
+
+            for rec in result.recommendations:
+                ws.merge_range(row, 0, row, 3, f"• {rec}", formats['wrap'])
+                row += 1
+
+    def _write_detailed_sheet(self, wb, formats: dict, result: DelayAnalysisResult):
+        """Write the detailed activities sheet with xlsxwriter"""
+        ws = wb.add_worksheet("Detailed Analysis")
+
+        # Freeze header row
+        ws.freeze_panes(3, 0)
+
+        df = self._detailed_frame(result)
+
+        title = "Detailed Delay Analysis"
+        headers = [column.replace('_', ' ').title() for column in df.columns]
+
+        if not df.empty:
+            for col, width in enumerate(self._detailed_column_widths(df, headers, title)):
+                ws.set_column(col, col, width)
+
+        # Title
+        ws.write(0, 0, title, formats['sheet_title'])
+
+        if df.empty:
+            return
+
+        # Headers
+        ws.write_row(2, 0, headers, formats['header_center'])
+
+        # Data; missing values are left blank, as openpyxl does
+        if 'is_critical' in df.columns:
+            critical_rows = df['is_critical'].to_numpy(dtype=bool, na_value=False)
+        else:
+            critical_rows = np.zeros(len(df), dtype=bool)
+        date_cols = {i for i, dtype in enumerate(df.dtypes)
+                     if pd.api.types.is_datetime64_any_dtype(dtype)}
+
+        write = ws.write
+        write_blank = ws.write_blank
+        for row_num, (critical, row) in enumerate(
+                zip(critical_rows.tolist(), df.itertuples(index=False, name=None)), 3):
+            plain = formats['critical'] if critical else None
+            dated = formats['critical_date'] if critical else formats['date']
+            for col, value in enumerate(row):
+                cell_format = dated if col in date_cols or isinstance(value, datetime) else plain
+                if value is None or value != value:  # None, NaN or NaT
+                    if critical:
+                        write_blank(row_num, col, None, cell_format)
+                else:
+                    write(row_num, col, value, cell_format)
+
+    def _write_by_cause_sheet(self, wb, formats: dict, result: DelayAnalysisResult):
+        """Write the delays by cause sheet with xlsxwriter"""
+        ws = wb.add_worksheet("By Cause")
+
+        ws.set_column(0, 0, 30)
+        ws.set_column(1, 2, 15)
+        ws.set_column(3, 3, 12)
+
+        # Title
+        ws.write(0, 0, "Delays by Cause", formats['sheet_title'])
+
+        if result.delays_by_cause:
+            # Headers
+            ws.write_row(2, 0, ('Cause', 'Delay (Days)', 'Percentage', 'Impact'), formats['header'])
+
+            # Data, with the impact color coded
+            df = self._by_cause_frame(result)
+            for row_num, (cause, delay, percentage, level) in enumerate(
+                    df.itertuples(index=False, name=None), 3):
+                self._write_cells(ws, row_num, (cause, delay, percentage))
+                ws.write(row_num, 3, level, formats[level])
+
+    def _write_charts_sheet(self, wb, formats: dict, result: DelayAnalysisResult):
+        """Write the charts sheet with xlsxwriter"""
+        ws = wb.add_worksheet("Charts")
+
+        ws.write(0, 0, "Delay Analysis Charts", formats['chart_title'])
+
+        # Pie chart for delays by cause
+        if result.delays_by_cause:
+            ws.write_row(2, 0, ("Cause", "Days"))
+            row = 3
+
+            sorted_causes = heapq.nlargest(8, result.delays_by_cause.items(), key=lambda x: x[1])
+
+            for cause, days in sorted_causes:
+                self._write_cells(ws, row, (cause, days))
+                row += 1
+
+            # Same 20 x 12 cm chart as the openpyxl export
+            pie = wb.add_chart({'type': 'pie'})
+            pie.add_series({
+                'name': ["Charts", 2, 1],
+                'categories': ["Charts", 3, 0, row - 1, 0],
+                'values': ["Charts", 3, 1, row - 1, 1],
+            })
+            pie.set_title({'name': "Delays by Cause"})
+            pie.set_size({'width': 756, 'height': 454})
+
+            ws.insert_chart("D3", pie)
+
 
 def export_to_excel(result: DelayAnalysisResult, output_path: str,
-                   include_charts: bool = True) -> str:
+                   include_charts: bool = True, backend: str = 'auto') -> str:
     """
     Convenience function to export results to Excel
 
@@ -373,9 +702,10 @@ def export_to_excel(result: DelayAnalysisResult, output_path: str,
         result: DelayAnalysisResult object
         output_path: Path to save Excel file
         include_charts: Whether to include charts
+        backend: 'openpyxl', 'xlsxwriter' or 'auto'
 
     Returns:
         Path to saved file
     """
     exporter = ExcelExporter()
-    return exporter.export(result, output_path, include_charts)
+    return exporter.export(result, output_path, include_charts, backend)
@@ -2,15 +2,36 @@
 Parser for Microsoft Project files (MPP, XML)
 Note: For best compatibility, export MS Project files to XML format
 """
+import os
+import re
+from functools import lru_cache
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 import warnings
 
 from ..utils.schedule_utils import Schedule, ScheduleActivity
 from ..utils.date_utils import parse_date
 
 
+# PT[hours]H[minutes]M[seconds]S duration, each part optional
+_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:\d+(?:\.\d*)?S)?')
+
+# MS Project link type codes
+_RELATIONSHIP_TYPES = {
+    '0': 'FF',  # Finish-to-Finish
+    '1': 'FS',  # Finish-to-Start
+    '2': 'SS',  # Start-to-Start
+    '3': 'SF',  # Start-to-Finish
+}
+
+# Task child elements read by MSProjectParser._parse_task
+_TASK_FIELDS = (
+    'UID', 'Name', 'Summary', 'Start', 'Finish', 'ActualStart', 'ActualFinish',
+    'Duration', 'PercentComplete', 'TotalSlack', 'FreeSlack', 'WBS'
+)
+
+
 class MSProjectParser:
     """Parser for Microsoft Project XML files"""
 
@@ -18,23 +39,48 @@ class MSProjectParser:
         self.namespaces = {
             'ns': 'http://schemas.microsoft.com/project'
         }
+        self._set_namespace(self.namespaces['ns'])
+        self._date_cache = {}  # Date string -> parsed datetime (or None)
+
+    def _set_namespace(self, namespace: str):
+        """
+        Record the document namespace and its fully qualified tag names
 
-    def parse(self, file_path: str) -> Schedule:
+        Matching children against qualified tags avoids resolving the
+        'ns:' prefix on every lookup.
+
+        Args:
+            namespace: XML namespace URI
+        """
+        self.namespaces['ns'] = namespace
+        prefix = '{' + namespace + '}'
+        self._task_fields = {prefix + field: field for field in _TASK_FIELDS}
+        self._tag_uid = prefix + 'UID'
+        self._tag_predecessor_link = prefix + 'PredecessorLink'
+        self._tag_predecessor_uid = prefix + 'PredecessorUID'
+        self._tag_type = prefix + 'Type'
+        self._tag_link_lag = prefix + 'LinkLag'
+
+    def parse(self, source: Union[str, os.PathLike, BinaryIO]) -> Schedule:
         """
         Parse MS Project XML file and return Schedule object
 
         Args:
-            file_path: Path to MS Project XML file
+            source: Path to MS Project XML file, or a binary file object
+                (its ``name`` attribute, when present, selects the format)
 
         Returns:
             Schedule object with activities and relationships
         """
-        file_path_lower = file_path.lower()
+        if hasattr(source, 'read'):
+            file_path_lower = str(getattr(source, 'name', '') or '.xml').lower()
+        else:
+            file_path_lower = os.fspath(source).lower()
 
         if file_path_lower.endswith('.mpp'):
-            return self._parse_mpp(file_path)
+            return self._parse_mpp(source)
         elif file_path_lower.endswith('.xml'):
-            return self._parse_xml(file_path)
+            return self._parse_xml(source)
         else:
             raise ValueError("Unsupported file format. Use .xml or .mpp")
 
@@ -84,92 +130,118 @@ class MSProjectParser:
                 "3. Upload the XML file instead"
             )
 
-    def _parse_xml(self, file_path: str) -> Schedule:
+    def _parse_xml(self, source: Union[str, os.PathLike, BinaryIO]) -> Schedule:
         """
         Parse MS Project XML file
 
+        The document is read incrementally: each Task element is converted
+        as soon as it is complete and then dropped from the tree, so memory
+        stays flat regardless of the number of tasks.
+
         Args:
-            file_path: Path to XML file
+            source: Path to XML file or binary file object
 
         Returns:
             Schedule object
         """
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-
-            # Determine namespace
-            ns = ''
-            if root.tag.startswith('{'):
-                ns = root.tag[1:root.tag.index('}')]
-                self.namespaces['ns'] = ns
-
-            # Create schedule
             schedule = Schedule()
+            self._date_cache.clear()
+
+            project_fields = ('Name', 'StartDate', 'FinishDate', 'StatusDate')
+            project_elems = {}  # First element of each project field, in document order
+            project_values = {}
+            task_tag = None
+            field_tags = {}
+            stack = []
+
+            activities = []  # Parsed tasks, added to the schedule in one call
+            task_ids = set()  # UIDs of parsed tasks (activity IDs are the UIDs)
+            task_links = []  # (task UID, [(pred UID, link type, lag text)]) in document order
+
+            for event, elem in ET.iterparse(source, events=('start', 'end')):
+                if event == 'start':
+                    if not stack:
+                        # Determine namespace
+                        if elem.tag.startswith('{'):
+                            self._set_namespace(elem.tag[1:elem.tag.index('}')])
+                        prefix = '{' + self.namespaces['ns'] + '}'
+                        task_tag = prefix + 'Task'
+                        field_tags = {prefix + field: field for field in project_fields}
+
+                    field = field_tags.get(elem.tag)
+                    if field and field not in project_elems:
+                        project_elems[field] = elem
+                    stack.append(elem)
+                    continue
 
-            # Get project properties
-            project_name = root.find('.//ns:Name', self.namespaces)
-            if project_name is not None and project_name.text:
-                schedule.project_name = project_name.text
-
-            start_date = root.find('.//ns:StartDate', self.namespaces)
-            if start_date is not None and start_date.text:
-                schedule.project_start = self._parse_ms_date(start_date.text)
-
-            finish_date = root.find('.//ns:FinishDate', self.namespaces)
-            if finish_date is not None and finish_date.text:
-                schedule.project_finish = self._parse_ms_date(finish_date.text)
-
-            status_date = root.find('.//ns:StatusDate', self.namespaces)
-            if status_date is not None and status_date.text:
-                schedule.data_date = self._parse_ms_date(status_date.text)
+                stack.pop()
+                field = field_tags.get(elem.tag)
+                if field and project_elems.get(field) is elem:
+                    project_values[field] = elem.text
 
-            # Parse tasks
-            tasks = root.findall('.//ns:Task', self.namespaces)
-            task_map = {}  # Map UID to activity
+                if elem.tag != task_tag:
+                    continue
 
-            for task in tasks:
-                activity = self._parse_task(task)
+                # Parse task
+                # _parse_task only skips tasks without a UID, and the
+                # activity ID is the UID text
+                activity = self._parse_task(elem)
                 if activity:
-                    schedule.add_activity(activity)
-                    uid = task.find('ns:UID', self.namespaces)
-                    if uid is not None:
-                        task_map[uid.text] = activity.activity_id
+                    activities.append(activity)
+                    uid = activity.activity_id
+                    task_ids.add(uid)
+                    # Keep plain strings so the cleared subtree can be freed
+                    links = []
+                    for pred in elem.iter(self._tag_predecessor_link):
+                        pred_uid = pred.find(self._tag_predecessor_uid)
+                        if pred_uid is None:
+                            continue
+                        rel_type_elem = pred.find(self._tag_type)
+                        lag_elem = pred.find(self._tag_link_lag)
+                        links.append((
+                            pred_uid.text,
+                            _RELATIONSHIP_TYPES.get(rel_type_elem.text, 'FS') if rel_type_elem is not None else 'FS',
+                            lag_elem.text if lag_elem is not None else None
+                        ))
+                    task_links.append((uid, links))
+
+                # Release the task subtree once converted
+                if stack:
+                    stack[-1].remove(elem)
+                elem.clear()
+
+            schedule.add_activities(activities)
 
-            # Parse predecessors
-            for task in tasks:
-                uid = task.find('ns:UID', self.namespaces)
-                if uid is None:
-                    continue
+            # Get project properties
+            if project_values.get('Name'):
+                schedule.project_name = project_values['Name']
+            if project_values.get('StartDate'):
+                schedule.project_start = self._parse_ms_date(project_values['StartDate'])
+            if project_values.get('FinishDate'):
+                schedule.project_finish = self._parse_ms_date(project_values['FinishDate'])
+            if project_values.get('StatusDate'):
+                schedule.data_date = self._parse_ms_date(project_values['StatusDate'])
 
-                current_id = task_map.get(uid.text)
+            # Parse predecessors
+            relationships = []
+            for current_id, predecessors in task_links:
                 if not current_id:
                     continue
 
-                predecessors = task.findall('.//ns:PredecessorLink', self.namespaces)
-                for pred in predecessors:
-                    pred_uid = pred.find('ns:PredecessorUID', self.namespaces)
-                    if pred_uid is None:
-                        continue
-
-                    pred_id = task_map.get(pred_uid.text)
-                    if not pred_id:
+                for pred_id, rel_type, lag_text in predecessors:
+                    if not pred_id or pred_id not in task_ids:
                         continue
 
-                    # Get relationship type
-                    rel_type_elem = pred.find('ns:Type', self.namespaces)
-                    rel_type = self._get_relationship_type(
-                        rel_type_elem.text if rel_type_elem is not None else '1'
-                    )
-
                     # Get lag
-                    lag_elem = pred.find('ns:LinkLag', self.namespaces)
                     lag = 0
-                    if lag_elem is not None and lag_elem.text:
+                    if lag_text:
                         # LinkLag is in tenths of minutes
-                        lag = int(lag_elem.text) / 4800  # Convert to days
+                        lag = int(lag_text) / 4800  # Convert to days
+
+                    relationships.append((pred_id, current_id, rel_type, int(lag)))
 
-                    schedule.add_relationship(pred_id, current_id, rel_type, int(lag))
+            schedule.add_relationships(relationships)
 
             return schedule
 
@@ -188,61 +260,69 @@ class MSProjectParser:
         Returns:
             ScheduleActivity or None if summary task
         """
+        # Collect the task fields in one pass over its children, keeping
+        # the first element of each like find() does
+        fields = {}
+        for child in task_elem:
+            field = self._task_fields.get(child.tag)
+            if field is not None and field not in fields:
+                fields[field] = child
+
         # Skip summary tasks (optional)
-        summary = task_elem.find('ns:Summary', self.namespaces)
+        summary = fields.get('Summary')
         if summary is not None and summary.text == '1':
             # You can choose to include or exclude summary tasks
             pass
 
         # Get UID (unique identifier)
-        uid_elem = task_elem.find('ns:UID', self.namespaces)
+        uid_elem = fields.get('UID')
         if uid_elem is None:
             return None
         activity_id = uid_elem.text
 
         # Get name
-        name_elem = task_elem.find('ns:Name', self.namespaces)
+        name_elem = fields.get('Name')
         name = name_elem.text if name_elem is not None else f"Task {activity_id}"
 
         # Get dates
-        start_elem = task_elem.find('ns:Start', self.namespaces)
+        start_elem = fields.get('Start')
         start_date = self._parse_ms_date(start_elem.text) if start_elem is not None else None
 
-        finish_elem = task_elem.find('ns:Finish', self.namespaces)
+        finish_elem = fields.get('Finish')
         finish_date = self._parse_ms_date(finish_elem.text) if finish_elem is not None else None
 
         # Actual dates
-        actual_start_elem = task_elem.find('ns:ActualStart', self.namespaces)
+        actual_start_elem = fields.get('ActualStart')
         actual_start = self._parse_ms_date(actual_start_elem.text) if actual_start_elem is not None else None
 
-        actual_finish_elem = task_elem.find('ns:ActualFinish', self.namespaces)
+        actual_finish_elem = fields.get('ActualFinish')
         actual_finish = self._parse_ms_date(actual_finish_elem.text) if actual_finish_elem is not None else None
 
         # Duration (in minutes for MS Project XML)
-        duration_elem = task_elem.find('ns:Duration', self.namespaces)
+        duration_elem = fields.get('Duration')
         duration = 0
         if duration_elem is not None and duration_elem.text:
             # MS Project stores duration in format PT[hours]H[minutes]M
             duration = self._parse_duration(duration_elem.text)
 
         # Percent complete
-        percent_elem = task_elem.find('ns:PercentComplete', self.namespaces)
+        percent_elem = fields.get('PercentComplete')
         percent_complete = float(percent_elem.text) if percent_elem is not None and percent_elem.text else 0
 
         # Total slack/float (in minutes)
-        slack_elem = task_elem.find('ns:TotalSlack', self.namespaces)
+        slack_elem = fields.get('TotalSlack')
         total_float = 0
         if slack_elem is not None and slack_elem.text:
             total_float = self._parse_duration(slack_elem.text)
 
         # Free slack
-        free_slack_elem = task_elem.find('ns:FreeSlack', self.namespaces)
+        free_slack_elem = fields.get('FreeSlack')
         free_float = 0
         if free_slack_elem is not None and free_slack_elem.text:
             free_float = self._parse_duration(free_slack_elem.text)
 
         # WBS
-        wbs_elem = task_elem.find('ns:WBS', self.namespaces)
+        wbs_elem = fields.get('WBS')
         wbs = wbs_elem.text if wbs_elem is not None else ''
 
         activity = ScheduleActivity(
@@ -274,21 +354,29 @@ class MSProjectParser:
         if not date_str or date_str == 'NA':
             return None
 
+        # Tasks share a small set of dates, so most lookups are cache hits
+        try:
+            return self._date_cache[date_str]
+        except KeyError:
+            pass
+
         try:
             # MS Project uses ISO 8601 format
             # Handle both with and without timezone
             if 'T' in date_str:
                 if '+' in date_str or date_str.endswith('Z'):
                     # With timezone
-                    date_str = date_str.replace('Z', '+00:00')
-                    return datetime.fromisoformat(date_str.split('+')[0])
+                    value = datetime.fromisoformat(date_str.replace('Z', '+00:00').split('+')[0])
                 else:
                     # Without timezone
-                    return datetime.fromisoformat(date_str)
+                    value = datetime.fromisoformat(date_str)
             else:
-                return datetime.fromisoformat(date_str)
+                value = datetime.fromisoformat(date_str)
         except ValueError:
-            return parse_date(date_str)
+            value = parse_date(date_str)
+
+        self._date_cache[date_str] = value
+        return value
 
     def _parse_duration(self, duration_str: str) -> float:
         """
@@ -310,55 +398,50 @@ class MSProjectParser:
                 return minutes / 480  # 8 hours per day
 
             # Parse PT format
-            if duration_str.startswith('PT'):
-                duration_str = duration_str[2:]  # Remove PT
-                hours = 0
-                minutes = 0
-
-                if 'H' in duration_str:
-                    parts = duration_str.split('H')
-                    hours = int(parts[0])
-                    duration_str = parts[1] if len(parts) > 1 else ''
+            match = _DURATION_RE.fullmatch(duration_str)
+            if match is None:
+                return 0
 
-                if 'M' in duration_str:
-                    minutes = int(duration_str.split('M')[0])
-
-                total_minutes = hours * 60 + minutes
-                return total_minutes / 480  # 8 hours per day
-
-            return 0
+            hours, minutes = match.groups()
+            total_minutes = int(hours or 0) * 60 + int(minutes or 0)
+            return total_minutes / 480  # 8 hours per day
 
         except (ValueError, AttributeError):
             return 0
 
-    def _get_relationship_type(self, type_code: str) -> str:
-        """
-        Convert MS Project relationship type code to standard format
 
-        Args:
-            type_code: MS Project type code
+@lru_cache(maxsize=8)
+def _parse_msp_path(path: str, mtime_ns: int, size: int) -> Schedule:
+    """
+    Parse a schedule file, cached on its path and on-disk version
 
-        Returns:
-            Relationship type (FS, SS, FF, SF)
-        """
-        type_map = {
-            '0': 'FF',  # Finish-to-Finish
-            '1': 'FS',  # Finish-to-Start
-            '2': 'SS',  # Start-to-Start
-            '3': 'SF',  # Start-to-Finish
-        }
-        return type_map.get(str(type_code), 'FS')
+    Args:
+        path: Path to MS Project file
+        mtime_ns: Modification time, so an edited file is parsed again
+        size: File size in bytes
+
+    Returns:
+        Schedule object (shared; callers get clones)
+    """
+    return MSProjectParser().parse(path)
 
 
-def parse_msp_file(file_path: str) -> Schedule:
+def parse_msp_file(file_path: Union[str, BinaryIO]) -> Schedule:
     """
     Convenience function to parse MS Project file
 
+    Files given by path are parsed once per on-disk version; later calls
+    return a copy of the cached schedule.
+
     Args:
-        file_path: Path to MS Project file (.xml or .mpp)
+        file_path: Path to MS Project file (.xml or .mpp) or binary file object
 
     Returns:
         Schedule object
     """
-    parser = MSProjectParser()
-    return parser.parse(file_path)
+    if hasattr(file_path, 'read'):
+        return MSProjectParser().parse(file_path)
+
+    path = os.path.abspath(os.fspath(file_path))
+    stat = os.stat(path)
+    return _parse_msp_path(path, stat.st_mtime_ns, stat.st_size).clone()
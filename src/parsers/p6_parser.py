@@ -1,9 +1,13 @@
 """
 Parser for Primavera P6 XER files
 """
+import csv
+import io
+import re
 import tempfile
-from typing import Optional
+from typing import BinaryIO, Dict, Iterable, Optional, Union
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 try:
@@ -16,22 +20,224 @@ from ..utils.schedule_utils import Schedule, ScheduleActivity
 from ..utils.date_utils import parse_date
 
 
+# P6 link type codes
+_RELATIONSHIP_TYPES = {
+    'PR_FS': 'FS',  # Finish-to-Start
+    'PR_SS': 'SS',  # Start-to-Start
+    'PR_FF': 'FF',  # Finish-to-Finish
+    'PR_SF': 'SF',  # Start-to-Finish
+}
+
+# XER tables read by P6Parser
+_XER_TABLES = ('PROJECT', 'TASK', 'TASKPRED')
+
+# Start of a table section in an XER file
+_XER_TABLE_RE = re.compile(r'^%T\t', re.MULTILINE)
+
+
+def read_xer_tables(file_path: Union[str, Path, BinaryIO],
+                    tables: Optional[Iterable[str]] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Read the tables of an XER file into DataFrames
+
+    XER is tab-separated text: each table is a %T line naming it, a %F line
+    of field names and one %R line per row. Every wanted section goes
+    through a single read_csv call, so no object is built per row.
+
+    Args:
+        file_path: Path to XER file or binary file object
+        tables: Table names to read (all tables if None)
+
+    Returns:
+        Dictionary of table name to DataFrame, with every value as a
+        string ('' when empty)
+    """
+    if hasattr(file_path, 'read'):
+        data = file_path.read()
+    else:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    if isinstance(data, bytes):
+        try:
+            data = data.decode('utf-8')
+        except UnicodeDecodeError:
+            # P6 exports default to the Windows code page
+            data = data.decode('cp1252', errors='replace')
+
+    wanted = set(tables) if tables is not None else None
+    result = {}
+    for section in _XER_TABLE_RE.split(data)[1:]:
+        name, _, body = section.partition('\n')
+        name = name.strip()
+        if wanted is not None and name not in wanted:
+            continue
+        body = body.split('\n%E', 1)[0]
+        frame = pd.read_csv(io.StringIO(body), sep='\t', dtype=str, keep_default_na=False,
+                            quoting=csv.QUOTE_NONE, index_col=False)
+        # First column holds the %F/%R markers; short rows are padded with NaN
+        result[name] = frame.iloc[:, 1:].fillna('')
+
+    return result
+
+
+def _xer_numbers(frame: pd.DataFrame, column: str, default: float = 0) -> np.ndarray:
+    """
+    Numeric column of an XER table, with blanks and a missing column as default
+
+    Args:
+        frame: XER table
+        column: Field name
+        default: Value for blank or missing fields
+
+    Returns:
+        float64 array
+    """
+    if column not in frame.columns:
+        return np.full(len(frame), default, dtype=np.float64)
+    return pd.to_numeric(frame[column], errors='coerce').fillna(default).to_numpy(np.float64)
+
+
+def _xer_dates(frame: pd.DataFrame, column: str) -> list:
+    """
+    Date column of an XER table as datetime objects, None when blank
+
+    Args:
+        frame: XER table
+        column: Field name
+
+    Returns:
+        List of datetime or None
+    """
+    if column not in frame.columns:
+        return [None] * len(frame)
+    parsed = pd.to_datetime(frame[column], format='ISO8601', errors='coerce')
+    dates = np.array(parsed.dt.to_pydatetime(), dtype=object)
+    dates[parsed.isna().to_numpy()] = None
+    return dates.tolist()
+
+
 class P6Parser:
     """Parser for Primavera P6 XER files"""
 
-    def __init__(self):
-        if not XER_AVAILABLE:
-            raise ImportError(
-                "xerparser library is not installed. "
-                "Install it with: pip install xerparser"
+    def parse(self, file_path: Union[str, Path, BinaryIO]) -> Schedule:
+        """
+        Parse XER file and return Schedule object
+
+        The tables are read with pandas; files it cannot read are handed to
+        xerparser when it is installed.
+
+        Args:
+            file_path: Path to XER file, or a binary file object (read
+                directly, no temporary file needed)
+
+        Returns:
+            Schedule object with activities and relationships
+        """
+        try:
+            return self._parse_tables(read_xer_tables(file_path, _XER_TABLES))
+        except (ValueError, KeyError) as e:
+            if not XER_AVAILABLE:
+                raise Exception(f"Error parsing XER file: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Error parsing XER file: {str(e)}")
+
+        if hasattr(file_path, 'seek'):
+            file_path.seek(0)
+        return self._parse_xerparser(file_path)
+
+    def _parse_tables(self, tables: Dict[str, pd.DataFrame]) -> Schedule:
+        """
+        Build the schedule of the first exported project from XER tables
+
+        Args:
+            tables: PROJECT, TASK and TASKPRED tables from read_xer_tables
+
+        Returns:
+            Schedule object with activities and relationships
+        """
+        projects = tables.get('PROJECT')
+        if projects is None or projects.empty:
+            raise ValueError("No projects found in XER file")
+        if 'export_flag' in projects.columns and (projects['export_flag'] == 'Y').any():
+            projects = projects[projects['export_flag'] == 'Y']
+        project = projects.iloc[0]
+        proj_id = project['proj_id']
+
+        schedule = Schedule(project_name=project.get('proj_short_name') or proj_id)
+        schedule.project_start = _xer_dates(projects.iloc[:1], 'plan_start_date')[0]
+        schedule.project_finish = _xer_dates(projects.iloc[:1], 'plan_end_date')[0]
+        schedule.data_date = _xer_dates(projects.iloc[:1], 'last_recalc_date')[0]
+
+        tasks = tables.get('TASK', pd.DataFrame(columns=['task_id', 'proj_id']))
+        tasks = tasks[tasks['proj_id'] == proj_id]
+
+        def text(column, default=''):
+            if column in tasks.columns:
+                return tasks[column].tolist()
+            return [default] * len(tasks)
+
+        task_ids = tasks['task_id'].tolist()
+        target_start = _xer_dates(tasks, 'target_start_date')
+        target_end = _xer_dates(tasks, 'target_end_date')
+        early_start = _xer_dates(tasks, 'early_start_date')
+        early_end = _xer_dates(tasks, 'early_end_date')
+        schedule.add_activities(
+            ScheduleActivity(
+                activity_id=task_id,
+                name=name or code or task_id,
+                duration=duration,
+                start_date=start or es,
+                finish_date=finish or ef,
+                early_start=es,
+                early_finish=ef,
+                late_start=ls,
+                late_finish=lf,
+                total_float=total_float,
+                free_float=free_float,
+                actual_start=actual_start,
+                actual_finish=actual_finish,
+                percent_complete=percent or 0,
+                wbs=wbs,
+                calendar=calendar
             )
+            for (task_id, name, code, duration, start, finish, es, ef, ls, lf,
+                 total_float, free_float, actual_start, actual_finish, percent,
+                 wbs, calendar) in zip(
+                task_ids, text('task_name'), text('task_code'),
+                # Hours to days
+                (_xer_numbers(tasks, 'target_drtn_hr_cnt') / 8).tolist(),
+                target_start, target_end, early_start, early_end,
+                _xer_dates(tasks, 'late_start_date'), _xer_dates(tasks, 'late_end_date'),
+                (_xer_numbers(tasks, 'total_float_hr_cnt') / 8).tolist(),
+                (_xer_numbers(tasks, 'free_float_hr_cnt') / 8).tolist(),
+                _xer_dates(tasks, 'act_start_date'), _xer_dates(tasks, 'act_end_date'),
+                _xer_numbers(tasks, 'phys_complete_pct').tolist(),
+                text('wbs_id'), text('clndr_id', 'Standard')
+            )
+        )
 
-    def parse(self, file_path: str) -> Schedule:
+        # Links into this project's tasks, in task order (lags hours to days)
+        links = tables.get('TASKPRED')
+        if links is not None and not links.empty:
+            position = pd.Series(range(len(task_ids)), index=task_ids)
+            order = links['task_id'].map(position[~position.index.duplicated()])
+            links = links[order.notna()].iloc[order.dropna().argsort(kind='stable')]
+            rel_types = (links['pred_type'].map(_RELATIONSHIP_TYPES).fillna('FS').tolist()
+                         if 'pred_type' in links.columns else ['FS'] * len(links))
+            lags = _xer_numbers(links, 'lag_hr_cnt') / 8
+            schedule.add_relationships(zip(
+                links['pred_task_id'].tolist(), links['task_id'].tolist(), rel_types,
+                np.trunc(lags).astype(np.int64).tolist()
+            ))
+
+        return schedule
+
+    def _parse_xerparser(self, file_path: Union[str, Path, BinaryIO]) -> Schedule:
         """
-        Parse XER file and return Schedule object
+        Parse XER file with xerparser
 
         Args:
-            file_path: Path to XER file
+            file_path: Path to XER file or binary file object
 
         Returns:
             Schedule object with activities and relationships
@@ -56,22 +262,16 @@ class P6Parser:
                 schedule.data_date = project.last_recalc_date
 
             # Parse activities
-            for task in project.tasks:
-                activity = self._parse_activity(task)
-                schedule.add_activity(activity)
-
-            # Parse relationships
-            for task in project.tasks:
-                if hasattr(task, 'predecessors'):
-                    for pred in task.predecessors:
-                        rel_type = self._get_relationship_type(pred)
-                        lag = getattr(pred, 'lag_hr_cnt', 0) / 8  # Convert hours to days
-                        schedule.add_relationship(
-                            predecessor=pred.predecessor_task_id,
-                            successor=task.task_id,
-                            rel_type=rel_type,
-                            lag=int(lag)
-                        )
+            schedule.add_activities(self._parse_activity(task) for task in project.tasks)
+
+            # Parse relationships (lags converted from hours to days)
+            schedule.add_relationships([
+                (pred.predecessor_task_id, task.task_id,
+                 _RELATIONSHIP_TYPES.get(getattr(pred, 'pred_type', 'PR_FS'), 'FS'),
+                 int(getattr(pred, 'lag_hr_cnt', 0) / 8))
+                for task in project.tasks
+                for pred in getattr(task, 'predecessors', ())
+            ])
 
             return schedule
 
@@ -135,27 +335,6 @@ class P6Parser:
 
         return activity
 
-    def _get_relationship_type(self, relationship) -> str:
-        """
-        Get relationship type from XER relationship object
-
-        Args:
-            relationship: XER relationship object
-
-        Returns:
-            Relationship type string (FS, SS, FF, SF)
-        """
-        pred_type = getattr(relationship, 'pred_type', 'PR_FS')
-
-        type_map = {
-            'PR_FS': 'FS',  # Finish-to-Start
-            'PR_SS': 'SS',  # Start-to-Start
-            'PR_FF': 'FF',  # Finish-to-Finish
-            'PR_SF': 'SF',  # Start-to-Finish
-        }
-
-        return type_map.get(pred_type, 'FS')
-
     def get_available_projects(self, file_path: str) -> list:
         """
         Get list of available projects in XER file
@@ -166,6 +345,27 @@ class P6Parser:
         Returns:
             List of project dictionaries with id and name
         """
+        try:
+            projects = read_xer_tables(file_path, ('PROJECT',)).get(
+                'PROJECT', pd.DataFrame(columns=['proj_id']))
+            names = (projects['proj_short_name'].tolist() if 'proj_short_name' in projects.columns
+                     else [''] * len(projects))
+            return [
+                {'id': proj_id, 'name': name or proj_id, 'start': start, 'finish': finish}
+                for proj_id, name, start, finish in zip(
+                    projects['proj_id'].tolist(), names,
+                    _xer_dates(projects, 'plan_start_date'),
+                    _xer_dates(projects, 'plan_end_date')
+                )
+            ]
+        except (ValueError, KeyError) as e:
+            if not XER_AVAILABLE:
+                raise Exception(f"Error reading XER file: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Error reading XER file: {str(e)}")
+
+        if hasattr(file_path, 'seek'):
+            file_path.seek(0)
         try:
             xer = Xer.reader(file_path)
             projects = []
@@ -184,12 +384,12 @@ class P6Parser:
             raise Exception(f"Error reading XER file: {str(e)}")
 
 
-def parse_xer_file(file_path: str) -> Schedule:
+def parse_xer_file(file_path: Union[str, Path, BinaryIO]) -> Schedule:
     """
     Convenience function to parse XER file
 
     Args:
-        file_path: Path to XER file
+        file_path: Path to XER file or binary file object
 
     Returns:
         Schedule object
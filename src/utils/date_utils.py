@@ -1,11 +1,43 @@
 """
 Date utilities for schedule analysis
 """
-from datetime import datetime, timedelta
-from typing import Optional, Union
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional, Union
+import math
+import re
+import numpy as np
 import pandas as pd
 
 
+# Formats tried by parse_date, in order; the first match wins, so
+# day-first dates take precedence over month-first ones
+_DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+    '%m/%d/%Y',
+    '%Y-%m-%d %H:%M:%S',
+    '%d/%m/%Y %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+)
+
+# Shapes the formats above accept, with one or two ASCII digits per field
+# the way strptime reads them; matched strings are built without strptime
+_ISO_DATE_RE = re.compile(
+    r'(\d{4})-(\d{1,2})-(\d{1,2})(?:(?:\s+|[Tt])(\d{1,2}):(\d{1,2}):(\d{1,2}))?', re.ASCII)
+_SLASH_DATE_RE = re.compile(
+    r'(\d{1,2})/(\d{1,2})/(\d{4})(?:\s+(\d{1,2}):(\d{1,2}):(\d{1,2}))?', re.ASCII)
+
+_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Separators a format needs literally; the numeric directives never
+# consume them, so a string can only match formats with the same set
+_SEPARATORS = frozenset('-/:T')
+_DATE_FORMAT_SEPARATORS = tuple(
+    (fmt, _SEPARATORS.intersection(fmt)) for fmt in _DATE_FORMATS
+)
+
+
 def parse_date(date_input: Union[str, datetime, pd.Timestamp]) -> Optional[datetime]:
     """
     Parse various date formats into datetime object
@@ -26,25 +58,68 @@ def parse_date(date_input: Union[str, datetime, pd.Timestamp]) -> Optional[datet
         return date_input.to_pydatetime()
 
     if isinstance(date_input, str):
-        # Try common date formats
-        formats = [
-            '%Y-%m-%d',
-            '%d/%m/%Y',
-            '%m/%d/%Y',
-            '%Y-%m-%d %H:%M:%S',
-            '%d/%m/%Y %H:%M:%S',
-            '%Y-%m-%dT%H:%M:%S',
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_input, fmt)
-            except ValueError:
-                continue
+        return _parse_date_string(date_input)
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(date_str: str) -> Optional[datetime]:
+    """
+    Parse a date string with the first matching format
+
+    Schedules repeat the same dates many times, so results are cached.
+
+    Args:
+        date_str: Date string
+
+    Returns:
+        datetime object or None if no format matches
+    """
+    # ISO and slash dates are checked and built from their digits, so
+    # picking the format costs no ValueError; month-first is only tried
+    # for bare slash dates, as in _DATE_FORMATS
+    match = _ISO_DATE_RE.fullmatch(date_str)
+    if match:
+        year, month, day, *clock = match.groups()
+        orders = ((day, month),)
+    else:
+        match = _SLASH_DATE_RE.fullmatch(date_str)
+        if match:
+            first, second, year, *clock = match.groups()
+            orders = ((first, second), (second, first)) if clock[0] is None else ((first, second),)
+    if match:
+        year = int(year)
+        time = [int(part) for part in clock] if clock[0] is not None else [0, 0, 0]
+        for day, month in orders:
+            day, month = int(day), int(month)
+            if _is_valid_datetime(year, month, day, *time):
+                return datetime(year, month, day, *time)
+        return None
+
+    # strptime matches literals case-insensitively, hence upper()
+    separators = _SEPARATORS.intersection(date_str.upper())
+    for fmt, fmt_separators in _DATE_FORMAT_SEPARATORS:
+        if fmt_separators != separators:
+            continue
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
 
     return None
 
 
+def _is_valid_datetime(year: int, month: int, day: int,
+                       hour: int, minute: int, second: int) -> bool:
+    """Whether the fields make a valid datetime (checked without raising)"""
+    if not (1 <= year and 1 <= month <= 12 and hour <= 23 and minute <= 59 and second <= 59):
+        return False
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 1 <= day <= 29
+    return 1 <= day <= _MONTH_DAYS[month]
+
+
 def calculate_duration_days(start_date: datetime, end_date: datetime) -> int:
     """
     Calculate duration in calendar days between two dates
@@ -78,17 +153,16 @@ def calculate_working_days(start_date: datetime, end_date: datetime,
     if not start_date or not end_date:
         return 0
 
-    holidays = holidays or []
-    working_days = 0
-    current_date = start_date
-
-    while current_date <= end_date:
-        # Check if it's a weekday (Monday=0, Sunday=6)
-        if current_date.weekday() < 5 and current_date not in holidays:
-            working_days += 1
-        current_date += timedelta(days=1)
+    # Days are counted from start_date in whole-day steps up to end_date
+    last_offset = (end_date - start_date) // timedelta(days=1)
+    if last_offset < 0:
+        return 0
 
-    return working_days
+    first_day = _day(start_date)
+    return int(np.busday_count(
+        first_day, first_day + np.timedelta64(last_offset + 1, 'D'),
+        holidays=_holiday_days(start_date, holidays, 0)
+    ))
 
 
 def add_working_days(start_date: datetime, days: int, holidays: list = None) -> datetime:
@@ -103,16 +177,50 @@ def add_working_days(start_date: datetime, days: int, holidays: list = None) ->
     Returns:
         Resulting date
     """
-    holidays = holidays or []
-    current_date = start_date
-    days_added = 0
+    if days <= 0:
+        return start_date
+
+    # Rolling a non-working start back to the previous working day leaves
+    # the working days that follow it unchanged
+    first_day = _day(start_date)
+    last_day = np.busday_offset(first_day, math.ceil(days), roll='backward',
+                                holidays=_holiday_days(start_date, holidays, 1))
+    return start_date + timedelta(days=int((last_day - first_day) // np.timedelta64(1, 'D')))
 
-    while days_added < days:
-        current_date += timedelta(days=1)
-        if current_date.weekday() < 5 and current_date not in holidays:
-            days_added += 1
 
-    return current_date
+def _day(value: Union[datetime, date]) -> np.datetime64:
+    """Calendar day of a date or datetime"""
+    if isinstance(value, datetime):
+        value = value.date()
+    return np.datetime64(value, 'D')
+
+
+def _holiday_days(start_date: Union[datetime, date], holidays: Optional[list],
+                  min_offset: int) -> List[np.datetime64]:
+    """
+    Holidays that fall on a whole-day step from start_date
+
+    A holiday only counts when it equals start_date plus a number of days,
+    the way the day-by-day walk compared them (including the time of day).
+
+    Args:
+        start_date: Start of the walk
+        holidays: List of holiday dates
+        min_offset: Smallest day offset from start_date to keep
+
+    Returns:
+        Calendar days of the matching holidays
+    """
+    days = []
+    for holiday in holidays or []:
+        try:
+            offset = (holiday - start_date).days
+            matches = offset >= min_offset and start_date + timedelta(days=offset) == holiday
+        except TypeError:  # date and datetime never compare equal
+            continue
+        if matches:
+            days.append(_day(start_date) + np.timedelta64(offset, 'D'))
+    return days
 
 
 def format_date(date: datetime, format_str: str = '%Y-%m-%d') -> str:
@@ -128,6 +236,10 @@ def format_date(date: datetime, format_str: str = '%Y-%m-%d') -> str:
     """
     if not date:
         return ""
+    # Default format without the strftime dispatch; strftime doesn't pad
+    # years below 1000, so those stay on the generic path
+    if format_str == '%Y-%m-%d' and date.year >= 1000:
+        return f"{date.year}-{date.month:02d}-{date.day:02d}"
     return date.strftime(format_str)
 
 
@@ -145,6 +257,17 @@ def get_date_range(start_date: datetime, end_date: datetime) -> list:
     if not start_date or not end_date:
         return []
 
+    # Naive datetimes and plain dates: one numpy arange instead of a
+    # Python loop; tolist() converts back to datetime/date objects
+    kind = type(start_date)
+    if kind is type(end_date) and (
+            kind is date or (kind is datetime and start_date.tzinfo is None
+                             and end_date.tzinfo is None)):
+        unit = 'D' if kind is date else 'us'
+        start = np.datetime64(start_date, unit)
+        end = np.datetime64(end_date, unit)
+        return np.arange(start, end + 1, np.timedelta64(1, 'D')).tolist()
+
     dates = []
     current_date = start_date
 
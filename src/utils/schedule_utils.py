@@ -1,15 +1,147 @@
 """
 Schedule utilities for critical path and network analysis
 """
-from typing import Dict, List, Tuple, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Set
 from datetime import datetime, timedelta
-import networkx as nx
+from collections import deque
+from itertools import islice
+import hashlib
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Column types for preview frames, declared up front so pandas skips inference
+_PREVIEW_DTYPES = {
+    'activity_id': 'string',
+    'name': 'string',
+    'duration': 'float64',
+    'start_date': 'datetime64[ns]',
+    'finish_date': 'datetime64[ns]',
+    'early_start': 'datetime64[ns]',
+    'early_finish': 'datetime64[ns]',
+    'late_start': 'datetime64[ns]',
+    'late_finish': 'datetime64[ns]',
+    'total_float': 'float64',
+    'free_float': 'float64',
+    'actual_start': 'datetime64[ns]',
+    'actual_finish': 'datetime64[ns]',
+    'percent_complete': 'float64',
+    'is_critical': 'bool',
+    'wbs': 'string',
+    'calendar': 'string',
+}
+
+
+def _topological_order_python(indptr, indices, in_degree, order) -> int:
+    """
+    Kahn's algorithm over a CSR successor graph
+
+    Args:
+        indptr: CSR row pointers
+        indices: CSR successor positions
+        in_degree: Number of predecessors per activity, consumed in place
+        order: Output buffer, filled with activity positions
+
+    Returns:
+        Number of activities placed; fewer than all means a cycle
+    """
+    count = 0
+    for v in range(len(in_degree)):
+        if in_degree[v] == 0:
+            order[count] = v
+            count += 1
+    head = 0
+    while head < count:
+        v = order[head]
+        head += 1
+        for k in range(indptr[v], indptr[v + 1]):
+            w = indices[k]
+            in_degree[w] -= 1
+            if in_degree[w] == 0:
+                order[count] = w
+                count += 1
+    return count
+
+
+def _longest_to_targets_python(indptr, indices, durations, order, is_target, longest):
+    """
+    Longest total duration of a path from each activity to a target
+
+    Args:
+        indptr: CSR row pointers
+        indices: CSR successor positions
+        durations: Activity durations
+        order: Activity positions in topological order
+        is_target: Whether each activity can end a path
+        longest: Output buffer; -inf where no target is reachable
+    """
+    for k in range(len(order) - 1, -1, -1):
+        v = order[k]
+        best = 0.0 if is_target[v] else -np.inf
+        for e in range(indptr[v], indptr[v + 1]):
+            if longest[indices[e]] > best:
+                best = longest[indices[e]]
+        longest[v] = durations[v] + best
+
+
+def _longest_from_source_python(indptr, indices, durations, order, longest):
+    """
+    Longest total duration of a path from a source to each activity
+
+    Args:
+        indptr: CSR row pointers
+        indices: CSR successor positions
+        durations: Activity durations
+        order: Activity positions in topological order
+        longest: The source's duration at the source and -inf elsewhere,
+            updated in place
+    """
+    for k in range(len(order)):
+        v = order[k]
+        length = longest[v]
+        if length == -np.inf:
+            continue
+        for e in range(indptr[v], indptr[v + 1]):
+            w = indices[e]
+            candidate = length + durations[w]
+            if candidate > longest[w]:
+                longest[w] = candidate
+
+
+if NUMBA_AVAILABLE:
+    _topological_order_kernel = njit(cache=True)(_topological_order_python)
+    _longest_to_targets_kernel = njit(cache=True)(_longest_to_targets_python)
+    _longest_from_source_kernel = njit(cache=True)(_longest_from_source_python)
+else:
+    _topological_order_kernel = _topological_order_python
+    _longest_to_targets_kernel = _longest_to_targets_python
+    _longest_from_source_kernel = _longest_from_source_python
+
 
 class ScheduleActivity:
     """Represents a single activity in a schedule"""
 
+    # Schedules hold many activities; slots drop the per-instance dict
+    __slots__ = (
+        'activity_id', 'name', 'duration', 'start_date', 'finish_date',
+        'early_start', 'early_finish', 'late_start', 'late_finish',
+        'total_float', 'free_float', 'actual_start', 'actual_finish',
+        'percent_complete', 'predecessors', 'successors', 'calendar', 'wbs',
+        'resource_names',
+    )
+
     def __init__(self, activity_id: str, name: str, **kwargs):
         self.activity_id = activity_id
         self.name = name
@@ -53,6 +185,48 @@ class ScheduleActivity:
             return 0
         return self.duration * (1 - self.percent_complete / 100.0)
 
+    def clone(self, copy_links: bool = True) -> 'ScheduleActivity':
+        """
+        Copy the activity without going through copy.deepcopy
+
+        Field values are immutable apart from the link and resource lists,
+        which get their own copies unless copy_links is False.
+
+        Args:
+            copy_links: Copy the predecessor, successor and resource lists.
+                When False they are shared with this activity, for callers
+                that only change dates and durations.
+
+        Returns:
+            ScheduleActivity
+        """
+        clone = ScheduleActivity.__new__(ScheduleActivity)
+        clone.activity_id = self.activity_id
+        clone.name = self.name
+        clone.duration = self.duration
+        clone.start_date = self.start_date
+        clone.finish_date = self.finish_date
+        clone.early_start = self.early_start
+        clone.early_finish = self.early_finish
+        clone.late_start = self.late_start
+        clone.late_finish = self.late_finish
+        clone.total_float = self.total_float
+        clone.free_float = self.free_float
+        clone.actual_start = self.actual_start
+        clone.actual_finish = self.actual_finish
+        clone.percent_complete = self.percent_complete
+        clone.calendar = self.calendar
+        clone.wbs = self.wbs
+        if copy_links:
+            clone.predecessors = list(self.predecessors)
+            clone.successors = list(self.successors)
+            clone.resource_names = list(self.resource_names)
+        else:
+            clone.predecessors = self.predecessors
+            clone.successors = self.successors
+            clone.resource_names = self.resource_names
+        return clone
+
     def to_dict(self) -> dict:
         """Convert activity to dictionary"""
         return {
@@ -86,10 +260,153 @@ class Schedule:
         self.data_date = None
         self.project_start = None
         self.project_finish = None
+        self._fingerprint = None
+        self._activity_stats = None
+        self._critical_ids = None
+        self._critical_path = None
+        self._delayed_activities = None
+        self._arrow_table = None
+        self._topo_order = None
+        self._version = 0
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Short content hash of the schedule, computed once and reused
+
+        Covers the project dates, relationships and every activity field the
+        charts show (name, duration, planned and actual dates, progress and
+        float); it is reset by add_activity/add_relationship but not by
+        in-place activity edits.
+
+        Returns:
+            16-character hex digest
+        """
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(
+                f"{self.project_name}|{self.project_start}|{self.project_finish}\n".encode(),
+                digest_size=8
+            )
+            for act_id, act in self.activities.items():
+                digest.update(f"{act_id}|{act.name}|{act.duration}|"
+                              f"{act.start_date}|{act.finish_date}|"
+                              f"{act.actual_start}|{act.actual_finish}|"
+                              f"{act.percent_complete}|{act.total_float}\n".encode())
+            for rel in self.relationships:
+                digest.update(f"{rel}\n".encode())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    @property
+    def summary_stats(self) -> dict:
+        """
+        Summary statistics (see get_summary_stats)
+
+        Returns:
+            Dictionary with summary statistics
+        """
+        return self.get_summary_stats()
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever activities or relationships change"""
+        return self._version
+
+    @property
+    def critical_ids(self) -> frozenset:
+        """
+        IDs of critical activities, computed on first access and reused
+
+        Like fingerprint, it is reset by add_activity/add_relationship but
+        not by in-place activity edits.
+
+        Returns:
+            Frozen set of activity IDs with total float <= 0
+        """
+        if self._critical_ids is None:
+            self._critical_ids = frozenset(self._critical_activity_ids())
+        return self._critical_ids
+
+    def _critical_activity_ids(self) -> List[str]:
+        """
+        IDs of activities with total float <= 0, in schedule order
+
+        Same test as ScheduleActivity.is_critical, read from the attribute
+        directly so large schedules skip a property call per activity.
+
+        Returns:
+            List of activity IDs
+        """
+        return [
+            act_id for act_id, act in self.activities.items()
+            if (total_float := act.total_float) is not None and total_float <= 0
+        ]
+
+    def clone(self, copy_activities: bool = True, copy_links: bool = True) -> 'Schedule':
+        """
+        Copy the schedule without going through copy.deepcopy
+
+        Args:
+            copy_activities: Clone every activity. When False the activities
+                dict is new but shares its activity objects, for callers that
+                copy only the activities they modify.
+            copy_links: Passed to ScheduleActivity.clone; when False the
+                cloned activities share their link lists with this schedule,
+                so relationships must not be added to the clone
+
+        Returns:
+            Schedule with its own activities dict and relationships list
+        """
+        clone = Schedule.__new__(Schedule)
+        clone.__dict__.update(self.__dict__)
+        if copy_activities:
+            clone.activities = {aid: act.clone(copy_links) for aid, act in self.activities.items()}
+        else:
+            clone.activities = dict(self.activities)
+        clone.relationships = list(self.relationships)
+        clone._invalidate_caches()
+        # Same links as this schedule, so the same activity order
+        clone._topo_order = self._topo_order
+        return clone
+
+    def _invalidate_caches(self):
+        """Drop cached values derived from activities and relationships"""
+        self._fingerprint = None
+        self._activity_stats = None
+        self._critical_ids = None
+        self._critical_path = None
+        self._delayed_activities = None
+        self._arrow_table = None
+        self._topo_order = None
+        self._version += 1
+
+    def mark_dirty(self, links: bool = True):
+        """
+        Drop cached values after activities have been edited in place
+
+        Args:
+            links: False when only dates, durations or progress were edited,
+                which keeps the cached topological order
+        """
+        topo_order = self._topo_order
+        self._invalidate_caches()
+        if not links:
+            self._topo_order = topo_order
 
     def add_activity(self, activity: ScheduleActivity):
         """Add activity to schedule"""
         self.activities[activity.activity_id] = activity
+        self._invalidate_caches()
+
+    def add_activities(self, activities: Iterable[ScheduleActivity]):
+        """
+        Add several activities at once
+
+        Args:
+            activities: Activities to add, in order
+        """
+        self.activities.update((activity.activity_id, activity) for activity in activities)
+        self._invalidate_caches()
 
     def add_relationship(self, predecessor: str, successor: str,
                         rel_type: str = 'FS', lag: int = 0):
@@ -103,6 +420,7 @@ class Schedule:
             lag: Lag in days
         """
         self.relationships.append((predecessor, successor, rel_type, lag))
+        self._invalidate_caches()
 
         if predecessor in self.activities:
             if successor not in self.activities[predecessor].successors:
@@ -112,50 +430,194 @@ class Schedule:
             if predecessor not in self.activities[successor].predecessors:
                 self.activities[successor].predecessors.append(predecessor)
 
+    def add_relationships(self, relationships: Iterable[Tuple[str, str, str, int]]):
+        """
+        Add several relationships at once
+
+        Equivalent to calling add_relationship for each tuple, with the
+        cached values dropped only once.
+
+        Args:
+            relationships: (predecessor, successor, rel_type, lag) tuples
+        """
+        first = len(self.relationships)
+        self.relationships.extend(relationships)
+        self._invalidate_caches()
+
+        # Link lists stay ordered lists; sets of their contents, built on
+        # first use, keep the duplicate checks O(1) for the whole batch
+        activities = self.activities
+        linked_successors = {}
+        linked_predecessors = {}
+        for predecessor, successor, _, _ in islice(self.relationships, first, None):
+            pred_activity = activities.get(predecessor)
+            if pred_activity is not None:
+                seen = linked_successors.get(predecessor)
+                if seen is None:
+                    seen = linked_successors[predecessor] = set(pred_activity.successors)
+                if successor not in seen:
+                    seen.add(successor)
+                    pred_activity.successors.append(successor)
+
+            succ_activity = activities.get(successor)
+            if succ_activity is not None:
+                seen = linked_predecessors.get(successor)
+                if seen is None:
+                    seen = linked_predecessors[successor] = set(succ_activity.predecessors)
+                if predecessor not in seen:
+                    seen.add(predecessor)
+                    succ_activity.predecessors.append(predecessor)
+
+    def topological_order(self) -> List[str]:
+        """
+        Order activities so that every activity comes after its predecessors
+
+        Uses Kahn's algorithm on successor links between activities of this
+        schedule. Activities caught in a cycle are appended at the end in
+        insertion order. The order is computed once and reused until
+        activities or relationships change.
+
+        Returns:
+            List of activity IDs
+        """
+        if self._topo_order is None:
+            self._topo_order = tuple(self._kahn_order())
+        return list(self._topo_order)
+
+    def _kahn_order(self) -> List[str]:
+        """Kahn's algorithm behind topological_order"""
+        in_degree = dict.fromkeys(self.activities, 0)
+        for activity in self.activities.values():
+            for successor_id in activity.successors:
+                if successor_id in in_degree:
+                    in_degree[successor_id] += 1
+
+        queue = deque(act_id for act_id, degree in in_degree.items() if degree == 0)
+        order = []
+        while queue:
+            act_id = queue.popleft()
+            order.append(act_id)
+            for successor_id in self.activities[act_id].successors:
+                if successor_id in in_degree:
+                    in_degree[successor_id] -= 1
+                    if in_degree[successor_id] == 0:
+                        queue.append(successor_id)
+
+        if len(order) < len(self.activities):
+            placed = set(order)
+            order.extend(act_id for act_id in self.activities if act_id not in placed)
+
+        return order
+
     def get_critical_path(self) -> List[str]:
         """
         Calculate critical path using forward and backward pass
 
+        Finds the path of greatest total duration from a start activity (no
+        predecessors) to an end activity (no successors) with longest-path
+        passes over the relationship graph in topological order. Activities
+        are numbered and the links stored as a CSR graph, so the passes run
+        as compiled kernels when numba is installed. Among equally long
+        paths, the first start and end activities win, then the first
+        successor in relationship order. The path is computed once and
+        reused until activities or relationships change (see mark_dirty).
+
         Returns:
             List of activity IDs on critical path
         """
+        if self._critical_path is None:
+            self._critical_path = tuple(self._find_critical_path())
+        return list(self._critical_path)
+
+    def _find_critical_path(self) -> List[str]:
+        """Longest-path search behind get_critical_path"""
         if not self.activities:
             return []
 
-        # Build network graph
-        G = nx.DiGraph()
-
-        for act_id, activity in self.activities.items():
-            G.add_node(act_id, duration=activity.duration)
+        ids = list(self.activities)
+        index = {act_id: i for i, act_id in enumerate(ids)}
 
+        # Successors per activity in relationship order, without duplicates
+        successors = [{} for _ in ids]
         for pred, succ, rel_type, lag in self.relationships:
-            if pred in G and succ in G:
-                G.add_edge(pred, succ, type=rel_type, lag=lag)
-
-        # Find all paths from start to end activities
-        start_activities = [act_id for act_id, act in self.activities.items()
-                          if not act.predecessors]
-        end_activities = [act_id for act_id, act in self.activities.items()
-                        if not act.successors]
-
+            pred_pos = index.get(pred)
+            succ_pos = index.get(succ)
+            if pred_pos is not None and succ_pos is not None:
+                successors[pred_pos][succ_pos] = None
+        indptr = [0]
+        indices = []
+        for succs in successors:
+            indices.extend(succs)
+            indptr.append(len(indices))
+
+        activities = list(self.activities.values())
+        start_activities = [i for i, act in enumerate(activities) if not act.predecessors]
+        end_activities = [i for i, act in enumerate(activities) if not act.successors]
         if not start_activities or not end_activities:
             # Fallback: find activities with total_float == 0
-            return [act_id for act_id, act in self.activities.items() if act.is_critical]
-
-        # Find longest path (critical path)
-        critical_path = []
-        max_duration = 0
-
-        for start in start_activities:
-            for end in end_activities:
-                try:
-                    for path in nx.all_simple_paths(G, start, end):
-                        path_duration = sum(self.activities[act_id].duration for act_id in path)
-                        if path_duration > max_duration:
-                            max_duration = path_duration
-                            critical_path = path
-                except nx.NetworkXNoPath:
-                    continue
+            return self._critical_activity_ids()
+
+        n = len(ids)
+        is_end = [False] * n
+        for i in end_activities:
+            is_end[i] = True
+        durations = [act.duration for act in activities]
+        in_degree = [0] * n
+        for w in indices:
+            in_degree[w] += 1
+        if NUMBA_AVAILABLE:
+            indptr = np.array(indptr, dtype=np.int64)
+            indices = np.array(indices, dtype=np.int64)
+            durations = np.array(durations, dtype=np.float64)
+            is_end = np.array(is_end, dtype=np.bool_)
+            in_degree = np.array(in_degree, dtype=np.int64)
+
+        def buffer(value):
+            if NUMBA_AVAILABLE:
+                return np.full(n, value, dtype=np.int64 if isinstance(value, int) else np.float64)
+            return [value] * n
+
+        order = buffer(0)
+        if _topological_order_kernel(indptr, indices, in_degree, order) < n:
+            # Relationships form a cycle: fall back on total_float == 0
+            return self._critical_activity_ids()
+
+        # Longest path from each activity to any end activity picks the start
+        to_any_end = buffer(-np.inf)
+        _longest_to_targets_kernel(indptr, indices, durations, order, is_end, to_any_end)
+        max_duration = max(to_any_end[i] for i in start_activities)
+        if not max_duration > 0:
+            return []
+        start = next(i for i in start_activities if to_any_end[i] == max_duration)
+
+        # Longest path from the start to each activity picks the end
+        from_start = buffer(-np.inf)
+        from_start[start] = durations[start]
+        _longest_from_source_kernel(indptr, indices, durations, order, from_start)
+        reached_ends = [i for i in end_activities if from_start[i] != -np.inf]
+        longest_end = max(from_start[i] for i in reached_ends)
+        end = next(i for i in reached_ends if from_start[i] == longest_end)
+
+        # Longest path from each activity to that end, then walk it forward
+        is_target = [False] * n
+        is_target[end] = True
+        if NUMBA_AVAILABLE:
+            is_target = np.array(is_target, dtype=np.bool_)
+        to_end = buffer(-np.inf)
+        _longest_to_targets_kernel(indptr, indices, durations, order, is_target, to_end)
+
+        if NUMBA_AVAILABLE:
+            indptr, indices, durations, to_end = (
+                values.tolist() for values in (indptr, indices, durations, to_end)
+            )
+        critical_path = [ids[start]]
+        current = start
+        while current != end:
+            length = to_end[current]
+            duration = durations[current]
+            current = next(succ for succ in indices[indptr[current]:indptr[current + 1]]
+                           if to_end[succ] != -np.inf and duration + to_end[succ] == length)
+            critical_path.append(ids[current])
 
         return critical_path
 
@@ -169,54 +631,199 @@ class Schedule:
         Returns:
             List of activities
         """
-        return [act for act in self.activities.values()
-                if act.total_float is not None and act.total_float <= max_float]
+        return list(self.iter_activities_by_float(max_float))
+
+    def iter_activities_by_float(self, max_float: float = 0) -> Iterator[ScheduleActivity]:
+        """
+        Iterate over activities with total float less than or equal to threshold
+
+        Lazy version of get_activities_by_float, for callers that count the
+        activities or stop early.
+
+        Args:
+            max_float: Maximum total float
+
+        Returns:
+            Iterator of activities
+        """
+        return (act for act in self.activities.values()
+                if (total_float := act.total_float) is not None and total_float <= max_float)
 
     def get_delayed_activities(self) -> List[ScheduleActivity]:
         """
         Get activities that are delayed (actual dates exceed planned dates)
 
+        The scan is done once and reused until the activities change.
+
         Returns:
             List of delayed activities
         """
-        delayed = []
-        for activity in self.activities.values():
-            if activity.actual_finish and activity.finish_date:
-                if activity.actual_finish > activity.finish_date:
-                    delayed.append(activity)
-            elif activity.actual_start and activity.start_date:
-                if activity.actual_start > activity.start_date:
-                    delayed.append(activity)
-        return delayed
+        if self._delayed_activities is None:
+            delayed = []
+            for activity in self.activities.values():
+                if activity.actual_finish and activity.finish_date:
+                    if activity.actual_finish > activity.finish_date:
+                        delayed.append(activity)
+                elif activity.actual_start and activity.start_date:
+                    if activity.actual_start > activity.start_date:
+                        delayed.append(activity)
+            self._delayed_activities = tuple(delayed)
+        return list(self._delayed_activities)
 
     def to_dataframe(self) -> pd.DataFrame:
         """
         Convert schedule to pandas DataFrame
 
+        When pyarrow is installed the frame is converted from the cached
+        Arrow table (see to_arrow), so repeated calls skip the per-activity
+        dict building.
+
         Returns:
             DataFrame with all activities
         """
+        if PYARROW_AVAILABLE:
+            table = self.to_arrow()
+            if table is not None:
+                return table.to_pandas()
+
         data = [act.to_dict() for act in self.activities.values()]
         return pd.DataFrame(data)
 
+    def to_soa(self, activity_ids: Optional[List[str]] = None) -> tuple:
+        """
+        Snapshot activity dates and successor links into NumPy arrays
+
+        Dates are int64 microseconds since the epoch, with the minimum int64
+        standing for a missing date; successors are stored as a CSR graph
+        over activity positions.
+
+        Args:
+            activity_ids: Activities to include, in this order (default: all,
+                in insertion order). Links to other activities are dropped.
+
+        Returns:
+            Tuple of (ids, index, start, finish, succ_indptr, succ_indices) where
+            index maps activity ID to position
+        """
+        ids = list(self.activities) if activity_ids is None else list(activity_ids)
+        index = {act_id: i for i, act_id in enumerate(ids)}
+        activities = [self.activities[act_id] for act_id in ids]
+
+        start = np.array([a.start_date for a in activities], dtype='datetime64[us]').view(np.int64)
+        finish = np.array([a.finish_date for a in activities], dtype='datetime64[us]').view(np.int64)
+
+        succ_indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+        succ_list = []
+        for i, activity in enumerate(activities):
+            succ_list.extend(index[s] for s in activity.successors if s in index)
+            succ_indptr[i + 1] = len(succ_list)
+        succ_indices = np.array(succ_list, dtype=np.int64)
+
+        return ids, index, start, finish, succ_indptr, succ_indices
+
+    def to_arrow(self) -> Optional['pa.Table']:
+        """
+        Convert schedule to an Arrow table, built once and reused
+
+        The table is reset with the other caches when activities change.
+
+        Returns:
+            pyarrow Table with all activities, or None if the activity values
+            cannot be typed as Arrow columns (e.g. mixed ID types)
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError(
+                "pyarrow is required for to_arrow(). "
+                "Install it with: pip install pyarrow"
+            )
+
+        if self._arrow_table is None:
+            try:
+                self._arrow_table = pa.Table.from_pylist(
+                    [act.to_dict() for act in self.activities.values()]
+                )
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                return None
+        return self._arrow_table
+
+    def head_dataframe(self, n: int = 20) -> pd.DataFrame:
+        """
+        Build a typed DataFrame of the first activities only
+
+        Args:
+            n: Number of activities to include
+
+        Returns:
+            DataFrame with at most n activities
+        """
+        data = [act.to_dict() for act in islice(self.activities.values(), n)]
+        df = pd.DataFrame(data, columns=list(_PREVIEW_DTYPES))
+        return df.astype(_PREVIEW_DTYPES)
+
     def get_summary_stats(self) -> dict:
         """
         Get summary statistics for the schedule
 
+        Activity counts and totals are computed once and reused until the
+        activities change (see mark_dirty); project dates are read each call.
+
         Returns:
             Dictionary with summary statistics
         """
-        df = self.to_dataframe()
+        if self._activity_stats is None:
+            # One pass over the activities; missing durations and progress
+            # are skipped like the DataFrame sum and mean used to
+            completed = in_progress = not_started = 0
+            total_duration = 0
+            duration_count = 0
+            missing_durations = nan_durations = False
+            completion_sum = 0
+            completion_count = 0
+            for activity in self.activities.values():
+                if activity.actual_start is None:
+                    not_started += 1
+                if activity.actual_finish is not None:
+                    completed += 1
+                elif activity.actual_start is not None:
+                    in_progress += 1
+
+                duration = activity.duration
+                if duration is None:
+                    missing_durations = True
+                elif duration != duration:
+                    nan_durations = True
+                else:
+                    total_duration += duration
+                    duration_count += 1
+
+                percent = activity.percent_complete
+                if percent is not None and percent == percent:
+                    completion_sum += percent
+                    completion_count += 1
+
+            # A column with NaN, or with None next to numbers, sums as float
+            if nan_durations or (missing_durations and duration_count):
+                total_duration = float(total_duration)
+
+            if not self.activities:
+                avg_completion = 0
+            elif completion_count:
+                avg_completion = completion_sum / completion_count
+            else:
+                avg_completion = float('nan')
+
+            self._activity_stats = {
+                'total_activities': len(self.activities),
+                'critical_activities': len(self.critical_ids),
+                'completed_activities': completed,
+                'in_progress_activities': in_progress,
+                'not_started_activities': not_started,
+                'total_duration': total_duration,
+                'avg_completion': avg_completion,
+            }
 
         return {
-            'total_activities': len(self.activities),
-            'critical_activities': len([a for a in self.activities.values() if a.is_critical]),
-            'completed_activities': len([a for a in self.activities.values() if a.is_finished]),
-            'in_progress_activities': len([a for a in self.activities.values()
-                                          if a.is_started and not a.is_finished]),
-            'not_started_activities': len([a for a in self.activities.values() if not a.is_started]),
-            'total_duration': df['duration'].sum() if 'duration' in df else 0,
-            'avg_completion': df['percent_complete'].mean() if 'percent_complete' in df else 0,
+            **self._activity_stats,
             'project_start': self.project_start,
             'project_finish': self.project_finish,
             'data_date': self.data_date
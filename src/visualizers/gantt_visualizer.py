@@ -1,26 +1,47 @@
 """
 Gantt Chart Visualizer for Schedules
 """
+import heapq
+import numpy as np
 import plotly.figure_factory as ff
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import List, Dict, Optional
-import pandas as pd
 
 from ..utils.schedule_utils import Schedule, ScheduleActivity
+from ..utils.date_utils import format_date
+
+# Above this many bars, Gantt charts are drawn with WebGL line segments
+# instead of SVG bars, which the browser struggles to lay out at that size
+WEBGL_THRESHOLD = 100
+
+
+def _start_date_key(activity: ScheduleActivity) -> datetime:
+    """Sort key on start date, with undated activities last"""
+    return activity.start_date or datetime.max
+
+
+def _empty_figure(message: str) -> go.Figure:
+    """Figure holding only a centered message, for charts with nothing to draw"""
+    return go.Figure(layout=dict(annotations=[dict(
+        text=message,
+        xref="paper", yref="paper",
+        x=0.5, y=0.5, showarrow=False
+    )]))
 
 
 class GanttVisualizer:
     """Create Gantt charts for schedule visualization"""
 
-    def __init__(self):
-        self.colors = {
-            'critical': 'rgb(255, 65, 54)',      # Red
-            'completed': 'rgb(99, 186, 100)',    # Green
-            'in_progress': 'rgb(255, 185, 0)',   # Orange
-            'not_started': 'rgb(66, 133, 244)',  # Blue
-            'delayed': 'rgb(255, 0, 0)',         # Dark red
-        }
+    # Bar colors by activity status, shared by all instances
+    colors = {
+        'critical': 'rgb(255, 65, 54)',      # Red
+        'completed': 'rgb(99, 186, 100)',    # Green
+        'in_progress': 'rgb(255, 185, 0)',   # Orange
+        'not_started': 'rgb(66, 133, 244)',  # Blue
+        'delayed': 'rgb(255, 0, 0)',         # Dark red
+    }
 
     def create_gantt(self, schedule: Schedule, title: str = "Project Schedule",
                     show_critical_only: bool = False,
@@ -41,83 +62,50 @@ class GanttVisualizer:
 
         # Filter critical only if requested
         if show_critical_only:
-            activities = [a for a in activities if a.is_critical]
-
-        # Sort by start date
-        activities = sorted(
-            activities,
-            key=lambda x: x.start_date if x.start_date else datetime.max
-        )
-
-        # Limit number of activities
-        if len(activities) > max_activities:
-            activities = activities[:max_activities]
-
-        # Prepare data for Gantt chart
-        gantt_data = []
-
+            critical_ids = schedule.critical_ids
+            activities = [a for a in activities if a.activity_id in critical_ids]
+
+        # Earliest activities by start date, limited to max_activities;
+        # nsmallest keeps the sort stable without ordering the whole schedule
+        if 0 <= max_activities < len(activities):
+            activities = heapq.nsmallest(max_activities, activities, key=_start_date_key)
+        else:
+            activities = sorted(activities, key=_start_date_key)[:max_activities]
+
+        # One pass from activities to bars: (legend group, color, label,
+        # start, finish, hover text)
+        colors = self.colors
+        rows = []
         for activity in activities:
-            if not activity.start_date or not activity.finish_date:
+            start, finish = activity.start_date, activity.finish_date
+            if not start or not finish:
                 continue
 
             # Determine color
-            if activity.is_critical:
-                color = self.colors['critical']
+            critical = activity.is_critical
+            if critical:
+                color = colors['critical']
             elif activity.is_finished:
-                color = self.colors['completed']
+                color = colors['completed']
             elif activity.is_started:
-                color = self.colors['in_progress']
+                color = colors['in_progress']
             else:
-                color = self.colors['not_started']
-
-            gantt_data.append(dict(
-                Task=activity.name[:50] if len(activity.name) > 50 else activity.name,
-                Start=activity.start_date,
-                Finish=activity.finish_date,
-                Resource=f"{'Critical' if activity.is_critical else 'Normal'}",
-                Complete=activity.percent_complete,
-                Color=color
+                color = colors['not_started']
+
+            label = activity.name[:50]
+            rows.append((
+                'Critical' if critical else 'Normal', color, label, start, finish,
+                f"<b>{label}</b><br>"
+                f"Start: {format_date(start)}<br>"
+                f"Finish: {format_date(finish)}<br>"
+                f"Duration: {(finish - start).days} days<br>"
+                f"Progress: {activity.percent_complete:.0f}%<br>"
             ))
 
-        if not gantt_data:
-            # Return empty figure
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No activities with valid dates to display",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
-
-        # Create figure using graph_objects for more control
-        fig = go.Figure()
+        if not rows:
+            return _empty_figure("No activities with valid dates to display")
 
-        # Add bars for each activity
-        for i, task in enumerate(gantt_data):
-            # Calculate duration in milliseconds for Plotly
-            duration_ms = (task['Finish'] - task['Start']).total_seconds() * 1000
-            duration_days = (task['Finish'] - task['Start']).days
-
-            fig.add_trace(go.Bar(
-                x=[duration_ms],
-                y=[task['Task']],
-                base=task['Start'],
-                orientation='h',
-                marker=dict(color=task['Color']),
-                name=task['Resource'],
-                showlegend=(i == 0 or (i > 0 and task['Resource'] != gantt_data[i-1]['Resource'])),
-                hovertemplate=(
-                    f"<b>{task['Task']}</b><br>"
-                    f"Start: {task['Start'].strftime('%Y-%m-%d')}<br>"
-                    f"Finish: {task['Finish'].strftime('%Y-%m-%d')}<br>"
-                    f"Duration: {duration_days} days<br>"
-                    f"Progress: {task['Complete']:.0f}%<br>"
-                    "<extra></extra>"
-                )
-            ))
-
-        # Update layout
-        fig.update_layout(
+        fig = go.Figure(layout=dict(
             title=title,
             xaxis=dict(
                 title='Date',
@@ -128,10 +116,15 @@ class GanttVisualizer:
                 autorange='reversed'  # Reverse to show first activity at top
             ),
             barmode='overlay',
-            height=max(400, len(gantt_data) * 25),
+            height=max(400, len(rows) * 25),
             showlegend=True,
             hovermode='closest'
-        )
+        ))
+        if len(rows) > WEBGL_THRESHOLD:
+            # Large charts: one WebGL trace per color
+            self._add_webgl_bars(fig, rows, line_width=18)
+        else:
+            self._add_bars(fig, rows)
 
         return fig
 
@@ -148,103 +141,56 @@ class GanttVisualizer:
         Returns:
             Plotly figure
         """
-        # Get common activities
-        common_ids = set(baseline.activities.keys()) & set(current.activities.keys())
 
-        data = []
+        # Bars as (type, color, label, start, finish, hover text), kept in
+        # one list per schedule so baseline bars are drawn first
+        colors = {'Baseline': 'rgba(100, 100, 255, 0.5)', 'Current': 'rgba(255, 100, 100, 0.5)'}
+        baseline_rows = []
+        current_rows = []
+
+        def bar(rows, bar_type, activity):
+            label = f"{activity.name} ({bar_type})"
+            rows.append((
+                bar_type, colors[bar_type], label, activity.start_date, activity.finish_date,
+                f"<b>{bar_type}</b><br>"
+                f"{label}<br>"
+                f"Start: {format_date(activity.start_date)}<br>"
+                f"Finish: {format_date(activity.finish_date)}<br>"
+            ))
 
-        for act_id in common_ids:
-            baseline_act = baseline.activities[act_id]
-            current_act = current.activities[act_id]
+        # Activities in both schedules, in baseline order
+        current_activities = current.activities
+        for act_id, baseline_act in baseline.activities.items():
+            current_act = current_activities.get(act_id)
+            if current_act is None:
+                continue
 
             if not baseline_act.start_date or not baseline_act.finish_date:
                 continue
 
-            # Baseline bar
-            data.append(dict(
-                Task=f"{baseline_act.name} (Baseline)",
-                Start=baseline_act.start_date,
-                Finish=baseline_act.finish_date,
-                Type='Baseline'
-            ))
+            bar(baseline_rows, 'Baseline', baseline_act)
 
             # Current/actual bar
             if current_act.start_date and current_act.finish_date:
-                data.append(dict(
-                    Task=f"{current_act.name} (Current)",
-                    Start=current_act.start_date,
-                    Finish=current_act.finish_date,
-                    Type='Current'
-                ))
-
-        if not data:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No common activities to compare",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
-
-        df = pd.DataFrame(data)
+                bar(current_rows, 'Current', current_act)
 
-        # Create figure
-        fig = go.Figure()
+        rows = baseline_rows + current_rows
+        if not rows:
+            return _empty_figure("No common activities to compare")
 
-        # Add baseline bars
-        baseline_df = df[df['Type'] == 'Baseline']
-        for idx, row in baseline_df.iterrows():
-            # Calculate duration in milliseconds for Plotly
-            duration_ms = (row['Finish'] - row['Start']).total_seconds() * 1000
-
-            fig.add_trace(go.Bar(
-                x=[duration_ms],
-                y=[row['Task']],
-                base=row['Start'],
-                orientation='h',
-                marker=dict(color='rgba(100, 100, 255, 0.5)'),
-                name='Baseline',
-                showlegend=bool(idx == baseline_df.index[0]),
-                hovertemplate=(
-                    f"<b>Baseline</b><br>"
-                    f"{row['Task']}<br>"
-                    f"Start: {row['Start'].strftime('%Y-%m-%d')}<br>"
-                    f"Finish: {row['Finish'].strftime('%Y-%m-%d')}<br>"
-                    "<extra></extra>"
-                )
-            ))
-
-        # Add current bars
-        current_df = df[df['Type'] == 'Current']
-        for idx, row in current_df.iterrows():
-            # Calculate duration in milliseconds for Plotly
-            duration_ms = (row['Finish'] - row['Start']).total_seconds() * 1000
-
-            fig.add_trace(go.Bar(
-                x=[duration_ms],
-                y=[row['Task']],
-                base=row['Start'],
-                orientation='h',
-                marker=dict(color='rgba(255, 100, 100, 0.5)'),
-                name='Current',
-                showlegend=bool(idx == current_df.index[0]),
-                hovertemplate=(
-                    f"<b>Current</b><br>"
-                    f"{row['Task']}<br>"
-                    f"Start: {row['Start'].strftime('%Y-%m-%d')}<br>"
-                    f"Finish: {row['Finish'].strftime('%Y-%m-%d')}<br>"
-                    "<extra></extra>"
-                )
-            ))
-
-        fig.update_layout(
+        fig = go.Figure(layout=dict(
             title=title,
             xaxis=dict(title='Date', type='date'),
             yaxis=dict(title='Activities', autorange='reversed'),
             barmode='overlay',
-            height=max(400, len(data) * 15),
+            height=max(400, len(rows) * 15),
             showlegend=True
-        )
+        ))
+        if len(rows) > WEBGL_THRESHOLD:
+            # Large charts: one WebGL trace per schedule
+            self._add_webgl_bars(fig, rows, line_width=10)
+        else:
+            self._add_bars(fig, rows)
 
         return fig
 
@@ -263,13 +209,7 @@ class GanttVisualizer:
         critical_path = schedule.get_critical_path()
 
         if not critical_path:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No critical path found",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return _empty_figure("No critical path found")
 
         # Get critical activities
         critical_activities = [
@@ -279,10 +219,7 @@ class GanttVisualizer:
         ]
 
         # Sort by start date
-        critical_activities = sorted(
-            critical_activities,
-            key=lambda x: x.start_date if x.start_date else datetime.max
-        )
+        critical_activities = sorted(critical_activities, key=_start_date_key)
 
         gantt_data = []
 
@@ -298,44 +235,22 @@ class GanttVisualizer:
             ))
 
         if not gantt_data:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No valid critical activities to display",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
-
-        # Create figure
-        fig = go.Figure()
-
-        for task in gantt_data:
-            # Calculate duration in milliseconds for Plotly
-            duration_ms = (task['Finish'] - task['Start']).total_seconds() * 1000
-
-            fig.add_trace(go.Bar(
-                x=[duration_ms],
-                y=[task['Task']],
-                base=task['Start'],
-                orientation='h',
-                marker=dict(color=self.colors['critical']),
-                name='Critical',
-                showlegend=False,
-                hovertemplate=(
-                    f"<b>{task['Task']}</b><br>"
-                    f"Start: {task['Start'].strftime('%Y-%m-%d')}<br>"
-                    f"Finish: {task['Finish'].strftime('%Y-%m-%d')}<br>"
-                    f"Float: {task['Float']:.1f} days<br>"
-                    "<extra></extra>"
-                )
-            ))
+            return _empty_figure("No valid critical activities to display")
 
-        fig.update_layout(
+        fig = go.Figure(layout=dict(
             title=title,
             xaxis=dict(title='Date', type='date'),
             yaxis=dict(title='Critical Activities', autorange='reversed'),
             height=max(400, len(gantt_data) * 30),
-        )
+        ))
+        self._add_bars(fig, [
+            ('Critical', self.colors['critical'], task['Task'], task['Start'], task['Finish'],
+             f"<b>{task['Task']}</b><br>"
+             f"Start: {format_date(task['Start'])}<br>"
+             f"Finish: {format_date(task['Finish'])}<br>"
+             f"Float: {task['Float']:.1f} days<br>")
+            for task in gantt_data
+        ], showlegend=False)
 
         return fig
 
@@ -352,41 +267,40 @@ class GanttVisualizer:
             Plotly figure
         """
         if not delays:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No delays to visualize",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return _empty_figure("No delays to visualize")
 
-        # Sort by date
-        delays_with_dates = [d for d in delays if 'event_date' in d or 'window_start' in d]
-        delays_with_dates = sorted(
-            delays_with_dates,
-            key=lambda x: x.get('event_date') or x.get('window_start') or datetime.min
-        )
+        # Dated delays sorted by date; the date is looked up once per delay
+        # and undated ones are dropped before sorting rather than after
+        dated_delays = [
+            (date, delay) for delay in delays
+            if (date := delay.get('event_date') or delay.get('window_start'))
+        ]
+        dated_delays.sort(key=itemgetter(0))
 
-        fig = go.Figure()
+        fig = go.Figure(layout=dict(
+            title=title,
+            xaxis=dict(title='Date'),
+            yaxis=dict(title='Delay (days)'),
+            height=500,
+            showlegend=False
+        ))
 
         # Create scatter plot for delay events
         dates = []
         magnitudes = []
         labels = []
 
-        for delay in delays_with_dates:
-            date = delay.get('event_date') or delay.get('window_start')
-            if date:
-                dates.append(date)
-                magnitudes.append(delay.get('delay_days', 0))
-                labels.append(delay.get('activity_name', 'Unknown'))
+        for date, delay in dated_delays:
+            dates.append(date)
+            magnitudes.append(delay.get('delay_days', 0))
+            labels.append(delay.get('activity_name', 'Unknown'))
 
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=dates,
             y=magnitudes,
             mode='markers+lines',
             marker=dict(
-                size=[min(50, max(10, d)) for d in magnitudes],
+                size=np.clip(magnitudes, 10, 50),
                 color=magnitudes,
                 colorscale='Reds',
                 showscale=True,
@@ -401,16 +315,86 @@ class GanttVisualizer:
             )
         ))
 
-        fig.update_layout(
-            title=title,
-            xaxis=dict(title='Date'),
-            yaxis=dict(title='Delay (days)'),
-            height=500,
-            showlegend=False
-        )
-
         return fig
 
+    def _add_bars(self, fig: go.Figure, rows: List[tuple], showlegend: bool = True):
+        """
+        Draw horizontal bars as one SVG bar trace per group
+
+        Bars keep their own color through a marker color array, so a
+        group needs a single trace however many bars it holds.
+
+        Args:
+            fig: Figure to add the traces to
+            rows: (group name, color, label, start, finish, hover text) per bar, in display order
+            showlegend: Show one legend entry per group
+        """
+        groups = {}
+        for name, color, label, start, finish, hover in rows:
+            durations, labels, starts, colors, texts = groups.setdefault(name, ([], [], [], [], []))
+            # Plotly takes date-axis bar lengths in milliseconds
+            durations.append((finish - start).total_seconds() * 1000)
+            labels.append(label)
+            starts.append(start)
+            colors.append(color)
+            texts.append(hover)
+
+        fig.add_traces([
+            dict(
+                type='bar',
+                x=durations,
+                y=labels,
+                base=starts,
+                orientation='h',
+                marker=dict(color=colors),
+                name=name,
+                showlegend=showlegend,
+                hovertext=texts,
+                hovertemplate="%{hovertext}<extra></extra>"
+            )
+            for name, (durations, labels, starts, colors, texts) in groups.items()
+        ])
+
+        # Keep rows in the given order rather than trace order
+        fig.update_yaxes(categoryorder='array',
+                         categoryarray=list(dict.fromkeys(row[2] for row in rows)))
+
+    def _add_webgl_bars(self, fig: go.Figure, rows: List[tuple], line_width: int):
+        """
+        Draw horizontal bars as thick WebGL line segments, one trace per group
+
+        Args:
+            fig: Figure to add the traces to
+            rows: (group name, color, label, start, finish, hover text) per bar, in display order
+            line_width: Bar thickness in pixels
+        """
+        groups = {}
+        for name, color, label, start, finish, hover in rows:
+            xs, ys, texts = groups.setdefault((name, color), ([], [], []))
+            # None breaks the line between consecutive bars
+            xs.extend((start, finish, None))
+            ys.extend((label, label, None))
+            texts.extend((hover, hover, None))
+
+        shown = set()
+        for (name, color), (xs, ys, texts) in groups.items():
+            fig.add_trace(go.Scattergl(
+                x=xs,
+                y=ys,
+                mode='lines',
+                line=dict(color=color, width=line_width),
+                name=name,
+                legendgroup=name,
+                showlegend=name not in shown,
+                text=texts,
+                hovertemplate="%{text}<extra></extra>"
+            ))
+            shown.add(name)
+
+        # Keep rows in the given order rather than trace order
+        fig.update_yaxes(categoryorder='array',
+                         categoryarray=list(dict.fromkeys(row[2] for row in rows)))
+
 
 def create_schedule_gantt(schedule: Schedule, **kwargs) -> go.Figure:
     """
@@ -2,6 +2,7 @@
 Generate sample schedule data for testing
 """
 from datetime import datetime, timedelta
+from functools import lru_cache
 import sys
 import os
 
@@ -11,8 +12,35 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from src.utils.schedule_utils import Schedule, ScheduleActivity
 
 
+# Finish-to-start links without lag, shared by both sample schedules
+_SAMPLE_LINKS = (
+    ('A1000', 'A1010'),
+    ('A1010', 'A2000'),
+    ('A2000', 'A2010'),
+    ('A2010', 'A2020'),
+    ('A2020', 'A3000'),
+    ('A3000', 'A3010'),
+    ('A3010', 'A4000'),
+    ('A4000', 'A6000'),
+    ('A2020', 'A5000'),
+    ('A5000', 'A5010'),
+)
+
+
 def create_sample_baseline_schedule() -> Schedule:
     """Create a sample baseline schedule for testing"""
+    return _build_sample_baseline_schedule().clone()
+
+
+def create_sample_current_schedule() -> Schedule:
+    """Create a sample current schedule with delays for testing"""
+    return _build_sample_current_schedule().clone()
+
+
+# The samples are built once; callers get clones they are free to modify
+@lru_cache(maxsize=1)
+def _build_sample_baseline_schedule() -> Schedule:
+    """Build the sample baseline schedule"""
     schedule = Schedule(project_name="Sample Construction Project - Baseline")
 
     # Project dates
@@ -21,146 +49,47 @@ def create_sample_baseline_schedule() -> Schedule:
     schedule.data_date = datetime(2024, 1, 1)
 
     # Create sample activities
-    activities_data = [
-        {
-            'activity_id': 'A1000',
-            'name': 'Site Mobilization',
-            'duration': 5,
-            'start_date': datetime(2024, 1, 1),
-            'finish_date': datetime(2024, 1, 5),
-            'total_float': 0,
-            'is_critical': True
-        },
-        {
-            'activity_id': 'A1010',
-            'name': 'Site Survey and Layout',
-            'duration': 10,
-            'start_date': datetime(2024, 1, 8),
-            'finish_date': datetime(2024, 1, 19),
-            'total_float': 0,
-            'is_critical': True
-        },
-        {
-            'activity_id': 'A2000',
-            'name': 'Excavation',
-            'duration': 15,
-            'start_date': datetime(2024, 1, 22),
-            'finish_date': datetime(2024, 2, 9),
-            'total_float': 0,
-            'is_critical': True
-        },
-        {
-            'activity_id': 'A2010',
-            'name': 'Foundation Formwork',
-            'duration': 20,
-            'start_date': datetime(2024, 2, 12),
-            'finish_date': datetime(2024, 3, 8),
-            'total_float': 0,
-            'is_critical': True
-        },
-        {
-            'activity_id': 'A2020',
-            'name': 'Foundation Concrete',
-            'duration': 10,
-            'start_date': datetime(2024, 3, 11),
-            'finish_date': datetime(2024, 3, 22),
-            'total_float': 0,
-            'is_critical': True
-        },
-        {
-            'activity_id': 'A3000',
-            'name': 'Structural Steel Erection',
-            'duration': 30,
-            'start_date': datetime(2024, 3, 25),
-            'finish_date': datetime(2024, 5, 3),
-            'total_float': 0,
-            'is_critical': True
-        },
-        {
-            'activity_id': 'A3010',
-            'name': 'Roof Structure',
-            'duration': 15,
-            'start_date': datetime(2024, 5, 6),
-            'finish_date': datetime(2024, 5, 24),
-            'total_float': 0,
-            'is_critical': True
-        },
-        {
-            'activity_id': 'A4000',
-            'name': 'Exterior Cladding',
-            'duration': 20,
-            'start_date': datetime(2024, 5, 27),
-            'finish_date': datetime(2024, 6, 21),
-            'total_float': 0,
-            'is_critical': True
-        },
-        {
-            'activity_id': 'A5000',
-            'name': 'MEP Rough-in',
-            'duration': 25,
-            'start_date': datetime(2024, 4, 1),
-            'finish_date': datetime(2024, 5, 3),
-            'total_float': 10,
-            'is_critical': False
-        },
-        {
-            'activity_id': 'A5010',
-            'name': 'Interior Finishes',
-            'duration': 20,
-            'start_date': datetime(2024, 5, 20),
-            'finish_date': datetime(2024, 6, 14),
-            'total_float': 5,
-            'is_critical': False
-        },
-        {
-            'activity_id': 'A6000',
-            'name': 'Final Inspections',
-            'duration': 5,
-            'start_date': datetime(2024, 6, 24),
-            'finish_date': datetime(2024, 6, 28),
-            'total_float': 0,
-            'is_critical': True
-        }
-    ]
-
-    for act_data in activities_data:
-        activity = ScheduleActivity(
-            activity_id=act_data['activity_id'],
-            name=act_data['name'],
-            duration=act_data['duration'],
-            start_date=act_data['start_date'],
-            finish_date=act_data['finish_date'],
-            early_start=act_data['start_date'],
-            early_finish=act_data['finish_date'],
-            late_start=act_data['start_date'],
-            late_finish=act_data['finish_date'],
-            total_float=act_data['total_float'],
+    # (activity_id, name, duration, start, finish, total_float)
+    activities_data = (
+        ('A1000', 'Site Mobilization', 5, datetime(2024, 1, 1), datetime(2024, 1, 5), 0),
+        ('A1010', 'Site Survey and Layout', 10, datetime(2024, 1, 8), datetime(2024, 1, 19), 0),
+        ('A2000', 'Excavation', 15, datetime(2024, 1, 22), datetime(2024, 2, 9), 0),
+        ('A2010', 'Foundation Formwork', 20, datetime(2024, 2, 12), datetime(2024, 3, 8), 0),
+        ('A2020', 'Foundation Concrete', 10, datetime(2024, 3, 11), datetime(2024, 3, 22), 0),
+        ('A3000', 'Structural Steel Erection', 30, datetime(2024, 3, 25), datetime(2024, 5, 3), 0),
+        ('A3010', 'Roof Structure', 15, datetime(2024, 5, 6), datetime(2024, 5, 24), 0),
+        ('A4000', 'Exterior Cladding', 20, datetime(2024, 5, 27), datetime(2024, 6, 21), 0),
+        ('A5000', 'MEP Rough-in', 25, datetime(2024, 4, 1), datetime(2024, 5, 3), 10),
+        ('A5010', 'Interior Finishes', 20, datetime(2024, 5, 20), datetime(2024, 6, 14), 5),
+        ('A6000', 'Final Inspections', 5, datetime(2024, 6, 24), datetime(2024, 6, 28), 0),
+    )
+
+    schedule.add_activities(
+        ScheduleActivity(
+            activity_id=activity_id,
+            name=name,
+            duration=duration,
+            start_date=start,
+            finish_date=finish,
+            early_start=start,
+            early_finish=finish,
+            late_start=start,
+            late_finish=finish,
+            total_float=total_float,
             percent_complete=0
         )
-        schedule.add_activity(activity)
+        for activity_id, name, duration, start, finish, total_float in activities_data
+    )
 
     # Add relationships
-    relationships = [
-        ('A1000', 'A1010', 'FS', 0),
-        ('A1010', 'A2000', 'FS', 0),
-        ('A2000', 'A2010', 'FS', 0),
-        ('A2010', 'A2020', 'FS', 0),
-        ('A2020', 'A3000', 'FS', 0),
-        ('A3000', 'A3010', 'FS', 0),
-        ('A3010', 'A4000', 'FS', 0),
-        ('A4000', 'A6000', 'FS', 0),
-        ('A2020', 'A5000', 'FS', 0),
-        ('A5000', 'A5010', 'FS', 0),
-    ]
-
-    for pred, succ, rel_type, lag in relationships:
-        schedule.add_relationship(pred, succ, rel_type, lag)
+    schedule.add_relationships((pred, succ, 'FS', 0) for pred, succ in _SAMPLE_LINKS)
 
     return schedule
 
 
-def create_sample_current_schedule() -> Schedule:
-    """Create a sample current schedule with delays for testing"""
+@lru_cache(maxsize=1)
+def _build_sample_current_schedule() -> Schedule:
+    """Build the sample current schedule"""
     schedule = Schedule(project_name="Sample Construction Project - Current")
 
     # Project dates (delayed)
@@ -169,154 +98,60 @@ def create_sample_current_schedule() -> Schedule:
     schedule.data_date = datetime(2024, 4, 15)
 
     # Create sample activities with delays
-    activities_data = [
-        {
-            'activity_id': 'A1000',
-            'name': 'Site Mobilization',
-            'duration': 5,
-            'start_date': datetime(2024, 1, 1),
-            'finish_date': datetime(2024, 1, 5),
-            'actual_start': datetime(2024, 1, 1),
-            'actual_finish': datetime(2024, 1, 5),
-            'percent_complete': 100,
-            'total_float': 0
-        },
-        {
-            'activity_id': 'A1010',
-            'name': 'Site Survey and Layout',
-            'duration': 12,  # 2 days delayed
-            'start_date': datetime(2024, 1, 8),
-            'finish_date': datetime(2024, 1, 23),
-            'actual_start': datetime(2024, 1, 8),
-            'actual_finish': datetime(2024, 1, 23),
-            'percent_complete': 100,
-            'total_float': 0
-        },
-        {
-            'activity_id': 'A2000',
-            'name': 'Excavation',
-            'duration': 20,  # 5 days delayed due to weather
-            'start_date': datetime(2024, 1, 24),
-            'finish_date': datetime(2024, 2, 16),
-            'actual_start': datetime(2024, 1, 24),
-            'actual_finish': datetime(2024, 2, 16),
-            'percent_complete': 100,
-            'total_float': 0
-        },
-        {
-            'activity_id': 'A2010',
-            'name': 'Foundation Formwork',
-            'duration': 25,  # 5 days delayed
-            'start_date': datetime(2024, 2, 19),
-            'finish_date': datetime(2024, 3, 22),
-            'actual_start': datetime(2024, 2, 19),
-            'actual_finish': datetime(2024, 3, 22),
-            'percent_complete': 100,
-            'total_float': 0
-        },
-        {
-            'activity_id': 'A2020',
-            'name': 'Foundation Concrete',
-            'duration': 12,  # 2 days delayed
-            'start_date': datetime(2024, 3, 25),
-            'finish_date': datetime(2024, 4, 9),
-            'actual_start': datetime(2024, 3, 25),
-            'actual_finish': datetime(2024, 4, 9),
-            'percent_complete': 100,
-            'total_float': 0
-        },
-        {
-            'activity_id': 'A3000',
-            'name': 'Structural Steel Erection',
-            'duration': 35,  # 5 days delayed - material delay
-            'start_date': datetime(2024, 4, 10),
-            'finish_date': datetime(2024, 5, 24),
-            'actual_start': datetime(2024, 4, 10),
-            'percent_complete': 35,
-            'total_float': 0
-        },
-        {
-            'activity_id': 'A3010',
-            'name': 'Roof Structure',
-            'duration': 15,
-            'start_date': datetime(2024, 5, 27),
-            'finish_date': datetime(2024, 6, 14),
-            'percent_complete': 0,
-            'total_float': 0
-        },
-        {
-            'activity_id': 'A4000',
-            'name': 'Exterior Cladding',
-            'duration': 20,
-            'start_date': datetime(2024, 6, 17),
-            'finish_date': datetime(2024, 7, 12),
-            'percent_complete': 0,
-            'total_float': 0
-        },
-        {
-            'activity_id': 'A5000',
-            'name': 'MEP Rough-in',
-            'duration': 25,
-            'start_date': datetime(2024, 4, 15),
-            'finish_date': datetime(2024, 5, 17),
-            'actual_start': datetime(2024, 4, 15),
-            'percent_complete': 20,
-            'total_float': 8
-        },
-        {
-            'activity_id': 'A5010',
-            'name': 'Interior Finishes',
-            'duration': 20,
-            'start_date': datetime(2024, 6, 10),
-            'finish_date': datetime(2024, 7, 5),
-            'percent_complete': 0,
-            'total_float': 5
-        },
-        {
-            'activity_id': 'A6000',
-            'name': 'Final Inspections',
-            'duration': 5,
-            'start_date': datetime(2024, 7, 15),
-            'finish_date': datetime(2024, 7, 19),
-            'percent_complete': 0,
-            'total_float': 0
-        }
-    ]
-
-    for act_data in activities_data:
-        activity = ScheduleActivity(
-            activity_id=act_data['activity_id'],
-            name=act_data['name'],
-            duration=act_data['duration'],
-            start_date=act_data['start_date'],
-            finish_date=act_data['finish_date'],
-            actual_start=act_data.get('actual_start'),
-            actual_finish=act_data.get('actual_finish'),
-            early_start=act_data['start_date'],
-            early_finish=act_data['finish_date'],
-            late_start=act_data['start_date'],
-            late_finish=act_data['finish_date'],
-            total_float=act_data['total_float'],
-            percent_complete=act_data['percent_complete']
+    # (activity_id, name, duration, start, finish, actual_start, actual_finish,
+    #  percent_complete, total_float)
+    activities_data = (
+        ('A1000', 'Site Mobilization', 5, datetime(2024, 1, 1), datetime(2024, 1, 5),
+         datetime(2024, 1, 1), datetime(2024, 1, 5), 100, 0),
+        # 2 days delayed
+        ('A1010', 'Site Survey and Layout', 12, datetime(2024, 1, 8), datetime(2024, 1, 23),
+         datetime(2024, 1, 8), datetime(2024, 1, 23), 100, 0),
+        # 5 days delayed due to weather
+        ('A2000', 'Excavation', 20, datetime(2024, 1, 24), datetime(2024, 2, 16),
+         datetime(2024, 1, 24), datetime(2024, 2, 16), 100, 0),
+        # 5 days delayed
+        ('A2010', 'Foundation Formwork', 25, datetime(2024, 2, 19), datetime(2024, 3, 22),
+         datetime(2024, 2, 19), datetime(2024, 3, 22), 100, 0),
+        # 2 days delayed
+        ('A2020', 'Foundation Concrete', 12, datetime(2024, 3, 25), datetime(2024, 4, 9),
+         datetime(2024, 3, 25), datetime(2024, 4, 9), 100, 0),
+        # 5 days delayed - material delay
+        ('A3000', 'Structural Steel Erection', 35, datetime(2024, 4, 10), datetime(2024, 5, 24),
+         datetime(2024, 4, 10), None, 35, 0),
+        ('A3010', 'Roof Structure', 15, datetime(2024, 5, 27), datetime(2024, 6, 14),
+         None, None, 0, 0),
+        ('A4000', 'Exterior Cladding', 20, datetime(2024, 6, 17), datetime(2024, 7, 12),
+         None, None, 0, 0),
+        ('A5000', 'MEP Rough-in', 25, datetime(2024, 4, 15), datetime(2024, 5, 17),
+         datetime(2024, 4, 15), None, 20, 8),
+        ('A5010', 'Interior Finishes', 20, datetime(2024, 6, 10), datetime(2024, 7, 5),
+         None, None, 0, 5),
+        ('A6000', 'Final Inspections', 5, datetime(2024, 7, 15), datetime(2024, 7, 19),
+         None, None, 0, 0),
+    )
+
+    schedule.add_activities(
+        ScheduleActivity(
+            activity_id=activity_id,
+            name=name,
+            duration=duration,
+            start_date=start,
+            finish_date=finish,
+            actual_start=actual_start,
+            actual_finish=actual_finish,
+            early_start=start,
+            early_finish=finish,
+            late_start=start,
+            late_finish=finish,
+            total_float=total_float,
+            percent_complete=percent_complete
         )
-        schedule.add_activity(activity)
+        for (activity_id, name, duration, start, finish, actual_start, actual_finish,
+             percent_complete, total_float) in activities_data
+    )
 
     # Add relationships
-    relationships = [
-        ('A1000', 'A1010', 'FS', 0),
-        ('A1010', 'A2000', 'FS', 0),
-        ('A2000', 'A2010', 'FS', 0),
-        ('A2010', 'A2020', 'FS', 0),
-        ('A2020', 'A3000', 'FS', 0),
-        ('A3000', 'A3010', 'FS', 0),
-        ('A3010', 'A4000', 'FS', 0),
-        ('A4000', 'A6000', 'FS', 0),
-        ('A2020', 'A5000', 'FS', 0),
-        ('A5000', 'A5010', 'FS', 0),
-    ]
-
-    for pred, succ, rel_type, lag in relationships:
-        schedule.add_relationship(pred, succ, rel_type, lag)
+    schedule.add_relationships((pred, succ, 'FS', 0) for pred, succ in _SAMPLE_LINKS)
 
     return schedule
 
@@ -350,11 +185,11 @@ if __name__ == "__main__":
 
     print(f"\nTotal Delay: {result.total_delay_days:.1f} days")
     print(f"Critical Delay: {result.critical_delay_days:.1f} days")
-    print(f"Affected Activities: {len(result.delays_by_activity)}")
+    print(f"Affected Activities: {result.delay_count}")
 
     print("\nTop 5 Delayed Activities:")
-    sorted_delays = sorted(result.delays_by_activity,
-                          key=lambda x: x['delay_days'], reverse=True)[:5]
+    # As-Planned vs As-Built returns delays sorted, largest first
+    sorted_delays = result.delays_by_activity[:5]
     for i, delay in enumerate(sorted_delays, 1):
         print(f"  {i}. {delay['activity_name']}: {delay['delay_days']:.1f} days")
 